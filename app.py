@@ -1,17 +1,75 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
 from quantum_core.workflow import QuantumWorkflow
-from quantum_core.simulator import QuantumSimulator
-from quantum_core.ai_analysis import generate_ai_analysis
+from quantum_core.simulator import QuantumSimulator, RUN_OUTPUTS
+from quantum_core.ai_analysis import generate_ai_analysis, AnalysisService, ANALYSIS_FAILED_SUMMARY
+from quantum_core.cache import ResultCache, workflow_key
+from quantum_core.batch import iter_many, configure_pool
+from quantum_core.jobs import JobManager, JobQueueFull, InMemoryJobStore
+from quantum_core import backends, entanglement, metrics, startup
+from quantum_core.encoding import encode_vector, validate_options
 import time
 import psutil
 import os
-import traceback
 import numpy as np
+import json
 
 app = Flask(__name__)
 CORS(app)
 
+# Content-addressed cache for simulation results and AI analysis, bounded by entry
+# count, QVEDA_CACHE_MB of memory and QVEDA_CACHE_DISK_MB for the optional disk tier
+RESULT_CACHE = ResultCache(
+    max_entries=int(os.getenv("QVEDA_CACHE_SIZE", "256")),
+    ttl=float(os.getenv("QVEDA_CACHE_TTL", "3600")),
+    disk_dir=os.getenv("QVEDA_CACHE_DIR") or None,
+    max_bytes=int(float(os.getenv("QVEDA_CACHE_MB", "256")) * 2 ** 20),
+    max_disk_bytes=int(float(os.getenv("QVEDA_CACHE_DISK_MB", "1024")) * 2 ** 20),
+)
+
+# AI analysis runs in the background, keyed by circuit fingerprint
+ANALYSIS_SERVICE = AnalysisService(
+    cache=RESULT_CACHE,
+    max_workers=int(os.getenv("QVEDA_ANALYSIS_WORKERS", "4")),
+)
+ANALYSIS_MODES = ("deferred", "inline", "none")
+
+# one simulator per worker (Aer backends and noise models are shared through
+# quantum_core.backends), warmed up (Qiskit/Aer imported, backend created) so the
+# first request does not pay for it. QVEDA_WARMUP: "background" (default) | "sync" | "off"
+# QVEDA_CHECKPOINT_MB: budget for statevector prefix checkpoints, so a resubmitted
+# circuit resumes from its longest previously simulated prefix (0 disables)
+# QVEDA_SIM_THREADS: threads for the numpy engine's gate kernels (default: all CPUs)
+# QVEDA_MEMMAP_MB / QVEDA_MEMMAP_DIR: RAM budget and scratch directory (local disk)
+# of the out-of-core engine="memmap"
+SIMULATOR = QuantumSimulator(
+    checkpoint_bytes=int(float(os.getenv("QVEDA_CHECKPOINT_MB", "256")) * 2 ** 20),
+    threads=max(1, int(os.getenv("QVEDA_SIM_THREADS", str(os.cpu_count() or 1)))),
+    memmap_bytes=int(float(os.getenv("QVEDA_MEMMAP_MB", "1024")) * 2 ** 20),
+    memmap_dir=os.getenv("QVEDA_MEMMAP_DIR") or None,
+)
+WARMUP_MODE = os.getenv("QVEDA_WARMUP", "background")
+if WARMUP_MODE == "sync":
+    startup.warm_up(SIMULATOR)
+elif WARMUP_MODE == "background":
+    startup.warm_up_in_background(SIMULATOR)
+
+# size of the shared /simulate/batch process pool (default: all CPUs); a request's
+# "max_workers" only limits how many of its own items run at once
+if os.getenv("QVEDA_BATCH_WORKERS"):
+    configure_pool(int(os.getenv("QVEDA_BATCH_WORKERS")))
+
+# admission limits on workflow size, checked from the workflow's running stats
+# before simulating (unset or 0 = unlimited)
+MAX_OPS = int(os.getenv("QVEDA_MAX_GATES", "0"))
+MAX_DEPTH = int(os.getenv("QVEDA_MAX_DEPTH", "0"))
+
+# per-request peak allocation in the response and /metrics; opt-in (QVEDA_TRACE_MEMORY=1)
+# because tracemalloc slows every allocation. The peak is process-wide, so with
+# concurrent requests it includes the other requests' allocations.
+if os.getenv("QVEDA_TRACE_MEMORY", "0") != "0":
+    metrics.enable_memory_tracing()
+
 
 # helper: convert complex numbers to JSON-serializable dict
 def serialize_complex(obj):
@@ -24,148 +82,416 @@ def serialize_complex(obj):
     return obj
 
 
-def compute_entanglement(statevector, num_qubits):
+def check_admission(wf):
+    """Reject workflows over QVEDA_MAX_GATES operations or QVEDA_MAX_DEPTH layers."""
+    stats = wf.stats
+    if MAX_OPS and stats["num_ops"] > MAX_OPS:
+        raise ValueError(f"Workflow has {stats['num_ops']} operations (limit {MAX_OPS})")
+    if MAX_DEPTH and stats["depth"] > MAX_DEPTH:
+        raise ValueError(f"Workflow depth {stats['depth']} exceeds limit {MAX_DEPTH}")
+
+
+def _no_entanglement():
+    return {
+        "entropy": None,
+        "fidelity": None,
+        "bell_state": None,
+        "coherence_time": None,
+        "matrix": [],
+        "schmidt": []
+    }
+
+
+def compute_entanglement(statevector, num_qubits, bipartition=None):
+    if len(statevector) == 0:
+        return _no_entanglement()
     try:
-        vec = np.array([c["real"] + 1j * c["imag"]
-                       if isinstance(c, dict) else c for c in statevector])
-        vec = vec / np.linalg.norm(vec)
-
-        dimA = 2 ** (num_qubits // 2)
-        dimB = 2 ** (num_qubits - num_qubits // 2)
-        psi_matrix = vec.reshape(dimA, dimB)
-
-        # Schmidt coefficients
-        U, S, Vh = np.linalg.svd(psi_matrix)
-        schmidt_coeffs = (S / np.linalg.norm(S)).tolist()
-
-        # Entropy
-        probs = np.square(schmidt_coeffs)
-        entropy = -np.sum([p * np.log2(p) for p in probs if p > 1e-12])
-
-        # Fidelity with Bell states (if 2 qubits)
-        fidelity = None
-        bell_state = None
-        if num_qubits == 2:
-            bell_states = {
-                "phi_plus": np.array([1/np.sqrt(2), 0, 0, 1/np.sqrt(2)]),
-                "phi_minus": np.array([1/np.sqrt(2), 0, 0, -1/np.sqrt(2)]),
-                "psi_plus": np.array([0, 1/np.sqrt(2), 1/np.sqrt(2), 0]),
-                "psi_minus": np.array([0, 1/np.sqrt(2), -1/np.sqrt(2), 0]),
-            }
-            fids = {name: np.abs(np.vdot(b, vec)) ** 2 for name, b in bell_states.items()}
-            bell_state, fidelity = max(fids.items(), key=lambda x: x[1])
-
-        # Coherence time heuristic
-        coherence_time = 50 * entropy  # µs
-
-        # Reduced entanglement correlation matrix
-        rho = np.outer(vec, np.conj(vec))
-        matrix = rho.real[:num_qubits, :num_qubits].tolist()
-
-        return {
-            "entropy": float(entropy),
-            "fidelity": float(fidelity) if fidelity is not None else None,
-            "bell_state": bell_state,
-            "coherence_time": float(coherence_time),
-            "matrix": matrix,
-            "schmidt": schmidt_coeffs
-        }
+        return entanglement.compute_entanglement(statevector, num_qubits, bipartition)
     except Exception as e:
-        print("❌ Entanglement computation failed:", e)
-        return {
-            "entropy": None,
-            "fidelity": None,
-            "bell_state": None,
-            "coherence_time": None,
-            "matrix": [],
-            "schmidt": []
-        }
+        app.logger.debug("Entanglement computation failed: %s", e)
+        return _no_entanglement()
 
 
 @app.route("/simulate", methods=["POST"])
 def simulate():
     try:
         data = request.get_json(force=True)
-        print("🔎 Received JSON:", data)
+        return jsonify(run_simulation(data))
 
-        qubits = data.get("qubits")
-        gates = data.get("gates", [])
-        shots = data.get("shots", 1000)
+    except Exception as e:
+        app.logger.debug("Simulation error: %s", e, exc_info=True)
+        metrics.REQUESTS.inc(endpoint="simulate", status="error")
+        return jsonify({"error": str(e)}), 400
+
+
+def run_simulation(data, report=None):
+    """
+    Full /simulate pipeline for one request body; returns the response dict.
+    report: optional callback report(stage, partial) invoked as stages finish
+    (used by background jobs to expose partial results).
+    Optional body keys "format" ("json" | "base64"), "top_k" and "prob_threshold"
+    control how the statevector is encoded (see quantum_core.encoding);
+    "bipartition" (list of qubits) selects the cut used for the entanglement entropy;
+    "max_outcomes" caps the number of distinct outcomes in counts/probabilities;
+    "statevector": false skips the amplitudes and entanglement, which lets
+    Clifford-only circuits run on the stabilizer engine; with engine="memmap" they
+    are skipped (performance.statevector_omitted) when the state exceeds
+    QVEDA_MEMMAP_MB, and the result is never cached;
+    "amplitudes": true (the sampled outcomes) or a list of bitstrings returns
+    single amplitudes, read from the MPS without a dense state when engine="mps".
+    performance.stages holds per-stage times (ms) and performance.peak_allocation
+    the traced peak (bytes; None unless QVEDA_TRACE_MEMORY=1, approximate under
+    concurrent requests); both also feed /metrics.
+    """
+    with metrics.request_timer() as timer:
+        response = _simulation_pipeline(data, report)
+    performance = response["performance"]
+    performance["stages"] = timer.stages_ms()
+    performance["peak_allocation"] = timer.peak_allocation
+    metrics.observe_request("simulate", performance["engine"], data.get("qubits"), timer)
+    return response
+
+
+def _simulation_pipeline(data, report=None):
+    qubits = data.get("qubits")
+    gates = data.get("gates", [])
+    shots = data.get("shots", 1000)
+    engine = data.get("engine", "numpy")
+    noise = data.get("noise")
+    seed = data.get("seed")
+    max_outcomes = data.get("max_outcomes")
+    want_statevector = bool(data.get("statevector", True))
+    outputs = [o for o in RUN_OUTPUTS if want_statevector or o != "statevector"]
+    amplitudes = data.get("amplitudes")
+    basis_states = amplitudes if isinstance(amplitudes, list) else None
+    if amplitudes:
+        outputs.append("amplitudes")
+    # an out-of-core state larger than the memmap RAM budget is not returned
+    statevector_omitted = (engine == "memmap" and want_statevector and isinstance(qubits, int)
+                           and (16 << qubits) > SIMULATOR.memmap_engine.memory_bytes)
+    if statevector_omitted:
+        outputs.remove("statevector")
+    # response encoding: "json" or "base64", optionally truncated server-side
+    response_format = data.get("format", "json")
+    top_k = data.get("top_k")
+    prob_threshold = data.get("prob_threshold")
+    validate_options(response_format, top_k, prob_threshold)
 
-        # Build workflow
+    # Build workflow
+    with metrics.stage("workflow_build"):
         wf = QuantumWorkflow(num_qubits=qubits)
         wf.from_dict({"qubits": qubits, "gates": gates})
+        if data.get("optimize"):
+            wf = wf.optimize()
+        check_admission(wf)
+        cache_key = workflow_key(wf, shots=shots, noise=noise, seed=seed, engine=engine,
+                                 max_outcomes=max_outcomes, statevector=want_statevector,
+                                 amplitudes=amplitudes)
 
-        # Run simulation
-        sim = QuantumSimulator()
-
-        # measure sim time
-        start_time = time.perf_counter()
-        qasm_result = sim.run_qasm(wf, shots=shots)
-        statevector_result = sim.run_statevector(wf, shots=shots)
-        resources = sim.estimate_resources(wf)
-        end_time = time.perf_counter()
-        simulation_time = (end_time - start_time) * 1000  # ms
-
-        # memory usage
-        process = psutil.Process(os.getpid())
-        memory_usage = process.memory_info().rss / (1024 * 1024)  # MB
-
-        # efficiency
-        gate_counts = resources.get("gate_count", {})
-        total_gates = sum(gate_counts.values()) if gate_counts else 1
-        unique_gates = len(gate_counts)
-        efficiency = unique_gates / total_gates if total_gates > 0 else 0.0
-
-        # parallelization heuristic
-        depth = resources.get("depth", 1)
-        width = resources.get("width", 1)
-        parallelization = width / depth if depth > 0 else 1.0
-
-        # Entanglement
+    # measure sim time
+    start_time = time.perf_counter()
+    with metrics.stage("simulate"):
+        # memmap results hold scratch files and 2^n arrays, so they bypass the cache
+        use_cache = engine != "memmap"
+        result = RESULT_CACHE.get(f"simulate:{cache_key}") if use_cache else None
+        cache_status = ("hit" if result is not None else "miss") if use_cache else "bypass"
+        if result is None:
+            result = SIMULATOR.run(wf, shots=shots, outputs=outputs, noise=noise, engine=engine,
+                                   seed=seed, max_outcomes=max_outcomes, basis_states=basis_states)
+            if use_cache:
+                RESULT_CACHE.put(f"simulate:{cache_key}", result)
+    end_time = time.perf_counter()
+    simulation_time = (end_time - start_time) * 1000  # ms
+
+    resources = result["resources"]
+    qasm_result = {
+        "counts": result["counts"],
+        "probabilities": result["probabilities"],
+        "meta": result["meta"],
+    }
+    state = result.get("statevector")
+    if state is None:
+        # noisy runs produce a mixed state, which has no statevector (and it may not be requested)
+        state = np.zeros(0, dtype=complex)
+    elif isinstance(state, np.memmap):
+        # within the memmap budget: read it into RAM and release the scratch file
+        state = np.array(state)
+    statevector_result = {
+        "statevector": state,
+        "probabilities": np.abs(state) ** 2,
+        "meta": {"dim": len(state), "engine": result["meta"]["engine"]},
+    }
+
+    if report:
+        report("simulation", {
+            "counts": qasm_result["counts"],
+            "probabilities": qasm_result["probabilities"],
+        })
+
+    # memory usage
+    process = psutil.Process(os.getpid())
+    memory_usage = process.memory_info().rss / (1024 * 1024)  # MB
+
+    # efficiency
+    gate_counts = resources.get("gate_count", {})
+    total_gates = sum(gate_counts.values()) if gate_counts else 1
+    unique_gates = len(gate_counts)
+    efficiency = unique_gates / total_gates if total_gates > 0 else 0.0
+
+    # parallelization heuristic
+    depth = resources.get("depth", 1)
+    width = resources.get("width", 1)
+    parallelization = width / depth if depth > 0 else 1.0
+
+    # Entanglement
+    with metrics.stage("entanglement"):
         entanglement_result = compute_entanglement(
-            statevector_result.get("statevector", []), qubits
+            statevector_result.get("statevector", []), qubits, data.get("bipartition")
         )
 
-        # AI analysis
-        analysis = generate_ai_analysis(
-            qubits,
-            gates,
-            qasm_result,
-            statevector_result,
-            entanglement_result
-            )
-
+    if report:
+        report("entanglement", entanglement_result)
 
-        # Debug print to terminal
-        print("✅ QASM Result:", qasm_result)
-        print("✅ Statevector Result:", statevector_result)
-        print("✅ Resource Estimate:", resources)
+    # AI analysis: "deferred" (default) returns a handle to poll at /analysis/<id>,
+    # "inline" waits for it, "none" skips it
+    analysis_mode = data.get("analysis", "deferred")
+    if analysis_mode not in ANALYSIS_MODES:
+        raise ValueError(f"Unknown analysis mode: {analysis_mode}")
+    fingerprint = workflow_key(wf, noise=noise)
+    analysis_args = (qubits, gates, qasm_result, statevector_result, entanglement_result)
+    with metrics.stage("analysis"):
+        if analysis_mode == "none":
+            analysis = None
+        elif analysis_mode == "inline":
+            analysis = RESULT_CACHE.get(f"analysis:{fingerprint}")
+            if analysis is None:
+                analysis = generate_ai_analysis(*analysis_args)
+                if analysis.get("summary") != ANALYSIS_FAILED_SUMMARY:
+                    RESULT_CACHE.put(f"analysis:{fingerprint}", analysis)
+        else:
+            future = ANALYSIS_SERVICE.submit(fingerprint, *analysis_args)
+            if future.done():
+                analysis = future.result()
+            else:
+                analysis = {
+                    "status": "pending",
+                    "id": fingerprint,
+                    "summary": "AI analysis in progress…",
+                }
 
+    with metrics.stage("serialization"):
         response = {
             "counts": qasm_result.get("counts", {}),
             "probabilities": qasm_result.get("probabilities", {}),
-            "statevector": serialize_complex(statevector_result.get("statevector", [])),
+            "statevector": encode_vector(state, response_format, top_k, prob_threshold),
+            "amplitudes": serialize_complex(result.get("amplitudes")),
             "performance": {
                 **serialize_complex(resources),
                 "simulation_time": simulation_time,
                 "memory_usage": memory_usage,
                 "efficiency": efficiency,
                 "parallelization": parallelization,
+                "cache": cache_status,
+                "optimization": wf.meta.get("optimization"),
+                "engine": result["meta"]["engine"],
+                "checkpoint": result["meta"].get("checkpoint"),
+                "statevector_omitted": statevector_omitted,
             },
             "entanglement": entanglement_result,
             "analysis": analysis,
         }
 
-        print("📤 Final Response:", response)
+    return response
+
+
+@app.route("/simulate/sweep", methods=["POST"])
+def simulate_sweep():
+    """
+    Evaluate a workflow with symbolic RX/RY/RZ angles over a parameter grid.
+    Body: {"qubits": int, "gates": [...], "params": {"a": [..], ...}, "format"?: "json" | "base64",
+           "outputs": ["probabilities", "expectations"]}
+    """
+    try:
+        data = request.get_json(force=True)
+        qubits = data.get("qubits")
+        response_format = data.get("format", "json")
+        validate_options(response_format)
+        with metrics.request_timer() as timer:
+            with metrics.stage("workflow_build"):
+                wf = QuantumWorkflow(num_qubits=qubits)
+                wf.from_dict({"qubits": qubits, "gates": data.get("gates", [])})
 
+            start_time = time.perf_counter()
+            with metrics.stage("simulate"):
+                result = SIMULATOR.run_sweep(wf, data.get("params", {}),
+                                       outputs=data.get("outputs", ["probabilities"]))
+            simulation_time = (time.perf_counter() - start_time) * 1000  # ms
+
+            with metrics.stage("serialization"):
+                response = {k: encode_vector(v, response_format) if isinstance(v, np.ndarray) else v
+                            for k, v in result.items()}
+        response["meta"] = {
+            **result["meta"],
+            "simulation_time": simulation_time,
+            "stages": timer.stages_ms(),
+            "peak_allocation": timer.peak_allocation,
+        }
+        metrics.observe_request("sweep", result["meta"]["engine"], qubits, timer)
         return jsonify(response)
 
     except Exception as e:
-        print("❌ Error:", e)
-        traceback.print_exc()
+        app.logger.debug("Sweep error: %s", e, exc_info=True)
+        metrics.REQUESTS.inc(endpoint="sweep", status="error")
         return jsonify({"error": str(e)}), 400
 
 
+def _jsonable(obj):
+    """Convert NumPy arrays/scalars and complex numbers in a result to plain JSON types."""
+    if isinstance(obj, np.ndarray):
+        return serialize_complex(obj.tolist())
+    if isinstance(obj, np.generic):
+        return serialize_complex(obj.item())
+    if isinstance(obj, dict):
+        return {k: _jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_jsonable(v) for v in obj]
+    return serialize_complex(obj)
+
+
+@app.route("/simulate/batch", methods=["POST"])
+def simulate_batch():
+    """
+    Run many workflows across the worker pool.
+    Body: {"workflows": [{"id"?, "qubits", "gates", "shots"?, "noise"?, "seed"?}, ...],
+           "shots": int, "outputs": [...], "ordered": bool, "stream": bool}
+    With "stream": true the response is NDJSON, one line per workflow as it is ready.
+    """
+    try:
+        data = request.get_json(force=True)
+        workflows = data.get("workflows", [])
+        if not isinstance(workflows, list):
+            raise ValueError("'workflows' must be a list")
+        results = iter_many(
+            workflows,
+            shots=data.get("shots", 1000),
+            outputs=data.get("outputs", ["counts", "probabilities", "resources"]),
+            max_workers=int(data["max_workers"]) if data.get("max_workers") else None,
+            ordered=data.get("ordered", True),
+        )
+
+        if data.get("stream"):
+            lines = (json.dumps(_jsonable(entry)) + "\n" for entry in results)
+            return Response(lines, mimetype="application/x-ndjson")
+
+        entries = [_jsonable(entry) for entry in results]
+        return jsonify({
+            "results": entries,
+            "succeeded": sum(1 for e in entries if e["ok"]),
+            "failed": sum(1 for e in entries if not e["ok"]),
+        })
+
+    except Exception as e:
+        app.logger.debug("Batch error: %s", e, exc_info=True)
+        return jsonify({"error": str(e)}), 400
+
+
+def _job_manager():
+    """Background job manager, created on first use."""
+    global JOB_MANAGER
+    if JOB_MANAGER is None:
+        memory_mb = os.getenv("QVEDA_JOB_MEMORY_MB")
+        # finished jobs are kept for QVEDA_JOB_RETENTION_S seconds, at most QVEDA_JOB_RETENTION of them
+        store = InMemoryJobStore(
+            max_finished=int(os.getenv("QVEDA_JOB_RETENTION", "1000")),
+            finished_ttl=float(os.getenv("QVEDA_JOB_RETENTION_S", "3600")),
+        )
+        JOB_MANAGER = JobManager(
+            run_simulation,
+            store=store,
+            max_workers=int(os.getenv("QVEDA_JOB_WORKERS", "2")),
+            max_queue=int(os.getenv("QVEDA_JOB_QUEUE", "100")),
+            default_timeout=float(os.getenv("QVEDA_JOB_TIMEOUT", "300")),
+            memory_limit_mb=float(memory_mb) if memory_mb else None,
+        )
+    return JOB_MANAGER
+
+
+JOB_MANAGER = None
+
+
+@app.route("/jobs", methods=["POST"])
+def submit_job():
+    """
+    Queue a /simulate request body as a background job.
+    Optional keys: "priority" (higher runs first), "timeout" (seconds).
+    """
+    try:
+        data = request.get_json(force=True)
+        if not isinstance(data, dict) or data.get("qubits") is None:
+            raise ValueError("Missing 'qubits' key")
+        # jobs run in a child process, so the analysis is computed within the job
+        data.setdefault("analysis", "inline")
+        job_id = _job_manager().submit(
+            data,
+            priority=int(data.get("priority", 0)),
+            timeout=data.get("timeout"),
+        )
+        return jsonify({"id": job_id, "status": "queued"}), 202
+    except JobQueueFull as e:
+        return jsonify({"error": str(e)}), 503
+    except Exception as e:
+        app.logger.debug("Job submit error: %s", e)
+        return jsonify({"error": str(e)}), 400
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    job = _job_manager().get(job_id)
+    if job is None:
+        return jsonify({"error": "job not found"}), 404
+    return jsonify(job)
+
+
+@app.route("/jobs/<job_id>", methods=["DELETE"])
+def cancel_job(job_id):
+    job = _job_manager().cancel(job_id)
+    if job is None:
+        return jsonify({"error": "job not found"}), 404
+    return jsonify({"id": job_id, "status": job["status"]})
+
+
+@app.route("/analysis/<analysis_id>", methods=["GET"])
+def get_analysis(analysis_id):
+    """Poll a deferred analysis: 202 while pending, 200 when ready, 502 if it failed."""
+    status = ANALYSIS_SERVICE.status(analysis_id)
+    if status is None:
+        return jsonify({"error": "analysis not found"}), 404
+    if status["status"] == "pending":
+        return jsonify({"id": analysis_id, "status": "pending"}), 202
+    if status["status"] == "error":
+        return jsonify({"id": analysis_id, **status}), 502
+    return jsonify({"id": analysis_id, **status})
+
+
+@app.route("/metrics", methods=["GET"])
+def prometheus_metrics():
+    return Response(metrics.REGISTRY.render(), mimetype="text/plain; version=0.0.4")
+
+
+@app.route("/startup", methods=["GET"])
+def startup_info():
+    """Start-up report: warm-up step times (ms), readiness and loaded heavy modules."""
+    return jsonify(startup.startup_report())
+
+
+@app.route("/cache/stats", methods=["GET"])
+def cache_stats():
+    return jsonify({**RESULT_CACHE.stats(), "backends": backends.REGISTRY.stats()})
+
+
+startup.mark_ready()
+app.logger.debug("Startup: %s", startup.startup_report())
+
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=8000, debug=False)
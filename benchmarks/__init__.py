@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+"""Performance benchmarks for quantum_core (run with `python -m benchmarks.run`)."""
@@ -0,0 +1,99 @@
+# benchmarks/circuits.py
+"""
+Benchmark circuit families
+- Each generator returns a QuantumWorkflow built only from SUPPORTED_GATES,
+  measured on every qubit at the end.
+- Random families take a seed so the same workflow is generated on every commit.
+"""
+
+from typing import Callable, Dict
+import numpy as np
+
+from quantum_core.workflow import QuantumWorkflow
+
+
+def _measure_all(wf: QuantumWorkflow) -> QuantumWorkflow:
+    wf.add_gate("MEASURE", targets=list(range(wf.num_qubits)))
+    return wf
+
+
+def ghz(num_qubits: int, depth: int = 0, seed: int = 0) -> QuantumWorkflow:
+    """H on qubit 0 followed by a CX chain (depth is ignored)."""
+    wf = QuantumWorkflow(num_qubits)
+    wf.add_gate("H", targets=[0])
+    for q in range(1, num_qubits):
+        wf.add_gate("CX", targets=[q], controls=[q - 1])
+    return _measure_all(wf)
+
+
+def _controlled_phase(wf: QuantumWorkflow, theta: float, control: int, target: int):
+    """CP(theta) up to a global phase, from RZ and CX."""
+    wf.add_gate("RZ", targets=[control], params={"theta": theta / 2})
+    wf.add_gate("CX", targets=[target], controls=[control])
+    wf.add_gate("RZ", targets=[target], params={"theta": -theta / 2})
+    wf.add_gate("CX", targets=[target], controls=[control])
+    wf.add_gate("RZ", targets=[target], params={"theta": theta / 2})
+
+
+def qft(num_qubits: int, depth: int = 0, seed: int = 0) -> QuantumWorkflow:
+    """Quantum Fourier transform (without the final swaps) on a random basis state."""
+    rng = np.random.default_rng(seed)
+    wf = QuantumWorkflow(num_qubits)
+    for q in np.flatnonzero(rng.integers(0, 2, size=num_qubits)):
+        wf.add_gate("X", targets=[int(q)])
+    for j in reversed(range(num_qubits)):
+        wf.add_gate("H", targets=[j])
+        for k in reversed(range(j)):
+            _controlled_phase(wf, np.pi / 2 ** (j - k), k, j)
+    return _measure_all(wf)
+
+
+def random_clifford(num_qubits: int, depth: int = 10, seed: int = 0) -> QuantumWorkflow:
+    """`depth` layers of random H/S/X/Z on every qubit plus CX on random disjoint pairs."""
+    rng = np.random.default_rng(seed)
+    wf = QuantumWorkflow(num_qubits)
+    for _ in range(depth):
+        for q in range(num_qubits):
+            wf.add_gate(str(rng.choice(["H", "S", "X", "Z"])), targets=[q])
+        order = rng.permutation(num_qubits)
+        for c, t in zip(order[0::2], order[1::2]):
+            wf.add_gate("CX", targets=[int(t)], controls=[int(c)])
+    return _measure_all(wf)
+
+
+def random_rotation(num_qubits: int, depth: int = 10, seed: int = 0) -> QuantumWorkflow:
+    """`depth` layers of random RX/RY/RZ angles followed by a CX ladder."""
+    rng = np.random.default_rng(seed)
+    wf = QuantumWorkflow(num_qubits)
+    for _ in range(depth):
+        for q in range(num_qubits):
+            name = str(rng.choice(["RX", "RY", "RZ"]))
+            wf.add_gate(name, targets=[q], params={"theta": float(rng.uniform(0, 2 * np.pi))})
+        for q in range(num_qubits - 1):
+            wf.add_gate("CX", targets=[q + 1], controls=[q])
+    return _measure_all(wf)
+
+
+def toffoli_heavy(num_qubits: int, depth: int = 10, seed: int = 0) -> QuantumWorkflow:
+    """A layer of H, then `depth` layers of CCX on random triples with a T in between."""
+    if num_qubits < 3:
+        raise ValueError("toffoli_heavy needs at least 3 qubits")
+    rng = np.random.default_rng(seed)
+    wf = QuantumWorkflow(num_qubits)
+    for q in range(num_qubits):
+        wf.add_gate("H", targets=[q])
+    for _ in range(depth):
+        for _ in range(max(1, num_qubits // 3)):
+            a, b, c = (int(q) for q in rng.choice(num_qubits, size=3, replace=False))
+            wf.add_gate("CCX", targets=[c], controls=[a, b])
+            wf.add_gate("T", targets=[c])
+    return _measure_all(wf)
+
+
+FAMILIES: Dict[str, Callable[..., QuantumWorkflow]] = {
+    "ghz": ghz,
+    "qft": qft,
+    "random_clifford": random_clifford,
+    "random_rotation": random_rotation,
+    "toffoli_heavy": toffoli_heavy,
+}
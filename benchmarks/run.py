@@ -0,0 +1,233 @@
+# benchmarks/run.py
+"""
+Benchmark runner
+- Times QuantumSimulator modes, the QASM parsers and compute_entanglement over the
+  circuit families in benchmarks/circuits.py, for every qubit count x depth.
+- Each case records wall times over repeated runs and the tracemalloc peak of one
+  extra traced run (kept separate so tracing does not skew the timings).
+- --threads runs the numpy and memmap statevector modes once per thread count
+  and reports each count's speedup over the first; --memmap-mb sets the
+  memmap engine's RAM budget (small budgets force out-of-core blocking).
+- Results are written as JSON; --compare reports cases whose median time grew by
+  more than --threshold against an earlier results file (exit code 1 if any).
+
+Usage:
+    python -m benchmarks.run --qubits 4,8,12 --depths 10 --output bench.json
+    python -m benchmarks.run --output new.json --compare bench.json
+    python -m benchmarks.run --qubits 20,22 --modes statevector_numpy --threads 1,2,4
+"""
+
+from typing import Dict, Any, Callable, List, Optional
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from quantum_core.entanglement import compute_entanglement
+from quantum_core.parser_utils import QuantumParser, QasmStreamReader
+from quantum_core.simulator import QuantumSimulator
+
+from .circuits import FAMILIES
+
+NOISE = {"mode": "depolarizing", "p": 0.01}
+SHOTS = 1024
+
+
+def _qasm_source(wf) -> str:
+    from qiskit import qasm2
+    return qasm2.dumps(wf.to_qiskit())
+
+
+MODES = ("qasm", "statevector", "statevector_numpy", "statevector_memmap", "run", "noisy", "parser",
+         "qasm_stream", "entanglement")
+# modes timed once per --threads value
+THREADED_MODES = ("statevector_numpy", "statevector_memmap")
+
+
+def make_case(sim: QuantumSimulator, wf, mode: str) -> Callable[[], Any]:
+    """Zero-argument callable timing one mode; setup (QASM text, input state) is done here, untimed."""
+    if mode == "qasm":
+        return lambda: sim.run_qasm(wf, shots=SHOTS, seed=1)
+    if mode == "statevector":
+        return lambda: sim.run_statevector(wf)
+    if mode == "statevector_numpy":
+        return lambda: sim.run_statevector(wf, engine="numpy")
+    if mode == "statevector_memmap":
+        return lambda: sim.run_statevector(wf, engine="memmap")
+    if mode == "run":
+        return lambda: sim.run(wf, shots=SHOTS, seed=1)
+    if mode == "noisy":
+        return lambda: sim.run_qasm(wf, shots=SHOTS, noise=NOISE, seed=1)
+    if mode == "parser":
+        source = _qasm_source(wf)
+        return lambda: QuantumParser(source).parse()
+    if mode == "qasm_stream":
+        lines = _qasm_source(wf).splitlines(True)
+        return lambda: QasmStreamReader(lines).read()
+    if mode == "entanglement":
+        state, _ = sim.numpy_engine.simulate(wf)
+        return lambda: compute_entanglement(state, wf.num_qubits)
+    raise ValueError(f"Unknown benchmark mode: {mode}")
+
+
+def _peak_memory(fn) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(sim: QuantumSimulator, family: str, qubits: int, depth: int, mode: str,
+             repeat: int, seed: int = 0) -> Dict[str, Any]:
+    entry: Dict[str, Any] = {"family": family, "qubits": qubits, "depth": depth, "mode": mode,
+                             "threads": sim.numpy_engine.threads}
+    try:
+        wf = FAMILIES[family](qubits, depth, seed)
+        entry["gates"] = wf.stats["num_ops"]
+        fn = make_case(sim, wf, mode)
+        fn()  # warm-up
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+        entry.update({
+            "times": times,
+            "min": min(times),
+            "median": statistics.median(times),
+            "peak_memory_bytes": _peak_memory(fn),
+        })
+    except Exception as e:
+        entry["error"] = f"{type(e).__name__}: {e}"
+    return entry
+
+
+def _environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _case_key(entry: Dict[str, Any]):
+    # results written before --threads existed were single-threaded
+    return entry["family"], entry["qubits"], entry["depth"], entry["mode"], entry.get("threads", 1)
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.2,
+            min_delta: float = 1e-3) -> List[Dict[str, Any]]:
+    """
+    Cases present in both runs whose median grew by more than `threshold` (relative)
+    and `min_delta` seconds (absolute, to ignore noise on very fast cases).
+    """
+    old = {_case_key(e): e for e in baseline["results"] if "median" in e}
+    regressions = []
+    for entry in current["results"]:
+        prev = old.get(_case_key(entry))
+        if prev is None or "median" not in entry:
+            continue
+        ratio = entry["median"] / prev["median"] if prev["median"] > 0 else float("inf")
+        if ratio > 1 + threshold and entry["median"] - prev["median"] > min_delta:
+            regressions.append({**dict(zip(("family", "qubits", "depth", "mode", "threads"), _case_key(entry))),
+                                "baseline": prev["median"], "current": entry["median"], "ratio": ratio})
+    return regressions
+
+
+def _int_list(text: str) -> List[int]:
+    return [int(x) for x in text.split(",") if x]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Qveda simulator benchmarks")
+    parser.add_argument("--families", default=",".join(FAMILIES))
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--qubits", type=_int_list, default=[4, 8, 12])
+    parser.add_argument("--depths", type=_int_list, default=[10])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--threads", type=_int_list, default=[1],
+                        help="numpy engine thread counts to compare, e.g. 1,2,4 (default 1)")
+    parser.add_argument("--memmap-mb", type=float, default=1024,
+                        help="RAM budget of the memmap engine in MiB (default 1024)")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--compare", help="baseline results JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative slowdown that counts as a regression (default 0.2)")
+    args = parser.parse_args(argv)
+
+    families = [f for f in args.families.split(",") if f]
+    modes = [m for m in args.modes.split(",") if m]
+    for name in families:
+        if name not in FAMILIES:
+            parser.error(f"unknown family: {name}")
+    for name in modes:
+        if name not in MODES:
+            parser.error(f"unknown mode: {name}")
+    if not args.threads or min(args.threads) < 1:
+        parser.error("--threads must list counts >= 1")
+
+    memmap_bytes = int(args.memmap_mb * 2 ** 20)
+    sims = {t: QuantumSimulator(threads=t, memmap_bytes=memmap_bytes) for t in args.threads}
+    sim = sims[args.threads[0]]
+    results = []
+    for family in families:
+        for qubits in args.qubits:
+            # ghz and qft do not take a depth
+            depths = [0] if family in ("ghz", "qft") else args.depths
+            for depth in depths:
+                for mode in modes:
+                    counts = args.threads if mode in THREADED_MODES else args.threads[:1]
+                    base = None
+                    for threads in counts:
+                        entry = run_case(sims[threads], family, qubits, depth, mode, args.repeat, args.seed)
+                        results.append(entry)
+                        if "error" in entry:
+                            status = entry["error"]
+                        else:
+                            status = f"{entry['median'] * 1000:9.2f} ms  {entry['peak_memory_bytes'] / 2 ** 20:8.2f} MiB"
+                            if base is None:
+                                base = entry["median"]
+                            elif len(counts) > 1:
+                                entry["speedup"] = base / entry["median"] if entry["median"] > 0 else float("inf")
+                                status += f"  x{entry['speedup']:.2f}"
+                        print(f"{family:16s} q={qubits:<3d} d={depth:<3d} {mode:18s} t={threads:<3d} {status}",
+                              flush=True)
+
+    report = {"environment": _environment(), "results": results}
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = json.load(fh)
+        regressions = compare(baseline, report, threshold=args.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r['family']} q={r['qubits']} d={r['depth']} {r['mode']} t={r['threads']}: "
+                  f"{r['baseline'] * 1000:.2f} ms -> {r['current'] * 1000:.2f} ms (x{r['ratio']:.2f})")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
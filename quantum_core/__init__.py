@@ -1,3 +1,29 @@
-from .workflow import QuantumWorkflow
-from .simulator import QuantumSimulator
-from .parser_utils import QuantumParser
+# quantum_core/__init__.py
+"""
+quantum_core
+- The top-level names are resolved on first access (PEP 562 __getattr__), so
+  `import quantum_core` or importing one submodule does not load the others.
+"""
+
+from importlib import import_module
+
+_EXPORTS = {
+    "QuantumWorkflow": ".workflow",
+    "QuantumSimulator": ".simulator",
+    "QuantumParser": ".parser_utils",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,12 +1,22 @@
 # quantum_core/ai_analysis.py
 
 import os
-import google.generativeai as genai
 import re
 import json
+import time
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, Future
 
-# Configure Gemini once
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+import numpy as np
+
+# Summary used when the Gemini call itself fails (such results are not cached)
+ANALYSIS_FAILED_SUMMARY = "AI analysis failed."
+
+# Outcomes listed in the prompt; the rest of the distribution is summarized
+PROMPT_TOP_OUTCOMES = 8
+# Gate sequences longer than this are sent as counts only
+PROMPT_MAX_GATES = 40
 
 
 def _try_extract_json(ai_text: str):
@@ -27,18 +37,56 @@ def _try_extract_json(ai_text: str):
     return None
 
 
-def generate_ai_analysis(qubits, gates, qasm_result, statevector_result, entanglement_result):
+def summarize_results(qubits, gates, qasm_result, statevector_result, entanglement_result):
     """
-    Generate AI-powered analysis of the quantum circuit using Gemini.
+    Compact, size-bounded description of a run for the prompt: gate counts (and the
+    sequence for short circuits), top outcomes and distribution statistics, and the
+    scalar entanglement metrics. Raw amplitudes are never included, so the prompt
+    does not grow as 2^n.
     """
-    prompt = f"""
+    gate_counts = Counter(str(g.get("name", "")).upper() for g in gates)
+    summary = {
+        "qubits": qubits,
+        "num_gates": len(gates),
+        "gate_counts": dict(gate_counts),
+    }
+    if len(gates) <= PROMPT_MAX_GATES:
+        summary["gate_sequence"] = [
+            {k: g[k] for k in ("name", "targets", "controls", "params") if g.get(k)} for g in gates
+        ]
+
+    probs = (statevector_result or {}).get("probabilities")
+    probs = np.asarray(probs if probs is not None else [], dtype=float)
+    if probs.size:
+        top = np.argsort(probs)[::-1][:PROMPT_TOP_OUTCOMES]
+        summary["top_outcomes"] = {
+            format(int(i), f"0{qubits}b"): round(float(probs[i]), 4) for i in top if probs[i] > 1e-9
+        }
+        nonzero = probs[probs > 1e-12]
+        summary["nonzero_outcomes"] = int(nonzero.size)
+        summary["output_entropy_bits"] = round(float(-(nonzero * np.log2(nonzero)).sum()), 4)
+    else:
+        sampled = (qasm_result or {}).get("probabilities") or {}
+        ranked = sorted(sampled.items(), key=lambda kv: kv[1], reverse=True)
+        summary["top_outcomes"] = {k: round(v, 4) for k, v in ranked[:PROMPT_TOP_OUTCOMES]}
+        summary["nonzero_outcomes"] = len(sampled)
+
+    ent = entanglement_result or {}
+    summary["entanglement"] = {
+        k: ent.get(k) for k in ("entropy", "bell_state", "fidelity") if ent.get(k) is not None
+    }
+    schmidt = ent.get("schmidt") or []
+    if schmidt:
+        summary["entanglement"]["schmidt_rank"] = sum(1 for s in schmidt if s > 1e-9)
+    return summary
+
+
+def build_prompt(summary) -> str:
+    return f"""
     You are a quantum computing expert. Analyze this quantum circuit.
 
-    - Qubits: {qubits}
-    - Gates: {gates}
-    - QASM Result: {qasm_result}
-    - Statevector Result: {statevector_result}
-    - Entanglement Metrics: {entanglement_result}
+    Circuit and result summary (JSON):
+    {json.dumps(summary, default=str)}
 
     Provide a structured, concise and crisp JSON-like response the response of summary and insights should not be more than 100 words like 100-100 both:
     {{
@@ -52,12 +100,65 @@ def generate_ai_analysis(qubits, gates, qasm_result, statevector_result, entangl
     }}
     """
 
+
+class GeminiBackend:
+    """Calls Gemini over the network; the client is imported and configured on first use."""
+
+    def __init__(self, model: str = "gemini-2.5-flash"):
+        self.model = model
+
+    def generate(self, prompt: str, summary=None) -> str:
+        import google.generativeai as genai
+
+        genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+        response = genai.GenerativeModel(self.model).generate_content(prompt)
+        return response.text.strip()
+
+
+class StubBackend:
+    """Offline stand-in for load tests: deterministic JSON derived from the summary."""
+
+    def generate(self, prompt: str, summary=None) -> str:
+        summary = summary or {}
+        ent = summary.get("entanglement", {})
+        entangled = (ent.get("entropy") or 0) > 1e-6
+        return json.dumps({
+            "summary": f"{summary.get('qubits')}-qubit circuit with {summary.get('num_gates')} gates "
+                       f"and {summary.get('nonzero_outcomes')} observed outcomes.",
+            "details": ["Generated by the local stub analysis backend"],
+            "detected_pattern": ent.get("bell_state") or ("Entangled state" if entangled else "Product state"),
+            "confidence": 0.5,
+            "complexity_class": "BQP",
+            "applications": [],
+            "insights": [{"title": "Gate counts", "text": json.dumps(summary.get("gate_counts", {}))}],
+        })
+
+
+ANALYSIS_BACKENDS = {"gemini": GeminiBackend, "stub": StubBackend}
+
+
+def get_backend(name=None):
+    """Backend chosen by name or QVEDA_ANALYSIS_BACKEND ("gemini" default, "stub")."""
+    name = (name or os.getenv("QVEDA_ANALYSIS_BACKEND", "gemini")).lower()
     try:
-        model = genai.GenerativeModel("gemini-2.5-flash")
-        response = model.generate_content(prompt)
+        return ANALYSIS_BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown analysis backend: {name}") from None
+
+
+def generate_ai_analysis(qubits, gates, qasm_result, statevector_result, entanglement_result,
+                         backend=None):
+    """
+    Generate AI-powered analysis of the quantum circuit (Gemini by default).
+    """
+    summary = summarize_results(qubits, gates, qasm_result, statevector_result, entanglement_result)
+    prompt = build_prompt(summary)
+
+    try:
+        backend = backend or get_backend()
 
         # Raw AI text output
-        ai_text = response.text.strip()
+        ai_text = backend.generate(prompt, summary)
 
         # Try extracting JSON
         extracted = _try_extract_json(ai_text)
@@ -80,7 +181,7 @@ def generate_ai_analysis(qubits, gates, qasm_result, statevector_result, entangl
 
     except Exception as e:
         return {
-            "summary": "AI analysis failed.",
+            "summary": ANALYSIS_FAILED_SUMMARY,
             "details": [str(e)],
             "detected_pattern": "N/A",
             "confidence": 0.0,
@@ -88,3 +189,85 @@ def generate_ai_analysis(qubits, gates, qasm_result, statevector_result, entangl
             "applications": [],
             "insights": [],
         }
+
+
+class AnalysisService:
+    """
+    Runs analyses in a background thread pool, keyed by a circuit fingerprint.
+    - finished analyses are served from `cache` (a ResultCache-like get/put object);
+    - identical in-flight requests share one Future (request coalescing);
+    - every finished analysis stays readable by status() for `result_ttl` seconds,
+      so a poller sees failures as {"status": "error"} instead of "not found";
+    - failed analyses are not cached, so a later submit retries.
+    """
+
+    def __init__(self, cache=None, max_workers: int = 4, backend=None, result_ttl: float = 300.0):
+        self.cache = cache
+        self.backend = backend
+        self.result_ttl = result_ttl
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="qveda-analysis")
+        self._inflight = {}
+        # fingerprint -> (expires_at, status dict) for recently finished analyses
+        self._finished = {}
+        self._lock = threading.Lock()
+
+    def _cache_key(self, fingerprint):
+        return f"analysis:{fingerprint}"
+
+    def _prune(self, now):
+        for fingerprint in [f for f, (expires, _) in self._finished.items() if expires <= now]:
+            del self._finished[fingerprint]
+
+    def _run(self, fingerprint, args):
+        try:
+            analysis = generate_ai_analysis(*args, backend=self.backend)
+        except Exception as e:
+            analysis = {"summary": ANALYSIS_FAILED_SUMMARY, "details": [str(e)]}
+        failed = analysis.get("summary") == ANALYSIS_FAILED_SUMMARY
+        if self.cache is not None and not failed:
+            self.cache.put(self._cache_key(fingerprint), analysis)
+        now = time.monotonic()
+        with self._lock:
+            # record the outcome before dropping the future so status() never sees neither
+            self._prune(now)
+            self._finished[fingerprint] = (now + self.result_ttl, {
+                "status": "error" if failed else "ready", "analysis": analysis,
+            })
+            self._inflight.pop(fingerprint, None)
+        return analysis
+
+    def cached(self, fingerprint):
+        return self.cache.get(self._cache_key(fingerprint)) if self.cache is not None else None
+
+    def submit(self, fingerprint, qubits, gates, qasm_result, statevector_result, entanglement_result) -> Future:
+        """Return a Future for the analysis, reusing a cached or in-flight one."""
+        analysis = self.cached(fingerprint)
+        if analysis is not None:
+            done = Future()
+            done.set_result(analysis)
+            return done
+        with self._lock:
+            future = self._inflight.get(fingerprint)
+            if future is None:
+                self._finished.pop(fingerprint, None)
+                args = (qubits, gates, qasm_result, statevector_result, entanglement_result)
+                future = self._executor.submit(self._run, fingerprint, args)
+                self._inflight[fingerprint] = future
+            return future
+
+    def status(self, fingerprint):
+        """
+        {"status": "pending"}, {"status": "ready" | "error", "analysis": ...}, or None
+        if the fingerprint is unknown (or its failure expired).
+        """
+        with self._lock:
+            if fingerprint in self._inflight:
+                return {"status": "pending"}
+            self._prune(time.monotonic())
+            finished = self._finished.get(fingerprint)
+        if finished is not None:
+            return finished[1]
+        analysis = self.cached(fingerprint)
+        if analysis is None:
+            return None
+        return {"status": "ready", "analysis": analysis}
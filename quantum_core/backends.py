@@ -0,0 +1,129 @@
+# quantum_core/backends.py
+"""
+BackendRegistry
+- Process-wide, thread-safe store of Aer simulator instances (one per method)
+  and of noise models, so concurrent requests share them instead of rebuilding
+  them on every run.
+- Noise models are memoized by (mode, p, num_qubits) in a bounded LRU.
+- Shared objects are treated as read-only: run options (shots, seed, noise
+  model) are passed per call to backend.run, never set on the backend.
+- qiskit_aer is imported on first use.
+"""
+
+from typing import Dict, Any, Optional, Tuple
+from collections import OrderedDict
+import threading
+import warnings
+
+# Gates receiving an error per noise mode (trajectories.NOISY_GATES mirrors these)
+NOISE_GATES = {
+    "depolarizing": (["u1", "u2", "u3", "rx", "rz", "sx", "x", "h", "s", "t"], ["cx", "cz"]),
+    "bitflip": (["u1", "u2", "u3", "rx", "rz", "h", "x"], []),
+}
+
+
+def _aer_noise():
+    """qiskit_aer.noise, or None if Aer's noise tools are not available."""
+    try:
+        from qiskit_aer import noise
+        return noise
+    except Exception:
+        return None
+
+
+def build_noise_model(mode: str, p: float):
+    """A fresh Aer NoiseModel for a depolarizing/bitflip spec (None if unsupported)."""
+    if mode not in NOISE_GATES:
+        return None
+    aer_noise = _aer_noise()
+    if aer_noise is None:
+        warnings.warn("Aer noise tools not available; ignoring noise spec.")
+        return None
+    one_qubit, two_qubit = NOISE_GATES[mode]
+    nm = aer_noise.NoiseModel()
+    if mode == "depolarizing":
+        nm.add_all_qubit_quantum_error(aer_noise.depolarizing_error(p, 1), one_qubit)
+        nm.add_all_qubit_quantum_error(aer_noise.depolarizing_error(p, 2), two_qubit)
+    else:
+        nm.add_all_qubit_quantum_error(aer_noise.pauli_error([("X", p), ("I", 1 - p)]), one_qubit)
+    return nm
+
+
+class BackendRegistry:
+    def __init__(self, max_noise_models: int = 64):
+        """max_noise_models: LRU capacity of the noise-model memo."""
+        if max_noise_models <= 0:
+            raise ValueError("max_noise_models must be >= 1")
+        self.max_noise_models = max_noise_models
+        self._backends: Dict[str, Any] = {}
+        self._noise_models: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.backend_hits = self.backend_misses = 0
+        self.noise_hits = self.noise_misses = 0
+
+    def backend(self, method: str = "automatic"):
+        """The shared AerSimulator for `method` ("automatic", "density_matrix", ...)."""
+        with self._lock:
+            backend = self._backends.get(method)
+            if backend is not None:
+                self.backend_hits += 1
+                return backend
+            # built under the lock so concurrent first requests create one instance
+            try:
+                from qiskit_aer import AerSimulator
+                backend = AerSimulator() if method == "automatic" else AerSimulator(method=method)
+            except Exception as e:
+                raise RuntimeError("AerSimulator not available. Install qiskit-aer.") from e
+            self._backends[method] = backend
+            self.backend_misses += 1
+            return backend
+
+    def noise_model(self, noise_spec: Optional[Dict[str, Any]], num_qubits: int):
+        """
+        Memoized NoiseModel for noise_spec {"mode": "depolarizing"|"bitflip", "p": 0.01};
+        None when the spec is empty, "none", unsupported or Aer noise is unavailable.
+        """
+        if not noise_spec or noise_spec.get("mode", "none") == "none":
+            return None
+        key = (noise_spec.get("mode"), float(noise_spec.get("p", 0.0)), int(num_qubits))
+        with self._lock:
+            if key in self._noise_models:
+                self._noise_models.move_to_end(key)
+                self.noise_hits += 1
+                return self._noise_models[key]
+            model = build_noise_model(key[0], key[1])
+            if model is not None:
+                self._noise_models[key] = model
+                while len(self._noise_models) > self.max_noise_models:
+                    self._noise_models.popitem(last=False)
+            self.noise_misses += 1
+            return model
+
+    def clear(self):
+        with self._lock:
+            self._backends.clear()
+            self._noise_models.clear()
+            self.backend_hits = self.backend_misses = self.noise_hits = self.noise_misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backends": sorted(self._backends),
+                "backend_hits": self.backend_hits,
+                "backend_misses": self.backend_misses,
+                "noise_models": len(self._noise_models),
+                "noise_hits": self.noise_hits,
+                "noise_misses": self.noise_misses,
+                "max_noise_models": self.max_noise_models,
+            }
+
+
+REGISTRY = BackendRegistry()
+
+
+def get_backend(method: str = "automatic"):
+    return REGISTRY.backend(method)
+
+
+def get_noise_model(noise_spec: Optional[Dict[str, Any]], num_qubits: int):
+    return REGISTRY.noise_model(noise_spec, num_qubits)
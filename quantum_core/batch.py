@@ -0,0 +1,152 @@
+# quantum_core/batch.py
+"""
+Batch execution
+- Runs many small workflows across a shared ProcessPoolExecutor. Its size is
+  server configuration (configure_pool); callers can only limit how many of
+  their own items are in flight, never resize or shut down the shared pool.
+- Each worker process builds and warms up one QuantumSimulator at start-up
+  (see startup.warm_up) and reuses it.
+- Results come back in submission order (or as they finish), tagged with the
+  item's id and index; a failing item yields an error entry instead of
+  aborting the batch. A crashed worker breaks the whole pool: the items in
+  flight fail and the pool is rebuilt for the rest.
+"""
+
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+import os
+import threading
+
+from .startup import wait_for_warm_up
+from .workflow import QuantumWorkflow
+
+BATCH_OUTPUTS = ("counts", "probabilities", "resources")
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_size = 0  # 0 = os.cpu_count()
+_pool_lock = threading.Lock()
+
+# per-process simulator, created by _init_worker
+_worker_simulator = None
+
+
+def _init_worker():
+    global _worker_simulator
+    from .startup import warm_up
+    _worker_simulator = warm_up()
+
+
+def _run_item(index: int, item: Dict[str, Any], shots: int, outputs: List[str]) -> Dict[str, Any]:
+    """Worker entry point: simulate one workflow dict, never raising."""
+    item_id = item.get("id", index)
+    try:
+        wf = QuantumWorkflow(num_qubits=item.get("qubits"), meta=item.get("meta"))
+        wf.from_dict(item)
+        result = _worker_simulator.run(
+            wf,
+            shots=item.get("shots", shots),
+            outputs=outputs,
+            noise=item.get("noise"),
+            seed=item.get("seed"),
+        )
+        return {"id": item_id, "index": index, "ok": True, "result": result}
+    except Exception as e:
+        return {"id": item_id, "index": index, "ok": False, "error": f"{type(e).__name__}: {e}"}
+
+
+def configure_pool(max_workers: int):
+    """Set the shared pool's size (server configuration); used when the pool is next created."""
+    global _pool_size
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+    _pool_size = max_workers
+
+
+def pool_size() -> int:
+    return _pool_size or os.cpu_count() or 1
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Return the shared worker pool, creating it on first use or after it broke."""
+    global _pool
+    # workers are forked: never while a warm-up thread holds the import lock
+    wait_for_warm_up()
+    with _pool_lock:
+        if _pool is None or getattr(_pool, "_broken", False):
+            _pool = ProcessPoolExecutor(max_workers=pool_size(), initializer=_init_worker)
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool so the next get_pool() builds a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+            _pool = None
+
+
+def iter_many(workflows: Iterable[Any], shots: int = 1024,
+              outputs: Iterable[str] = BATCH_OUTPUTS,
+              max_workers: Optional[int] = None,
+              ordered: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Simulate workflows in the worker pool and yield one entry per workflow:
+    {"id", "index", "ok": True, "result": {...}} or {"id", "index", "ok": False, "error": str}.
+    workflows: QuantumWorkflow objects or to_dict()-style dicts (optionally with
+    "id", "shots", "noise", "seed").
+    max_workers: most items of this batch in flight at once (capped at the pool size).
+    ordered: yield in input order; otherwise as soon as each item finishes.
+    """
+    outputs = list(outputs)
+    limit = min(max_workers or pool_size(), pool_size())
+    if limit < 1:
+        raise ValueError("max_workers must be >= 1")
+    items = enumerate(workflows)
+    in_flight: "deque" = deque()
+
+    def submit_next() -> bool:
+        nxt = next(items, None)
+        if nxt is None:
+            return False
+        index, wf = nxt
+        item = wf.to_dict() if isinstance(wf, QuantumWorkflow) else dict(wf)
+        pool = get_pool()
+        in_flight.append((pool.submit(_run_item, index, item, shots, outputs), pool,
+                          index, item.get("id", index)))
+        return True
+
+    while len(in_flight) < limit and submit_next():
+        pass
+    while in_flight:
+        if ordered:
+            entry = in_flight.popleft()
+        else:
+            done, _ = wait([e[0] for e in in_flight], return_when=FIRST_COMPLETED)
+            entry = next(e for e in in_flight if e[0] in done)
+            in_flight.remove(entry)
+        yield _entry_result(*entry)
+        while len(in_flight) < limit and submit_next():
+            pass
+
+
+def _entry_result(future, pool: ProcessPoolExecutor, index: int, item_id) -> Dict[str, Any]:
+    try:
+        return future.result()
+    except BrokenProcessPool as e:
+        # a worker died (e.g. out of memory): the whole pool is unusable and every
+        # item in flight on it fails; later items go to a rebuilt pool
+        _discard_pool(pool)
+        return {"id": item_id, "index": index, "ok": False, "error": f"worker crashed: {e}"}
+    except Exception as e:
+        return {"id": item_id, "index": index, "ok": False, "error": f"{type(e).__name__}: {e}"}
@@ -0,0 +1,259 @@
+# quantum_core/cache.py
+"""
+ResultCache
+- Bounded LRU cache (entry count, byte budget + TTL) for simulation and AI
+  analysis results. Entry sizes are estimated from array nbytes (statevectors
+  dominate); an entry larger than the whole budget is not kept in memory.
+- Keys are canonical hashes of a workflow plus run options (shots, noise, seed...).
+- Optional on-disk tier (one pickle file per key) so entries survive a restart;
+  files past the TTL are removed and the directory is pruned oldest-first to
+  max_disk_bytes after each write.
+"""
+
+from typing import Dict, Any, Optional
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import pickle
+import sys
+import threading
+import time
+
+_GATE_ALIASES = {"CNOT": "CX"}
+
+
+def _canonical_param(value):
+    """Format numeric params so 1, 1.0 and 1.0000000000000002 hash the same."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return format(float(value), ".12g")
+    if isinstance(value, dict):
+        return {str(k): _canonical_param(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical_param(v) for v in value]
+    return value
+
+
+def canonical_workflow(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize a QuantumWorkflow.to_dict() payload for hashing.
+    Gate names are upper-cased (CNOT folded into CX), qubit lists become ints,
+    params are float-formatted and meta is dropped since it does not affect results.
+    """
+    gates = []
+    for g in data.get("gates", []):
+        name = str(g.get("name", "")).upper()
+        gates.append({
+            "name": _GATE_ALIASES.get(name, name),
+            "targets": [int(q) for q in g.get("targets") or []],
+            "controls": [int(q) for q in g.get("controls") or []],
+            "params": _canonical_param(g.get("params") or {}),
+        })
+    return {"qubits": int(data["qubits"]), "gates": gates}
+
+
+def workflow_key(wf, **options) -> str:
+    """
+    Return a SHA-256 hex digest identifying a workflow plus run options.
+    wf: QuantumWorkflow or its to_dict() payload.
+    options: anything that changes the result, e.g. shots, noise, seed.
+    """
+    data = wf.to_dict() if hasattr(wf, "to_dict") else wf
+    payload = {
+        "workflow": canonical_workflow(data),
+        "options": _canonical_param(options),
+    }
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate in-memory size of a cached value in bytes (arrays by nbytes)."""
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        if value and not isinstance(value[0], (dict, list, tuple)) and not hasattr(value[0], "nbytes"):
+            # flat list of scalars (e.g. a statevector as a list): size from the first element
+            return sys.getsizeof(value) + len(value) * sys.getsizeof(value[0])
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    def __init__(self, max_entries: int = 256, ttl: Optional[float] = 3600.0,
+                 disk_dir: Optional[str] = None, max_bytes: int = 256 * 2 ** 20,
+                 max_disk_bytes: int = 1024 * 2 ** 20):
+        """
+        max_entries: in-memory LRU capacity.
+        ttl: seconds an entry stays valid (None = never expires).
+        disk_dir: optional directory for the persistent tier.
+        max_bytes: in-memory byte budget (estimated with estimate_size).
+        max_disk_bytes: size limit of the disk tier's directory.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be >= 1")
+        if max_bytes <= 0 or max_disk_bytes <= 0:
+            raise ValueError("max_bytes and max_disk_bytes must be >= 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.disk_dir = disk_dir
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    def _disk_path(self, key: str) -> str:
+        safe = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.disk_dir, f"{safe}.pkl")
+
+    def _insert(self, key: str, stored_at: float, value: Any):
+        self._discard(key)
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (stored_at, value, size)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, _, old) = self._entries.popitem(last=False)
+            self._bytes -= old
+
+    def _discard(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def _load_from_disk(self, key: str):
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as fh:
+                stored_at, value = pickle.load(fh)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # corrupt or incompatible file: treat as a miss and drop it
+            self._remove_file(path)
+            return None
+        if self._expired(stored_at):
+            self._remove_file(path)
+            return None
+        return stored_at, value
+
+    @staticmethod
+    def _remove_file(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for key, or default on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._expired(entry[0]):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                self._discard(key)
+
+            if self.disk_dir:
+                entry = self._load_from_disk(key)
+                if entry is not None:
+                    self._insert(key, *entry)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return entry[1]
+
+            self.misses += 1
+            return default
+
+    def put(self, key: str, value: Any):
+        """Store value under key in memory and, if configured, on disk."""
+        stored_at = time.time()
+        with self._lock:
+            self._insert(key, stored_at, value)
+        if self.disk_dir:
+            path = self._disk_path(key)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp, "wb") as fh:
+                    pickle.dump((stored_at, value), fh, protocol=pickle.HIGHEST_PROTOCOL)
+                if os.path.getsize(tmp) > self.max_disk_bytes:
+                    self._remove_file(tmp)
+                    return
+                os.replace(tmp, path)
+            except Exception:
+                self._remove_file(tmp)
+                return
+            self.prune_disk()
+
+    def prune_disk(self):
+        """Remove expired cache files, then the oldest ones until the directory fits max_disk_bytes."""
+        if not self.disk_dir:
+            return
+        files = []
+        try:
+            with os.scandir(self.disk_dir) as it:
+                for item in it:
+                    if not item.name.endswith(".pkl"):
+                        continue
+                    try:
+                        st = item.stat()
+                    except OSError:
+                        continue
+                    files.append((st.st_mtime, st.st_size, item.path))
+        except OSError:
+            return
+        now = time.time()
+        total = 0
+        kept = []
+        for mtime, size, path in files:
+            if self.ttl is not None and now - mtime > self.ttl:
+                self._remove_file(path)
+            else:
+                kept.append((mtime, size, path))
+                total += size
+        kept.sort()
+        for _, size, path in kept:
+            if total <= self.max_disk_bytes:
+                break
+            self._remove_file(path)
+            total -= size
+
+    def clear(self):
+        """Drop all in-memory entries and reset counters (disk files are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.disk_hits = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "max_disk_bytes": self.max_disk_bytes,
+                "ttl": self.ttl,
+                "disk_dir": self.disk_dir,
+            }
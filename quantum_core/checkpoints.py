@@ -0,0 +1,156 @@
+# quantum_core/checkpoints.py
+"""
+Prefix checkpoints for the statevector engine
+- Intermediate states are cached under a rolling hash of the gate-list prefix
+  that produced them, so a resubmitted workflow that only appends or tweaks
+  gates at the end resumes from the longest cached prefix.
+- Prefix hashes of all gate rows are computed at once from the workflow's
+  arrays: each row is mixed into two independent 64-bit values, and the
+  polynomial prefix hashes come from cumulative sums/products (uint64 wraps
+  modulo 2^64). MEASURE rows are left out, since the engine skips them.
+- Stored states are read-only copies; eviction is least-recently-used under a
+  byte budget.
+"""
+
+from typing import Dict, Any, Optional, Tuple
+from collections import OrderedDict
+import hashlib
+import threading
+
+import numpy as np
+
+from .workflow import OPCODE_INDEX, QuantumWorkflow
+
+_U64 = np.uint64
+# multipliers of the two prefix hashes and their inverses modulo 2^64
+_BASES = (0x9E3779B97F4A7C15 | 1, 0xC2B2AE3D27D4EB4F | 1)
+_BASE_INVERSES = tuple(pow(b, -1, 1 << 64) for b in _BASES)
+
+
+def _mix(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer, elementwise on a uint64 array."""
+    x = x + _U64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> _U64(30))) * _U64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> _U64(27))) * _U64(0x94D049BB133111EB)
+    return x ^ (x >> _U64(31))
+
+
+def _column_weights(width: int, salt: int) -> np.ndarray:
+    """Per-column odd weights that do not depend on how wide the array is."""
+    return _mix(np.arange(width, dtype=_U64) + _U64(salt << 32)) | _U64(1)
+
+
+def _powers(base: int, count: int) -> np.ndarray:
+    """base^0 .. base^(count-1) modulo 2^64."""
+    out = np.full(count, base, dtype=_U64)
+    out[0] = 1
+    return np.cumprod(out, dtype=_U64)
+
+
+def prefix_keys(wf: QuantumWorkflow, dtype) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (rows, keys): rows are the indices of the non-MEASURE gate rows, and keys[p]
+    (shape (m + 1, 2)) identifies the state after the first p of them, for this
+    qubit count and dtype.
+    """
+    arrays = wf.gate_arrays()
+    rows = np.flatnonzero(arrays["opcode"] != OPCODE_INDEX["MEASURE"])
+    extra = wf.extra_params()
+    # the seed row makes keys specific to the qubit count and dtype
+    seed = int.from_bytes(hashlib.blake2b(f"{wf.num_qubits}:{np.dtype(dtype).str}".encode(),
+                                          digest_size=8).digest(), "little")
+    keys = np.empty((rows.size + 1, 2), dtype=_U64)
+    with np.errstate(over="ignore"):
+        opcode = arrays["opcode"][rows].astype(_U64)
+        targets = (arrays["targets"][rows].astype(np.int64) + 1).astype(_U64)  # -1 padding -> 0
+        controls = (arrays["controls"][rows].astype(np.int64) + 1).astype(_U64)
+        theta = np.ascontiguousarray(arrays["theta"][rows]).view(_U64)
+        extra_bits = np.zeros(rows.size, dtype=_U64)
+        if extra:
+            position = {int(r): i for i, r in enumerate(rows)}
+            for row, params in extra.items():
+                if row in position:
+                    digest = hashlib.blake2b(repr(sorted(params.items())).encode(), digest_size=8).digest()
+                    extra_bits[position[row]] = int.from_bytes(digest, "little")
+
+        for h, (base, inverse) in enumerate(zip(_BASES, _BASE_INVERSES)):
+            salt = 4 * h
+            values = (opcode * _column_weights(1, salt)[0]
+                      + (targets * _column_weights(targets.shape[1], salt + 1)).sum(axis=1, dtype=_U64)
+                      + (controls * _column_weights(controls.shape[1], salt + 2)).sum(axis=1, dtype=_U64)
+                      + _mix(theta ^ _U64(salt)) + _mix(extra_bits + _U64(salt + 3)))
+            sequence = np.concatenate([np.array([seed], dtype=_U64), _mix(values)])
+            # H_p = sum_{j<=p} x_j base^(p-j) = base^p * sum_{j<=p} x_j base^-j
+            forward = _powers(base, sequence.size)
+            backward = _powers(inverse, sequence.size)
+            keys[:, h] = forward * np.cumsum(sequence * backward, dtype=_U64)
+    return rows, keys
+
+
+class PrefixCheckpoints:
+    def __init__(self, max_bytes: int):
+        """max_bytes: memory budget for stored states (LRU eviction)."""
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be >= 1")
+        self.max_bytes = max_bytes
+        self._states: "OrderedDict[Tuple[int, int], np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.gates_skipped = 0
+
+    def longest_prefix(self, keys: np.ndarray) -> Tuple[int, Optional[np.ndarray]]:
+        """(p, state) for the longest prefix length p with a stored state; (0, None) if none."""
+        with self._lock:
+            if self._states:
+                stored = np.fromiter((k[0] for k in self._states), dtype=_U64, count=len(self._states))
+                for p in np.flatnonzero(np.isin(keys[1:, 0], stored))[::-1] + 1:
+                    key = (int(keys[p, 0]), int(keys[p, 1]))
+                    state = self._states.get(key)
+                    if state is not None:
+                        self._states.move_to_end(key)
+                        self.hits += 1
+                        self.gates_skipped += int(p)
+                        return int(p), state
+            self.misses += 1
+            return 0, None
+
+    def put(self, key: np.ndarray, state: np.ndarray):
+        """Store a read-only copy of `state` under a prefix key."""
+        if state.nbytes > self.max_bytes:
+            return
+        key = (int(key[0]), int(key[1]))
+        with self._lock:
+            if key in self._states:
+                self._states.move_to_end(key)
+                return
+        copy = state.copy()
+        copy.flags.writeable = False
+        with self._lock:
+            if key in self._states:
+                return
+            self._states[key] = copy
+            self._bytes += copy.nbytes
+            while self._bytes > self.max_bytes:
+                _, old = self._states.popitem(last=False)
+                self._bytes -= old.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._states.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.gates_skipped = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "gates_skipped": self.gates_skipped,
+                "entries": len(self._states),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
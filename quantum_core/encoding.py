@@ -0,0 +1,95 @@
+# quantum_core/encoding.py
+"""
+Response encoding
+- "json" (default): amplitudes as {"real", "imag"} dicts, probabilities as lists.
+- "base64": raw little-endian buffers (complex64 / float32) encoded straight from
+  the NumPy array, with dtype and shape, so no per-element Python objects are built.
+- Optional server-side truncation: keep the top_k largest amplitudes and/or those
+  with probability >= prob_threshold, returned as a sparse (indices, values) pair.
+"""
+
+from typing import Dict, Any, Optional
+import base64
+import numpy as np
+
+RESPONSE_FORMATS = ("json", "base64")
+
+
+def encode_array(arr: np.ndarray) -> Dict[str, Any]:
+    """Encode an array as base64; complex -> complex64, float -> float32, ints -> uint32/int64."""
+    arr = np.asarray(arr)
+    if np.iscomplexobj(arr):
+        arr = arr.astype("<c8", copy=False)
+    elif np.issubdtype(arr.dtype, np.floating):
+        arr = arr.astype("<f4", copy=False)
+    elif np.issubdtype(arr.dtype, np.integer):
+        fits = arr.size == 0 or (arr.min() >= 0 and arr.max() < 2 ** 32)
+        arr = arr.astype("<u4" if fits else "<i8", copy=False)
+    else:
+        raise ValueError(f"Cannot encode array of dtype {arr.dtype}")
+    return {
+        "encoding": "base64",
+        "dtype": arr.dtype.str,
+        "shape": list(arr.shape),
+        "data": base64.b64encode(np.ascontiguousarray(arr).data).decode("ascii"),
+    }
+
+
+def decode_array(payload: Dict[str, Any]) -> np.ndarray:
+    """Inverse of encode_array."""
+    buf = base64.b64decode(payload["data"])
+    return np.frombuffer(buf, dtype=np.dtype(payload["dtype"])).reshape(payload["shape"])
+
+
+def validate_options(fmt: str, top_k: Optional[int] = None, prob_threshold: Optional[float] = None):
+    """Raise ValueError for an unknown format or out-of-range truncation options."""
+    if fmt not in RESPONSE_FORMATS:
+        raise ValueError(f"Unknown response format: {fmt} (expected one of {RESPONSE_FORMATS})")
+    if top_k is not None and int(top_k) < 1:
+        raise ValueError("top_k must be >= 1")
+    if prob_threshold is not None and not 0.0 <= float(prob_threshold) <= 1.0:
+        raise ValueError("prob_threshold must be in [0, 1]")
+
+
+def select_indices(probs: np.ndarray, top_k: Optional[int] = None,
+                   prob_threshold: Optional[float] = None) -> np.ndarray:
+    """Sorted basis indices kept by the truncation options (all of them if none given)."""
+    probs = np.asarray(probs)
+    if prob_threshold is not None:
+        idx = np.flatnonzero(probs >= float(prob_threshold))
+    else:
+        idx = np.arange(probs.size)
+    if top_k is not None and idx.size > int(top_k):
+        part = np.argpartition(probs[idx], idx.size - int(top_k))[idx.size - int(top_k):]
+        idx = np.sort(idx[part])
+    return idx
+
+
+def _json_values(values: np.ndarray):
+    if np.iscomplexobj(values):
+        return [{"real": r, "imag": i} for r, i in zip(values.real.tolist(), values.imag.tolist())]
+    return values.tolist()
+
+
+def encode_vector(values: np.ndarray, fmt: str = "json", top_k: Optional[int] = None,
+                  prob_threshold: Optional[float] = None):
+    """
+    Encode a statevector (complex) or probability vector (real) for a response.
+    Without truncation the dense vector is returned (a list for "json", an
+    encode_array payload for "base64"). With top_k / prob_threshold the result is
+    {"dim", "indices", "values", "kept_probability"}.
+    """
+    validate_options(fmt, top_k, prob_threshold)
+    values = np.asarray(values)
+    encode = encode_array if fmt == "base64" else _json_values
+    if top_k is None and prob_threshold is None:
+        return encode(values)
+
+    probs = np.abs(values) ** 2 if np.iscomplexobj(values) else values
+    idx = select_indices(probs, top_k, prob_threshold)
+    return {
+        "dim": int(values.size),
+        "indices": encode_array(idx) if fmt == "base64" else idx.tolist(),
+        "values": encode(values[idx]),
+        "kept_probability": float(probs[idx].sum()),
+    }
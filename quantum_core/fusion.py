@@ -0,0 +1,101 @@
+# quantum_core/fusion.py
+"""
+Gate fusion
+- Greedily merges runs of primitive ops into dense unitaries on at most
+  `max_qubits` qubits, so the statevector is swept once per block instead of
+  once per gate.
+- Blocks containing a single op keep the op as-is so the engine can use its
+  cheaper in-place kernels (diagonal / controlled).
+"""
+
+from typing import Dict, Any, Iterable, List, Sequence, Tuple
+import numpy as np
+
+from .gates import gate_matrix
+
+Op = Tuple[str, Tuple[int, ...], Dict[str, Any]]
+
+
+def op_unitary(name: str, qubits: Sequence[int], params: Dict[str, Any]) -> np.ndarray:
+    """
+    Full 2^k x 2^k matrix of a primitive op on its own qubits.
+    qubits[0] is the most significant bit, so for controlled gates the target
+    matrix sits in the bottom-right 2x2 corner (all controls = 1).
+    """
+    u = gate_matrix(name, params)
+    dim = 2 ** len(qubits)
+    if dim == 2:
+        return u
+    full = np.eye(dim, dtype=complex)
+    full[-2:, -2:] = u
+    return full
+
+
+def apply_to_axes(tensor: np.ndarray, matrix: np.ndarray, axes: Sequence[int]) -> np.ndarray:
+    """
+    Contract a 2^k x 2^k matrix into the given axes of a tensor whose axes
+    all have length 2 (besides any untouched trailing ones).
+    axes[0] pairs with the most significant bit of the matrix index.
+    """
+    k = len(axes)
+    u = matrix.reshape((2,) * (2 * k))
+    out = np.tensordot(u, tensor, axes=(list(range(k, 2 * k)), list(axes)))
+    return np.moveaxis(out, list(range(k)), list(axes))
+
+
+class FusedBlock:
+    """A dense unitary on `qubits` (most significant first) built from `num_ops` ops."""
+    __slots__ = ("qubits", "matrix", "num_ops", "op")
+
+    def __init__(self, qubits: List[int], matrix: np.ndarray, num_ops: int, op: Op):
+        self.qubits = qubits
+        self.matrix = matrix
+        self.num_ops = num_ops
+        # the original op when the block holds exactly one
+        self.op = op
+
+
+def fuse_ops(ops: Iterable[Op], max_qubits: int = 2) -> Tuple[List[FusedBlock], Dict[str, Any]]:
+    """
+    Fuse consecutive ops into blocks acting on at most max_qubits qubits.
+    MEASURE ops are dropped (statevector semantics). Ops wider than max_qubits
+    form their own block. Returns (blocks, stats).
+    """
+    blocks: List[FusedBlock] = []
+    stats = {"max_qubits": max_qubits, "gates": 0, "blocks": 0, "fused_gates": 0, "largest_block": 0}
+    current = None
+
+    def flush():
+        if current is not None:
+            blocks.append(current)
+
+    for op in ops:
+        name, qubits, params = op
+        if name == "MEASURE":
+            continue
+        stats["gates"] += 1
+        if current is not None:
+            extra = [q for q in qubits if q not in current.qubits]
+            if len(current.qubits) + len(extra) > max_qubits:
+                flush()
+                current = None
+        if current is None:
+            current = FusedBlock(list(qubits), op_unitary(*op), 1, op)
+            continue
+
+        # widen the block with identities on new qubits (appended as low bits)
+        if extra:
+            current.matrix = np.kron(current.matrix, np.eye(2 ** len(extra), dtype=complex))
+            current.qubits.extend(extra)
+        m = len(current.qubits)
+        tensor = current.matrix.reshape((2,) * m + (2 ** m,))
+        axes = [current.qubits.index(q) for q in qubits]
+        current.matrix = apply_to_axes(tensor, op_unitary(*op), axes).reshape(2 ** m, 2 ** m)
+        current.num_ops += 1
+        current.op = None
+    flush()
+
+    stats["blocks"] = len(blocks)
+    stats["fused_gates"] = sum(b.num_ops for b in blocks if b.num_ops > 1)
+    stats["largest_block"] = max((len(b.qubits) for b in blocks), default=0)
+    return blocks, stats
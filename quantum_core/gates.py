@@ -0,0 +1,69 @@
+# quantum_core/gates.py
+"""
+Gate matrices
+- 2x2 unitaries for every gate in SUPPORTED_GATES, shared by the NumPy engines.
+- Controlled gates (CX, CCX) are described by the matrix applied to their target.
+- rotation_matrices builds a (batch, 2, 2) stack for vectorized parameter sweeps.
+"""
+
+from typing import Dict, Any, Optional
+import numpy as np
+
+_SQRT1_2 = 1 / np.sqrt(2)
+
+FIXED_GATES = {
+    "H": np.array([[_SQRT1_2, _SQRT1_2], [_SQRT1_2, -_SQRT1_2]], dtype=complex),
+    "X": np.array([[0, 1], [1, 0]], dtype=complex),
+    "Y": np.array([[0, -1j], [1j, 0]], dtype=complex),
+    "Z": np.array([[1, 0], [0, -1]], dtype=complex),
+    "S": np.array([[1, 0], [0, 1j]], dtype=complex),
+    "T": np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]], dtype=complex),
+}
+FIXED_GATES["CX"] = FIXED_GATES["X"]
+FIXED_GATES["CCX"] = FIXED_GATES["X"]
+
+ROTATION_GATES = {"RX", "RY", "RZ"}
+
+
+def rotation_matrix(name: str, theta: float) -> np.ndarray:
+    """Return the RX/RY/RZ matrix for angle theta (Qiskit conventions)."""
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    if name == "RX":
+        return np.array([[c, -1j * s], [-1j * s, c]], dtype=complex)
+    if name == "RY":
+        return np.array([[c, -s], [s, c]], dtype=complex)
+    if name == "RZ":
+        return np.array([[np.exp(-0.5j * theta), 0], [0, np.exp(0.5j * theta)]], dtype=complex)
+    raise ValueError(f"Not a rotation gate: {name}")
+
+
+def rotation_matrices(name: str, thetas: np.ndarray) -> np.ndarray:
+    """Vectorized rotation_matrix: returns a (len(thetas), 2, 2) stack."""
+    thetas = np.asarray(thetas, dtype=float)
+    c, s = np.cos(thetas / 2), np.sin(thetas / 2)
+    out = np.zeros((thetas.size, 2, 2), dtype=complex)
+    if name == "RX":
+        out[:, 0, 0] = out[:, 1, 1] = c
+        out[:, 0, 1] = out[:, 1, 0] = -1j * s
+    elif name == "RY":
+        out[:, 0, 0] = out[:, 1, 1] = c
+        out[:, 0, 1] = -s
+        out[:, 1, 0] = s
+    elif name == "RZ":
+        out[:, 0, 0] = np.exp(-0.5j * thetas)
+        out[:, 1, 1] = np.exp(0.5j * thetas)
+    else:
+        raise ValueError(f"Not a rotation gate: {name}")
+    return out
+
+
+def gate_matrix(name: str, params: Optional[Dict[str, Any]] = None) -> np.ndarray:
+    """
+    Return the 2x2 matrix applied to the target qubit of a primitive op.
+    """
+    if name in ROTATION_GATES:
+        return rotation_matrix(name, float((params or {}).get("theta", 0.0)))
+    try:
+        return FIXED_GATES[name]
+    except KeyError:
+        raise ValueError(f"No matrix for gate: {name}") from None
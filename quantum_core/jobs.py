@@ -0,0 +1,273 @@
+# quantum_core/jobs.py
+"""
+JobManager
+- Background execution of long simulations behind submit / poll / cancel.
+- A bounded pool of worker threads pulls jobs from a priority queue; each job
+  runs in its own child process so it can be killed on cancel or timeout and
+  capped in memory (RLIMIT_AS) without touching the server process.
+- Jobs report partial results per stage while running.
+- State lives in a JobStore; InMemoryJobStore is the in-process default and any
+  object with the same create/get/update methods can stand in for it.
+- InMemoryJobStore keeps at most max_finished finished jobs, each for at most
+  finished_ttl seconds after it finished; older ones are evicted on writes.
+"""
+
+from typing import Dict, Any, Callable, Optional
+from collections import OrderedDict
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import traceback
+import uuid
+
+from .startup import wait_for_warm_up
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED, TIMED_OUT = (
+    "queued", "running", "succeeded", "failed", "cancelled", "timed_out")
+FINISHED = {SUCCEEDED, FAILED, CANCELLED, TIMED_OUT}
+
+
+class JobQueueFull(RuntimeError):
+    """Raised by JobManager.submit when the queue is at capacity."""
+
+
+class InMemoryJobStore:
+    """Thread-safe dict-backed job records with bounded retention of finished jobs."""
+
+    def __init__(self, max_finished: int = 1000, finished_ttl: Optional[float] = 3600.0):
+        """
+        max_finished: finished jobs (and their results) kept, oldest evicted first.
+        finished_ttl: seconds a finished job is kept (None = until evicted by count).
+        """
+        if max_finished < 1:
+            raise ValueError("max_finished must be >= 1")
+        self.max_finished = max_finished
+        self.finished_ttl = finished_ttl
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        # finished job ids in order of completion -> finished_at
+        self._finished: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _evict(self):
+        now = time.time()
+        while self._finished:
+            job_id, finished_at = next(iter(self._finished.items()))
+            expired = self.finished_ttl is not None and now - finished_at > self.finished_ttl
+            if len(self._finished) <= self.max_finished and not expired:
+                break
+            self._finished.popitem(last=False)
+            self._jobs.pop(job_id, None)
+
+    def create(self, job: Dict[str, Any]):
+        with self._lock:
+            self._jobs[job["id"]] = job
+            self._evict()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a snapshot of the job record, or None."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return {**job, "partial": dict(job.get("partial", {}))}
+
+    def update(self, job_id: str, **fields):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+                if job.get("status") in FINISHED and job_id not in self._finished:
+                    self._finished[job_id] = job.get("finished_at") or time.time()
+                    self._evict()
+
+    def add_partial(self, job_id: str, stage: str, data: Any):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.setdefault("partial", {})[stage] = data
+
+
+def _address_space_bytes() -> int:
+    """Current virtual memory size of this process (Linux), else 0."""
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def _job_process(runner: Callable, payload: Dict[str, Any], conn, memory_limit: Optional[int]):
+    """Child-process entry point: apply the memory cap, run, send messages back."""
+    if memory_limit and resource is not None:
+        # the cap is relative to what the (forked) interpreter already maps
+        limit = _address_space_bytes() + memory_limit
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ValueError, OSError):
+            pass
+    try:
+        result = runner(payload, report=lambda stage, data: conn.send(("partial", stage, data)))
+        conn.send(("result", None, result))
+    except MemoryError:
+        conn.send(("error", None, "memory limit exceeded"))
+    except Exception as e:
+        traceback.print_exc()
+        conn.send(("error", None, f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+class JobManager:
+    def __init__(self, runner: Callable, store=None, max_workers: int = 2, max_queue: int = 100,
+                 default_timeout: float = 300.0, memory_limit_mb: Optional[float] = None,
+                 start_method: Optional[str] = None):
+        """
+        runner: runner(payload, report=callback) -> result; must be picklable for
+                non-fork start methods (i.e. a module-level function).
+        max_workers: jobs running concurrently; max_queue: jobs waiting.
+        default_timeout: seconds a job may run before it is killed.
+        memory_limit_mb: per-job address-space cap on top of the interpreter.
+        start_method: multiprocessing start method (default: fork where available).
+        """
+        self.runner = runner
+        self.store = store or InMemoryJobStore()
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.default_timeout = default_timeout
+        self.memory_limit = int(memory_limit_mb * 1024 * 1024) if memory_limit_mb else None
+        if start_method is None:
+            start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        self._ctx = multiprocessing.get_context(start_method)
+        self._queue: "queue.PriorityQueue" = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._cancel_requested = set()
+        self._lock = threading.Lock()
+        self._workers = []
+        self._stopping = threading.Event()
+
+    def _ensure_workers(self):
+        with self._lock:
+            while len(self._workers) < self.max_workers:
+                t = threading.Thread(target=self._worker_loop, name=f"qveda-job-{len(self._workers)}",
+                                     daemon=True)
+                t.start()
+                self._workers.append(t)
+
+    def submit(self, payload: Dict[str, Any], priority: int = 0,
+               timeout: Optional[float] = None) -> str:
+        """Queue a job and return its id. Higher priority runs first."""
+        if self._queue.qsize() >= self.max_queue:
+            raise JobQueueFull(f"job queue is full ({self.max_queue} waiting)")
+        job_id = uuid.uuid4().hex
+        self.store.create({
+            "id": job_id,
+            "status": QUEUED,
+            "priority": priority,
+            "timeout": timeout or self.default_timeout,
+            "submitted_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "partial": {},
+            "result": None,
+            "error": None,
+        })
+        self._queue.put((-priority, next(self._seq), job_id, payload))
+        self._ensure_workers()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return self.store.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Cancel a queued or running job; finished jobs are left unchanged."""
+        job = self.store.get(job_id)
+        if job is None:
+            return None
+        if job["status"] == QUEUED:
+            self.store.update(job_id, status=CANCELLED, finished_at=time.time())
+        elif job["status"] == RUNNING:
+            with self._lock:
+                self._cancel_requested.add(job_id)
+        return self.store.get(job_id)
+
+    def shutdown(self):
+        self._stopping.set()
+        for _ in self._workers:
+            self._queue.put((float("inf"), next(self._seq), None, None))
+
+    def _worker_loop(self):
+        while not self._stopping.is_set():
+            _, _, job_id, payload = self._queue.get()
+            if job_id is None:
+                return
+            job = self.store.get(job_id)
+            if job is None or job["status"] != QUEUED:
+                continue  # cancelled while waiting
+            try:
+                self._run_job(job, payload)
+            except Exception as e:
+                self.store.update(job_id, status=FAILED, error=f"{type(e).__name__}: {e}",
+                                  finished_at=time.time())
+
+    def _run_job(self, job: Dict[str, Any], payload: Dict[str, Any]):
+        job_id = job["id"]
+        if self._ctx.get_start_method() == "fork":
+            # a child forked mid-import (warm-up thread) would deadlock
+            wait_for_warm_up()
+        recv_conn, send_conn = self._ctx.Pipe(duplex=False)
+        proc = self._ctx.Process(target=_job_process,
+                                 args=(self.runner, payload, send_conn, self.memory_limit),
+                                 daemon=True)
+        started = time.time()
+        self.store.update(job_id, status=RUNNING, started_at=started)
+        proc.start()
+        send_conn.close()
+
+        status, result, error = None, None, None
+        deadline = started + job["timeout"]
+        while status is None:
+            if job_id in self._cancel_requested:
+                status = CANCELLED
+                break
+            if time.time() > deadline:
+                status, error = TIMED_OUT, f"exceeded {job['timeout']}s time limit"
+                break
+            try:
+                ready = recv_conn.poll(0.1)
+                message = recv_conn.recv() if ready else None
+            except EOFError:
+                proc.join(1)
+                status = FAILED
+                error = f"job process exited with code {proc.exitcode}"
+                if self.memory_limit:
+                    error += " (possibly memory limit exceeded)"
+                break
+            if message is None:
+                continue
+            kind, stage, data = message
+            if kind == "partial":
+                self.store.add_partial(job_id, stage, data)
+            elif kind == "result":
+                status, result = SUCCEEDED, data
+            else:
+                status, error = FAILED, data
+
+        if proc.is_alive():
+            if status in (CANCELLED, TIMED_OUT):
+                proc.terminate()
+            proc.join(5)
+            if proc.is_alive():
+                proc.kill()
+                proc.join()
+        recv_conn.close()
+        with self._lock:
+            self._cancel_requested.discard(job_id)
+        self.store.update(job_id, status=status, result=result, error=error, finished_at=time.time())
@@ -0,0 +1,192 @@
+# quantum_core/metrics.py
+"""
+Instrumentation
+- StageTimer: per-request wall time by stage. Stages may nest; each stage
+  reports exclusive time (nested stages are subtracted), so stages sum to the
+  total. Code anywhere below a request records into it with `stage(name)`,
+  which is a no-op when no request timer is active.
+- Peak allocation per request via tracemalloc (when tracing is enabled). The
+  peak is process-wide, so concurrent requests see each other's allocations.
+- A minimal Prometheus-style registry (counters and histograms with labels)
+  rendered in the text exposition format for a /metrics endpoint.
+"""
+
+from typing import Dict, Any, Optional, Sequence, Tuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+import bisect
+import threading
+import time
+import tracemalloc
+
+_current_timer: ContextVar[Optional["StageTimer"]] = ContextVar("qveda_stage_timer", default=None)
+
+
+class StageTimer:
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self._stack = []
+        self._started = time.perf_counter()
+        self.peak_allocation: Optional[int] = None
+
+    @contextmanager
+    def stage(self, name: str):
+        frame = [time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[0]
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed - frame[1]
+            if self._stack:
+                self._stack[-1][1] += elapsed
+
+    def total(self) -> float:
+        """Seconds since the timer was created."""
+        return time.perf_counter() - self._started
+
+    def stages_ms(self) -> Dict[str, float]:
+        return {k: v * 1000 for k, v in self.stages.items()}
+
+
+@contextmanager
+def stage(name: str):
+    """Time a stage of the active request, if any."""
+    timer = _current_timer.get()
+    if timer is None:
+        yield
+        return
+    with timer.stage(name):
+        yield
+
+
+def enable_memory_tracing(frames: int = 1):
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+
+
+@contextmanager
+def request_timer():
+    """Activate a StageTimer for the enclosed request; sets timer.peak_allocation (bytes)."""
+    timer = StageTimer()
+    token = _current_timer.set(timer)
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    try:
+        yield timer
+    finally:
+        if tracing:
+            timer.peak_allocation = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+        _current_timer.reset(token)
+
+
+def _format_labels(names: Sequence[str], values: Tuple, extra: str = "") -> str:
+    parts = [f'{k}="{str(v)}"' for k, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = tuple(str(labels.get(k, "")) for k in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {value}")
+        return lines
+
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BYTE_BUCKETS = tuple(float(2 ** k) for k in range(16, 34, 2))  # 64 KiB .. 8 GiB
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # per label set: [bucket counts..., +Inf count], sum
+        self._values: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(str(labels.get(k, "")) for k in self.labelnames)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._values[key] = (counts, total + value)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (counts, total) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    labels = _format_labels(self.labelnames, key, f'le="{le}"')
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {total}")
+                lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+
+    def counter(self, *args, **kwargs) -> Counter:
+        metric = Counter(*args, **kwargs)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, *args, **kwargs) -> Histogram:
+        metric = Histogram(*args, **kwargs)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+REQUESTS = REGISTRY.counter(
+    "qveda_requests_total", "Requests handled, by endpoint and outcome.", ("endpoint", "status"))
+REQUEST_LATENCY = REGISTRY.histogram(
+    "qveda_request_duration_seconds", "End-to-end request latency.", ("endpoint", "engine", "qubits"))
+STAGE_LATENCY = REGISTRY.histogram(
+    "qveda_stage_duration_seconds", "Exclusive time per pipeline stage.", ("stage", "engine", "qubits"))
+PEAK_ALLOCATION = REGISTRY.histogram(
+    "qveda_request_peak_allocation_bytes", "Peak traced allocation per request.", ("endpoint", "engine", "qubits"),
+    buckets=BYTE_BUCKETS)
+
+
+def observe_request(endpoint: str, engine: str, qubits: Any, timer: StageTimer):
+    """Record a finished request's latency, stage times and peak allocation."""
+    labels = {"engine": engine, "qubits": qubits}
+    REQUESTS.inc(endpoint=endpoint, status="ok")
+    REQUEST_LATENCY.observe(timer.total(), endpoint=endpoint, **labels)
+    for name, seconds in timer.stages.items():
+        STAGE_LATENCY.observe(seconds, stage=name, **labels)
+    if timer.peak_allocation is not None:
+        PEAK_ALLOCATION.observe(timer.peak_allocation, endpoint=endpoint, **labels)
@@ -0,0 +1,198 @@
+# quantum_core/mps.py
+"""
+MPSSimulator
+- Matrix-product-state engine for wide, low-entanglement workflows.
+- Site i holds qubit i as a (chi_left, 2, chi_right) tensor; two-qubit gates are
+  applied to neighbouring sites and split back with a truncated SVD
+  (max bond dimension + discarded-weight cutoff). Distant qubits are brought
+  together with SWAPs; CCX is decomposed into H/T/Tdg/CX.
+- Shots are sampled site by site and amplitudes are read by contracting a single
+  path, so the full 2^n vector is never formed.
+"""
+
+from typing import Dict, Any, Iterable, List, Optional, Sequence
+import numpy as np
+
+from .gates import gate_matrix, FIXED_GATES
+from .fusion import op_unitary
+from .sampling import count_bits, counts_to_probabilities, read_amplitudes
+from .workflow import QuantumWorkflow
+
+_SWAP = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]], dtype=complex)
+_TDG = FIXED_GATES["T"].conj().T
+
+
+def _toffoli_ops(a: int, b: int, c: int):
+    """Exact CCX(a, b -> c) decomposition into one- and two-qubit gates."""
+    t, tdg, h = FIXED_GATES["T"], _TDG, FIXED_GATES["H"]
+    return [
+        (h, (c,)), ("CX", (b, c)), (tdg, (c,)), ("CX", (a, c)), (t, (c,)),
+        ("CX", (b, c)), (tdg, (c,)), ("CX", (a, c)), (t, (b,)), (t, (c,)),
+        (h, (c,)), ("CX", (a, b)), (t, (a,)), (tdg, (b,)), ("CX", (a, b)),
+    ]
+
+
+class MatrixProductState:
+    def __init__(self, num_qubits: int, max_bond: int = 64, cutoff: float = 1e-12):
+        """
+        |0...0> as a product state (all bonds of dimension 1).
+        max_bond: largest bond dimension kept after each SVD.
+        cutoff: largest relative discarded weight (sum of dropped s^2) per SVD.
+        """
+        if max_bond < 1:
+            raise ValueError("max_bond must be >= 1")
+        self.num_qubits = num_qubits
+        self.max_bond = max_bond
+        self.cutoff = cutoff
+        zero = np.zeros((1, 2, 1), dtype=complex)
+        zero[0, 0, 0] = 1
+        self.tensors: List[np.ndarray] = [zero.copy() for _ in range(num_qubits)]
+        # all tensors left of `center` are left-orthonormal, all right of it right-orthonormal
+        self.center = 0
+        self.truncation_error = 0.0
+        self.max_bond_reached = 1
+
+    # --- canonical form -------------------------------------------------
+
+    def _move_center(self, site: int):
+        while self.center < site:
+            i = self.center
+            a, _, b = self.tensors[i].shape
+            q, r = np.linalg.qr(self.tensors[i].reshape(a * 2, b))
+            self.tensors[i] = q.reshape(a, 2, -1)
+            self.tensors[i + 1] = np.tensordot(r, self.tensors[i + 1], axes=(1, 0))
+            self.center += 1
+        while self.center > site:
+            i = self.center
+            a, _, b = self.tensors[i].shape
+            q, r = np.linalg.qr(self.tensors[i].reshape(a, 2 * b).T)
+            self.tensors[i] = q.T.reshape(-1, 2, b)
+            self.tensors[i - 1] = np.tensordot(self.tensors[i - 1], r.T, axes=(2, 0))
+            self.center -= 1
+
+    # --- gates ----------------------------------------------------------
+
+    def apply_1q(self, u: np.ndarray, qubit: int):
+        self.tensors[qubit] = np.einsum("ij,ajb->aib", u, self.tensors[qubit])
+
+    def _apply_adjacent(self, matrix: np.ndarray, site: int):
+        """Apply a 4x4 matrix to sites (site, site + 1), site being the MSB."""
+        self._move_center(site)
+        left, right = self.tensors[site], self.tensors[site + 1]
+        a, c = left.shape[0], right.shape[2]
+        theta = np.tensordot(left, right, axes=(2, 0)).reshape(a, 4, c)
+        theta = np.einsum("kl,alc->akc", matrix, theta).reshape(a * 2, 2 * c)
+
+        u, s, vh = np.linalg.svd(theta, full_matrices=False)
+        weights = s ** 2
+        total = weights.sum()
+        # smallest k whose discarded tail stays under the cutoff
+        tail = np.cumsum(weights[::-1])[::-1] / total
+        keep = int(np.count_nonzero(tail > self.cutoff)) or 1
+        keep = min(keep, self.max_bond)
+        discarded = float(weights[keep:].sum() / total)
+        self.truncation_error += discarded
+
+        s = s[:keep] / np.sqrt(weights[:keep].sum())
+        self.tensors[site] = u[:, :keep].reshape(a, 2, keep)
+        self.tensors[site + 1] = (s[:, None] * vh[:keep]).reshape(keep, 2, c)
+        self.center = site + 1
+        self.max_bond_reached = max(self.max_bond_reached, keep)
+
+    def apply_2q(self, matrix: np.ndarray, q0: int, q1: int):
+        """Apply a 4x4 matrix on (q0, q1), q0 being the MSB of the matrix index."""
+        if q0 > q1:
+            q0, q1 = q1, q0
+            matrix = matrix.reshape(2, 2, 2, 2).transpose(1, 0, 3, 2).reshape(4, 4)
+        # walk q1 down next to q0, apply, then walk it back
+        for site in range(q1 - 1, q0, -1):
+            self._apply_adjacent(_SWAP, site)
+        self._apply_adjacent(matrix, q0)
+        for site in range(q0 + 1, q1):
+            self._apply_adjacent(_SWAP, site)
+
+    def apply_op(self, name: str, qubits: Sequence[int], params: Dict[str, Any]):
+        if name == "MEASURE":
+            return
+        if name == "CCX":
+            for gate, qs in _toffoli_ops(*qubits):
+                if isinstance(gate, str):
+                    self.apply_2q(op_unitary(gate, qs, {}), *qs)
+                else:
+                    self.apply_1q(gate, qs[0])
+        elif len(qubits) == 2:
+            self.apply_2q(op_unitary(name, qubits, params), *qubits)
+        else:
+            self.apply_1q(gate_matrix(name, params), qubits[0])
+
+    # --- readout --------------------------------------------------------
+
+    def amplitude(self, index: int) -> complex:
+        """Amplitude of basis state `index` (qubit q = bit q), by contracting one path."""
+        v = np.ones(1, dtype=complex)
+        for q, tensor in enumerate(self.tensors):
+            v = v @ tensor[:, (index >> q) & 1, :]
+        return complex(v[0])
+
+    def sample(self, shots: int, seed: Optional[int] = None) -> np.ndarray:
+        """Draw `shots` outcomes of all qubits as a (shots, n) bool array."""
+        rng = np.random.default_rng(seed)
+        self._move_center(0)
+        bits = np.zeros((shots, self.num_qubits), dtype=bool)
+        v = np.ones((shots, 1), dtype=complex)
+        rows = np.arange(shots)
+        for q, tensor in enumerate(self.tensors):
+            # tensors right of q are right-orthonormal, so |w_b|^2 is the conditional weight
+            w = np.einsum("sa,abc->sbc", v, tensor)
+            p = np.sum(np.abs(w) ** 2, axis=2)
+            norm = p.sum(axis=1)
+            outcome = rng.random(shots) * norm > p[:, 0]
+            bits[:, q] = outcome
+            chosen = outcome.astype(np.intp)
+            v = w[rows, chosen] / np.sqrt(p[rows, chosen])[:, None]
+        return bits
+
+    def bond_dimensions(self) -> List[int]:
+        return [t.shape[2] for t in self.tensors[:-1]]
+
+
+class MPSSimulator:
+    def __init__(self, max_bond: int = 64, cutoff: float = 1e-12):
+        self.max_bond = max_bond
+        self.cutoff = cutoff
+
+    def simulate(self, wf: QuantumWorkflow) -> MatrixProductState:
+        """Apply all gates of the workflow (measurements skipped) to |0...0>."""
+        mps = MatrixProductState(wf.num_qubits, self.max_bond, self.cutoff)
+        for name, qubits, params in wf.ops():
+            mps.apply_op(name, qubits, params)
+        return mps
+
+    def run(self, wf: QuantumWorkflow, shots: int = 1024,
+            seed: Optional[int] = None, max_outcomes: Optional[int] = None,
+            amplitudes: bool = False, basis_states: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Simulate and sample a workflow with terminal measurements.
+        Returns counts and probabilities in run_qasm format plus MPS meta.
+        amplitudes: also return {bitstring: amplitude} for basis_states (default:
+        the sampled outcomes), each read by contracting one path.
+        """
+        if wf.has_mid_circuit_measurement():
+            raise ValueError("MPS engine requires terminal measurements only")
+        mps = self.simulate(wf)
+        counts = count_bits(mps.sample, shots, wf.num_qubits, wf.measured_qubits(),
+                            seed=seed, max_outcomes=max_outcomes)
+        result = {
+            "counts": counts,
+            "probabilities": counts_to_probabilities(counts, shots),
+            "meta": {
+                "max_bond": self.max_bond,
+                "cutoff": self.cutoff,
+                "max_bond_reached": mps.max_bond_reached,
+                "truncation_error": mps.truncation_error,
+            },
+        }
+        if amplitudes:
+            result["amplitudes"] = read_amplitudes(
+                mps.amplitude, counts if basis_states is None else basis_states, wf.num_qubits)
+        return result
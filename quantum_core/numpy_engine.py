@@ -0,0 +1,303 @@
+# quantum_core/numpy_engine.py
+"""
+NumpyStatevectorEngine
+- Applies QuantumWorkflow gates directly to a NumPy amplitude array.
+- No Qiskit objects are built on the simulation path.
+- Runs of gates are fused into dense k-qubit blocks (see fusion.py) so each
+  block costs one sweep over the amplitudes instead of one per gate.
+- Uses Qiskit's little-endian ordering: qubit q is bit q of the basis index,
+  so in the (2,)*n tensor view qubit q lives on axis n - 1 - q.
+- With a checkpoint budget, intermediate states are kept under prefix hashes
+  (see checkpoints.py) and a workflow resumes from its longest cached prefix.
+- With threads > 1, each gate on a large state is split into independent
+  chunks along the largest axis the gate does not touch (the high bits for a
+  low target, the low bits for a high target) and the chunks run on a thread
+  pool; NumPy's in-place ufuncs and BLAS release the GIL on large arrays.
+  A forked child (e.g. a /jobs worker) inherits the pool object but not its
+  threads, so the pool is owned by the process that created it and rebuilt
+  in any other.
+"""
+
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
+
+import numpy as np
+
+from .checkpoints import PrefixCheckpoints, prefix_keys
+from .gates import gate_matrix
+from .fusion import fuse_ops, apply_to_axes, FusedBlock
+from .workflow import QuantumWorkflow
+
+
+def zero_state(num_qubits: int, dtype=np.complex128) -> np.ndarray:
+    """Return the |0...0> amplitude array."""
+    state = np.zeros(2 ** num_qubits, dtype=dtype)
+    state[0] = 1
+    return state
+
+
+def _mix_rows(a0: np.ndarray, a1: np.ndarray, u00, u01, u10, u11) -> None:
+    """(a0, a1) <- (u00 a0 + u01 a1, u10 a0 + u11 a1) in place, one temporary copy."""
+    old0 = a0.copy()
+    a0 *= u00
+    a0 += u01 * a1
+    a1 *= u11
+    a1 += u10 * old0
+
+
+def qubit_view(states: np.ndarray, qubits: Sequence[int], num_qubits: int):
+    """
+    Reshape a (batch, 2^n) array into (batch, A, 2, B, 2, ..., C), splitting out
+    only the given qubits so views stay low-dimensional.
+    Returns (view, {qubit: axis}).
+    """
+    shape = [states.shape[0]]
+    axes = {}
+    upper = num_qubits
+    for q in sorted(set(qubits), reverse=True):
+        shape.append(2 ** (upper - q - 1))
+        axes[q] = len(shape)
+        shape.append(2)
+        upper = q
+    shape.append(2 ** upper)
+    return states.reshape(shape), axes
+
+
+def controlled_pair(states: np.ndarray, controls: Sequence[int], target: int, num_qubits: int):
+    """
+    (view, lo, hi, axes) for a controlled single-qubit gate: psi[lo] / psi[hi] select
+    the target-0 / target-1 amplitudes with all controls set; `axes` are the view
+    axes of the controls and target.
+    """
+    psi, axes = qubit_view(states, tuple(controls) + (target,), num_qubits)
+    # length-1 slices (rather than integers) keep every selection a view
+    index = [slice(None)] * psi.ndim
+    for c in controls:
+        index[axes[c]] = slice(1, 2)
+    lo, hi = list(index), list(index)
+    lo[axes[target]], hi[axes[target]] = slice(0, 1), slice(1, 2)
+    return psi, tuple(lo), tuple(hi), set(axes.values())
+
+
+def mix_pair(psi: np.ndarray, lo: Tuple, hi: Tuple, u: np.ndarray) -> None:
+    """Apply one shared 2x2 matrix to the (psi[lo], psi[hi]) amplitude pairs in place."""
+    if u[0, 1] == 0 and u[1, 0] == 0:
+        # diagonal gates (Z, S, T, RZ) only rescale amplitudes
+        if u[0, 0] != 1:
+            psi[lo] *= u[0, 0]
+        if u[1, 1] != 1:
+            psi[hi] *= u[1, 1]
+        return
+    _mix_rows(psi[lo], psi[hi], u[0, 0], u[0, 1], u[1, 0], u[1, 1])
+
+
+def apply_controlled_1q_batch(states: np.ndarray, u: np.ndarray, controls: Sequence[int],
+                              target: int, num_qubits: int) -> None:
+    """
+    Apply the 2x2 matrix u to `target` of every row of a (batch, 2^n) array,
+    conditioned on all `controls` being 1. Works in place on strided views.
+    u is either one shared 2x2 matrix or a (batch, 2, 2) stack, one per row.
+    """
+    psi, lo, hi, _ = controlled_pair(states, controls, target, num_qubits)
+    if u.ndim == 3:
+        # per-row coefficients broadcast over the remaining axes
+        u = u.reshape((states.shape[0], 2, 2) + (1,) * (psi.ndim - 1))
+        _mix_rows(psi[lo], psi[hi], u[:, 0, 0], u[:, 0, 1], u[:, 1, 0], u[:, 1, 1])
+        return
+    mix_pair(psi, lo, hi, u)
+
+
+def apply_controlled_1q(state: np.ndarray, u: np.ndarray, controls: Sequence[int],
+                        target: int, num_qubits: int) -> None:
+    """Single-state apply_controlled_1q_batch on a flat 2^n amplitude array, in place."""
+    apply_controlled_1q_batch(state.reshape(1, -1), u, controls, target, num_qubits)
+
+
+def apply_matrix(state: np.ndarray, matrix: np.ndarray, qubits: Sequence[int],
+                 num_qubits: int) -> np.ndarray:
+    """
+    Apply a dense 2^k x 2^k matrix to `qubits` (qubits[0] = most significant
+    bit of the matrix index). Returns a new amplitude array.
+    """
+    psi = state.reshape((2,) * num_qubits)
+    psi = apply_to_axes(psi, matrix, [num_qubits - 1 - q for q in qubits])
+    return np.ascontiguousarray(psi).reshape(-1)
+
+
+# amplitudes per chunk below which a gate stays on the calling thread
+PARALLEL_MIN_CHUNK = 1 << 16
+
+
+def chunk_indices(psi: np.ndarray, used_axes, parts: int) -> Optional[List[Tuple]]:
+    """
+    Split a qubit_view into at most `parts` index tuples along the largest axis
+    not in used_axes (never the batch axis); None if it is not worth splitting.
+    """
+    free = [a for a in range(1, psi.ndim) if a not in used_axes]
+    if not free:
+        return None
+    axis = max(free, key=lambda a: psi.shape[a])
+    parts = min(parts, psi.shape[axis], psi.size // PARALLEL_MIN_CHUNK)
+    if parts < 2:
+        return None
+    bounds = np.linspace(0, psi.shape[axis], parts + 1).astype(int).tolist()
+    head = (slice(None),) * axis
+    return [head + (slice(a, b),) for a, b in zip(bounds[:-1], bounds[1:])]
+
+
+# checkpoints are saved this many gates before the end (0 = the final state),
+# so appending gates and editing the last ones both find a cached prefix
+CHECKPOINT_OFFSETS = (0, 1, 16)
+
+
+def _merge_fusion(total: Dict[str, Any], part: Dict[str, Any]) -> Dict[str, Any]:
+    """Combine fuse_ops stats of consecutive segments."""
+    if not total:
+        return dict(part)
+    merged = dict(total)
+    for key in ("gates", "blocks", "fused_gates"):
+        merged[key] += part[key]
+    merged["largest_block"] = max(total["largest_block"], part["largest_block"])
+    return merged
+
+
+class NumpyStatevectorEngine:
+    def __init__(self, dtype=np.complex128, fusion_max_qubits: int = 4, checkpoint_bytes: int = 0,
+                 checkpoint_offsets: Sequence[int] = CHECKPOINT_OFFSETS, threads: int = 1):
+        """
+        Pure NumPy statevector engine.
+        dtype: complex128 (default) or complex64 to halve memory.
+        fusion_max_qubits: largest fused block (0 or 1 disables multi-qubit fusion).
+        checkpoint_bytes: memory budget for prefix checkpoints (0 disables them).
+        checkpoint_offsets: gates before the end at which checkpoints are saved.
+        threads: worker threads for gate kernels on large states (1 = single-threaded).
+        """
+        if threads < 1:
+            raise ValueError("threads must be >= 1")
+        self.dtype = dtype
+        self.fusion_max_qubits = fusion_max_qubits
+        self.checkpoints = PrefixCheckpoints(checkpoint_bytes) if checkpoint_bytes > 0 else None
+        self.checkpoint_offsets = tuple(checkpoint_offsets)
+        self.threads = threads
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_pid: Optional[int] = None
+        self._pool_lock = threading.Lock()
+
+    def _chunks(self, psi: np.ndarray, used_axes) -> Optional[List[Tuple]]:
+        if self.threads == 1:
+            return None
+        return chunk_indices(psi, used_axes, self.threads)
+
+    def _run_chunks(self, fn, chunks: List[Tuple]) -> None:
+        """Run fn(index) for every chunk on the engine's thread pool."""
+        if self._pool_pid is not None and self._pool_pid != os.getpid():
+            # forked: the inherited pool has no threads and the lock may have been held
+            # at fork time; the child is single-threaded here, so reset both
+            self._pool_lock = threading.Lock()
+            self._pool = self._pool_pid = None
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="qveda-kernel")
+                self._pool_pid = os.getpid()
+        # list() re-raises the first exception from a chunk
+        list(self._pool.map(fn, chunks))
+
+    def shutdown(self):
+        """Stop the kernel thread pool (it is recreated on demand)."""
+        with self._pool_lock:
+            if self._pool is not None and self._pool_pid == os.getpid():
+                self._pool.shutdown(wait=True)
+            self._pool = self._pool_pid = None
+
+    def _apply_controlled(self, state: np.ndarray, u: np.ndarray, controls: Sequence[int],
+                          target: int, num_qubits: int) -> None:
+        psi, lo, hi, used = controlled_pair(state.reshape(1, -1), controls, target, num_qubits)
+        chunks = self._chunks(psi, used)
+        if chunks is None:
+            mix_pair(psi, lo, hi, u)
+        else:
+            self._run_chunks(lambda ix: mix_pair(psi[ix], lo, hi, u), chunks)
+
+    def _apply_matrix(self, state: np.ndarray, matrix: np.ndarray, qubits: Sequence[int],
+                      num_qubits: int) -> np.ndarray:
+        psi, axes = qubit_view(state.reshape(1, -1), qubits, num_qubits)
+        chunks = self._chunks(psi, set(axes.values()))
+        if chunks is None:
+            return apply_matrix(state, matrix, qubits, num_qubits)
+        out = np.empty_like(psi)
+        targets = [axes[q] for q in qubits]
+
+        def work(ix):
+            out[ix] = apply_to_axes(psi[ix], matrix, targets)
+
+        self._run_chunks(work, chunks)
+        return out.reshape(-1)
+
+    def apply_op(self, state: np.ndarray, name: str, qubits: Sequence[int],
+                 params, num_qubits: int) -> None:
+        """Apply one primitive op (see QuantumWorkflow.ops) in place."""
+        if name == "MEASURE":
+            return
+        u = gate_matrix(name, params).astype(self.dtype, copy=False)
+        self._apply_controlled(state, u, qubits[:-1], qubits[-1], num_qubits)
+
+    def apply_block(self, state: np.ndarray, block: FusedBlock, num_qubits: int) -> np.ndarray:
+        """Apply a fused block; returns the (possibly new) amplitude array."""
+        if block.op is not None:
+            self.apply_op(state, *block.op, num_qubits)
+            return state
+        matrix = block.matrix.astype(self.dtype, copy=False)
+        if len(block.qubits) == 1:
+            self._apply_controlled(state, matrix, (), block.qubits[0], num_qubits)
+            return state
+        return self._apply_matrix(state, matrix, block.qubits, num_qubits)
+
+    def _apply_rows(self, state: np.ndarray, wf: QuantumWorkflow, start: int, stop: int):
+        """Fuse and apply gate rows [start, stop); returns (state, fusion stats)."""
+        blocks, fusion = fuse_ops(wf.ops(start, stop), max(1, self.fusion_max_qubits))
+        for block in blocks:
+            state = self.apply_block(state, block, wf.num_qubits)
+        return state, fusion
+
+    def simulate(self, wf: QuantumWorkflow) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Return (final amplitude array, meta) for the workflow.
+        Measurements are skipped, as in QuantumSimulator.run_statevector.
+        meta["fusion"] holds gate fusion statistics; with checkpoints enabled,
+        meta["checkpoint"] reports the gates skipped by resuming and the hit rate.
+        """
+        n = wf.num_qubits
+        if self.checkpoints is None:
+            state, fusion = self._apply_rows(zero_state(n, self.dtype), wf, 0, len(wf.gates))
+            return state, {"fusion": fusion}
+
+        rows, keys = prefix_keys(wf, self.dtype)
+        m = rows.size
+        skipped, cached = self.checkpoints.longest_prefix(keys)
+        state = cached.copy() if cached is not None else zero_state(n, self.dtype)
+
+        # split the remaining gates at the checkpoint positions and save after each part
+        bounds = [skipped] + sorted({m - d for d in self.checkpoint_offsets if skipped < m - d <= m})
+        fusion: Dict[str, Any] = {}
+        for a, b in zip(bounds, bounds[1:]):
+            # prefix length p ends right after gate row rows[p - 1]
+            start = int(rows[a - 1]) + 1 if a else 0
+            state, part = self._apply_rows(state, wf, start, int(rows[b - 1]) + 1)
+            fusion = _merge_fusion(fusion, part)
+            self.checkpoints.put(keys[b], state)
+        if not fusion:
+            _, fusion = fuse_ops((), max(1, self.fusion_max_qubits))
+
+        stats = self.checkpoints.stats()
+        return state, {
+            "fusion": fusion,
+            "checkpoint": {
+                "gates_skipped": skipped,
+                "gates_applied": m - skipped,
+                "hit_rate": stats["hit_rate"],
+                "entries": stats["entries"],
+                "bytes": stats["bytes"],
+            },
+        }
@@ -0,0 +1,104 @@
+# quantum_core/optimizer.py
+"""
+Peephole optimizer
+- Works on the primitive ops produced by QuantumWorkflow.ops().
+- Cancels adjacent self-inverse pairs (H·H, X·X, Y·Y, Z·Z, CX·CX, CCX·CCX).
+- Folds S·S into Z and T·T into S, and merges consecutive RX/RY/RZ rotations.
+- Two ops are "adjacent" when nothing in between touches their qubits, so gates on
+  disjoint qubits are commuted past. MEASURE is never optimized across.
+"""
+
+from typing import Dict, Any, Iterable, List, Tuple
+import math
+
+Op = Tuple[str, Tuple[int, ...], Dict[str, Any]]
+
+SELF_INVERSE = {"H", "X", "Y", "Z", "CX", "CCX"}
+SQUARES = {"S": "Z", "T": "S"}
+ROTATIONS = {"RX", "RY", "RZ"}
+
+# RX/RY/RZ(4*pi) is exactly the identity (2*pi is -I, a visible global phase)
+_ROTATION_PERIOD = 4 * math.pi
+_ANGLE_EPS = 1e-12
+
+_NO_MATCH = object()
+
+
+def _same_action(a: Op, b: Op) -> bool:
+    """True if a and b are the same gate on the same qubits in the same roles."""
+    if a[0] != b[0]:
+        return False
+    if a[0] == "CCX":
+        return set(a[1][:2]) == set(b[1][:2]) and a[1][2] == b[1][2]
+    return a[1] == b[1]
+
+
+def _theta(op: Op):
+    try:
+        return float(op[2].get("theta", 0.0))
+    except (TypeError, ValueError):
+        return None  # symbolic parameter, leave it alone
+
+
+def _combine(prev: Op, op: Op):
+    """
+    Combine two adjacent ops on the same qubits.
+    Returns None if they cancel, a replacement op, or _NO_MATCH.
+    """
+    name = op[0]
+    if not _same_action(prev, op):
+        return _NO_MATCH
+    if name in SELF_INVERSE:
+        return None
+    if name in SQUARES:
+        return (SQUARES[name], op[1], {})
+    if name in ROTATIONS:
+        a, b = _theta(prev), _theta(op)
+        if a is None or b is None:
+            return _NO_MATCH
+        theta = math.fmod(a + b, _ROTATION_PERIOD)
+        if abs(theta) < _ANGLE_EPS or abs(abs(theta) - _ROTATION_PERIOD) < _ANGLE_EPS:
+            return None
+        return (name, op[1], {"theta": theta})
+    return _NO_MATCH
+
+
+def peephole_optimize(ops: Iterable[Op], num_qubits: int) -> Tuple[List[Op], Dict[str, int]]:
+    """
+    Run the peephole pass over a sequence of primitive ops.
+    Returns (optimized ops, stats) where stats counts gates before/after,
+    cancelled pairs and merged pairs.
+    """
+    out: List[Any] = []
+    # per-qubit stack of indices into `out` of live ops touching that qubit
+    frontier: List[List[int]] = [[] for _ in range(num_qubits)]
+    stats = {"gates_before": 0, "gates_after": 0, "removed": 0, "cancelled": 0, "merged": 0}
+
+    for op in ops:
+        stats["gates_before"] += 1
+        while True:
+            name, qubits, _ = op
+            tops = {frontier[q][-1] if frontier[q] else None for q in qubits}
+            j = tops.pop() if len(tops) == 1 else None
+            combined = _NO_MATCH
+            if name != "MEASURE" and j is not None and set(out[j][1]) == set(qubits):
+                combined = _combine(out[j], op)
+            if combined is _NO_MATCH:
+                for q in qubits:
+                    frontier[q].append(len(out))
+                out.append(op)
+                break
+            # drop the earlier op; the result (if any) is re-checked against what precedes it
+            for q in qubits:
+                frontier[q].pop()
+            out[j] = None
+            if combined is None:
+                stats["cancelled"] += 1
+                break
+            stats["merged"] += 1
+            op = combined
+
+    result = [op for op in out if op is not None]
+    stats["gates_after"] = len(result)
+    stats["removed"] = stats["gates_before"] - stats["gates_after"]
+    return result, stats
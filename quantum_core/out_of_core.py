@@ -0,0 +1,278 @@
+# quantum_core/out_of_core.py
+"""
+MemmapStatevectorEngine
+- Out-of-core statevector simulation for states larger than RAM: amplitudes
+  live in an np.memmap scratch file and are processed in blocks of 2^b
+  consecutive amplitudes, with b chosen from a RAM budget.
+- Qubits below b are local to every block. A run of gates whose targets are
+  local is applied in one sweep over the file: each block is read, the gates
+  are fused and applied with the NumPy engine's kernels, and the block is
+  written back.
+- Controls on global qubits (>= b) are read off the block index. A gate whose
+  target is global first swaps it in for the local qubit whose next use as a
+  target is furthest away (one sweep exchanging half-blocks between block
+  pairs). A logical-to-physical layout tracks the reordering, and the qubit
+  order is restored at the end.
+- Blocks known to be all-zero are skipped.
+- Scratch files are unlinked on creation (tempfile.TemporaryFile), so they
+  are removed with the array; `directory` should be on local disk, not tmpfs.
+- Probabilities and sampled counts are computed block by block, so no 2^n
+  array is held in RAM.
+"""
+
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
+import os
+import tempfile
+
+import numpy as np
+
+from .fusion import fuse_ops
+from .numpy_engine import NumpyStatevectorEngine
+from .sampling import measured_mask, merge_outcomes, top_outcomes, format_counts
+from .workflow import QuantumWorkflow
+
+
+class _Run:
+    """Per-simulation bookkeeping: blocks known to be zero and sweep counters."""
+    __slots__ = ("zero", "sweeps", "swaps", "skipped")
+
+    def __init__(self, num_blocks: int):
+        self.zero = np.ones(num_blocks, dtype=bool)
+        self.zero[0] = False
+        self.sweeps = self.swaps = self.skipped = 0
+
+
+def scratch_array(shape, dtype, directory: Optional[str] = None) -> np.memmap:
+    """Zero-filled memmap on an unlinked temporary file; disk space is reserved up front."""
+    nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    with tempfile.TemporaryFile(dir=directory) as fh:
+        if hasattr(os, "posix_fallocate"):
+            # without a reservation, running out of disk mid-run is a SIGBUS, not an error
+            try:
+                os.posix_fallocate(fh.fileno(), 0, nbytes)
+            except OSError as e:
+                raise RuntimeError(f"Cannot reserve {nbytes} bytes of scratch space in "
+                                   f"{directory or tempfile.gettempdir()}: {e}") from e
+        # the mapping stays valid after the file object is closed
+        return np.memmap(fh, dtype=dtype, mode="w+", shape=shape)
+
+
+class MemmapState:
+    """A statevector held in a memmap file, read in blocks of 2^block_qubits amplitudes."""
+
+    def __init__(self, amplitudes: np.memmap, num_qubits: int, block_qubits: int,
+                 directory: Optional[str] = None):
+        self.amplitudes = amplitudes
+        self.num_qubits = num_qubits
+        self.block_qubits = block_qubits
+        self.directory = directory
+
+    @property
+    def block_size(self) -> int:
+        return 1 << self.block_qubits
+
+    def blocks(self) -> Iterator[Tuple[int, np.ndarray]]:
+        """(offset, amplitudes) for each block, in index order."""
+        size = self.block_size
+        for offset in range(0, self.amplitudes.size, size):
+            yield offset, np.asarray(self.amplitudes[offset:offset + size])
+
+    def block_probabilities(self) -> np.ndarray:
+        """Total probability of each block."""
+        return np.array([np.vdot(block, block).real for _, block in self.blocks()])
+
+    def probabilities(self) -> np.memmap:
+        """|amplitude|^2 for every basis state, written block by block to a float64 scratch memmap."""
+        out = scratch_array(self.amplitudes.shape, np.float64, self.directory)
+        for offset, block in self.blocks():
+            out[offset:offset + block.size] = block.real ** 2 + block.imag ** 2
+        return out
+
+    def sample_counts(self, shots: int, measured: Optional[Sequence[int]] = None, seed=None,
+                      max_outcomes: Optional[int] = None) -> Dict[str, int]:
+        """
+        sampling.sample_counts for the stored state, in two sweeps: shots are
+        split over blocks by their total probability, then drawn within each
+        block that received any.
+        """
+        rng = np.random.default_rng(seed)
+        totals = self.block_probabilities()
+        per_block = rng.multinomial(shots, totals / totals.sum())
+        keys: List[np.ndarray] = []
+        values: List[np.ndarray] = []
+        for k in np.flatnonzero(per_block):
+            offset = int(k) * self.block_size
+            block = np.asarray(self.amplitudes[offset:offset + self.block_size])
+            probs = block.real ** 2 + block.imag ** 2
+            hits = rng.multinomial(per_block[k], probs / probs.sum())
+            index = np.flatnonzero(hits)
+            keys.append(index + offset)
+            values.append(hits[index])
+        keys_all = np.concatenate(keys) if keys else np.zeros(0, dtype=np.int64)
+        values_all = np.concatenate(values) if values else np.zeros(0, dtype=np.int64)
+        mask = measured_mask(measured)
+        if mask is not None:
+            keys_all, values_all = merge_outcomes(keys_all & mask, values_all)
+        keys_all, values_all = top_outcomes(keys_all, values_all, max_outcomes)
+        return format_counts(keys_all, values_all, self.num_qubits)
+
+
+class MemmapStatevectorEngine:
+    def __init__(self, memory_bytes: int = 1 << 30, directory: Optional[str] = None,
+                 dtype=np.complex128, fusion_max_qubits: int = 4, threads: int = 1):
+        """
+        Out-of-core statevector engine.
+        memory_bytes: RAM budget for amplitude blocks (a sweep holds up to four blocks).
+        directory: where scratch files go (default: the system temp directory).
+        dtype, fusion_max_qubits, threads: as for NumpyStatevectorEngine, applied per block.
+        """
+        if memory_bytes <= 0:
+            raise ValueError("memory_bytes must be >= 1")
+        self.memory_bytes = memory_bytes
+        self.directory = directory
+        self.dtype = dtype
+        self.kernels = NumpyStatevectorEngine(dtype=dtype, fusion_max_qubits=fusion_max_qubits,
+                                              threads=threads)
+
+    def block_qubits(self, num_qubits: int) -> int:
+        """Local qubits per block: the largest b with four 2^b blocks within the budget."""
+        amplitudes = self.memory_bytes // (4 * np.dtype(self.dtype).itemsize)
+        if amplitudes < 2:
+            raise ValueError("memory_bytes is too small for even one qubit per block")
+        return min(num_qubits, amplitudes.bit_length() - 1)
+
+    def simulate(self, wf: QuantumWorkflow) -> Tuple[MemmapState, Dict[str, Any]]:
+        """
+        Return (MemmapState, meta) for the workflow; measurements are skipped.
+        meta reports the block size, the file sweeps and the qubit swaps.
+        """
+        n = wf.num_qubits
+        b = self.block_qubits(n)
+        amps = scratch_array((1 << n,), self.dtype, self.directory)
+        amps[0] = 1
+        run = _Run(1 << (n - b))
+
+        ops = [op for op in wf.ops() if op[0] != "MEASURE"]
+        # positions of each qubit's uses as a target, consumed front to back
+        uses: List[List[int]] = [[] for _ in range(n)]
+        for t in reversed(range(len(ops))):
+            uses[ops[t][1][-1]].append(t)
+
+        def next_use(q: int) -> int:
+            return uses[q][-1] if uses[q] else len(ops)
+
+        layout = list(range(n))  # logical qubit -> physical bit
+        where = list(range(n))   # physical bit -> logical qubit
+        stage: List[Tuple[str, Tuple[int, ...], Dict[str, Any]]] = []
+
+        def swap(p: int, q: int):
+            self._swap(run, amps, p, q, b)
+            where[p], where[q] = where[q], where[p]
+            layout[where[p]], layout[where[q]] = p, q
+
+        for name, qubits, params in ops:
+            target = qubits[-1]
+            uses[target].pop()
+            if layout[target] >= b:
+                self._sweep(run, amps, stage, b)
+                stage = []
+                # evict the local qubit that is next targeted furthest in the future
+                victim = max(range(b), key=lambda p: next_use(where[p]))
+                swap(victim, layout[target])
+            stage.append((name, tuple(layout[q] for q in qubits), params))
+        self._sweep(run, amps, stage, b)
+
+        # restore the qubit order: global bits one swap each, then local bits in one sweep
+        for p in range(b, n):
+            if where[p] != p:
+                swap(layout[p], p)
+        self._permute_local(run, amps, layout[:b], b)
+
+        meta = {
+            "block_qubits": b,
+            "blocks": 1 << (n - b),
+            "sweeps": run.sweeps,
+            "swaps": run.swaps,
+            "blocks_skipped": run.skipped,
+            "bytes": amps.nbytes,
+        }
+        return MemmapState(amps, n, b, self.directory), meta
+
+    def _sweep(self, run: _Run, amps: np.memmap, stage, b: int):
+        """Apply a run of gates with local targets to every non-zero block."""
+        if not stage:
+            return
+        size = 1 << b
+        # per op: bit mask of its global controls within the block index
+        masks = [sum(1 << (p - b) for p in qubits[:-1] if p >= b) for _, qubits, _ in stage]
+        fused: Dict[Tuple[bool, ...], List] = {}
+        run.sweeps += 1
+        for k in range(run.zero.size):
+            if run.zero[k]:
+                run.skipped += 1
+                continue
+            key = tuple(k & m == m for m in masks if m)
+            if key not in fused:
+                ops = []
+                for (name, qubits, params), m in zip(stage, masks):
+                    if k & m != m:
+                        continue
+                    ops.append((name, tuple(p for p in qubits if p < b), params))
+                fused[key], _ = fuse_ops(ops, max(1, self.kernels.fusion_max_qubits))
+            if not fused[key]:
+                continue
+            block = np.array(amps[k * size:(k + 1) * size])
+            for fb in fused[key]:
+                block = self.kernels.apply_block(block, fb, b)
+            amps[k * size:(k + 1) * size] = block
+
+    def _swap(self, run: _Run, amps: np.memmap, p: int, q: int, b: int):
+        """Exchange physical bits p and q of every amplitude index."""
+        p, q = min(p, q), max(p, q)
+        if q < b:
+            order = list(range(b))
+            order[p], order[q] = q, p
+            self._permute_local(run, amps, order, b)
+            return
+        if p >= b:
+            # two global bits: go through local bit 0
+            for x, y in ((0, p), (0, q), (0, p)):
+                self._swap(run, amps, x, y, b)
+            return
+        size = 1 << b
+        bit = 1 << (q - b)
+        run.sweeps += 1
+        run.swaps += 1
+        for k0 in range(run.zero.size):
+            if k0 & bit:
+                continue
+            k1 = k0 | bit
+            if run.zero[k0] and run.zero[k1]:
+                run.skipped += 2
+                continue
+            # block k0 has q = 0, block k1 has q = 1: swap k0's p = 1 half with k1's p = 0 half
+            a0 = np.array(amps[k0 * size:(k0 + 1) * size])
+            a1 = np.array(amps[k1 * size:(k1 + 1) * size])
+            v0 = a0.reshape(-1, 2, 1 << p)
+            v1 = a1.reshape(-1, 2, 1 << p)
+            upper = v0[:, 1].copy()
+            v0[:, 1] = v1[:, 0]
+            v1[:, 0] = upper
+            amps[k0 * size:(k0 + 1) * size] = a0
+            amps[k1 * size:(k1 + 1) * size] = a1
+            run.zero[k0] = run.zero[k1] = False
+
+    def _permute_local(self, run: _Run, amps: np.memmap, layout: Sequence[int], b: int):
+        """Move local bit layout[q] to bit q in every block (one sweep; no-op for the identity)."""
+        if list(layout) == list(range(b)):
+            return
+        size = 1 << b
+        # bit q sits on tensor axis b - 1 - q
+        axes = [b - 1 - layout[b - 1 - axis] for axis in range(b)]
+        run.sweeps += 1
+        for k in range(run.zero.size):
+            if run.zero[k]:
+                run.skipped += 1
+                continue
+            block = np.asarray(amps[k * size:(k + 1) * size]).reshape((2,) * b)
+            amps[k * size:(k + 1) * size] = np.ascontiguousarray(block.transpose(axes)).reshape(-1)
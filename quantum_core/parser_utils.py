@@ -4,10 +4,28 @@ QuantumParser
 - Parses QASM strings into Qiskit QuantumCircuit objects.
 - Extracts circuit metadata (number of qubits, classical bits, gates).
 - Provides a simple API for backend/frontend display.
+- QasmStreamReader reads OpenQASM 2 line by line (from a file path or any
+  iterable of lines) straight into a QuantumWorkflow, computing gate counts and
+  depth in the same pass. Working memory is one statement plus one batch of
+  gates; errors are QasmSyntaxError with the 1-based line number.
+- QuantumWorkflow measures qubit i into clbit i, so a measure into any other
+  clbit is rejected rather than silently remapped.
 """
 
-from qiskit import QuantumCircuit
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from collections import OrderedDict
+import ast
+import io
+import math
+import operator
+import os
+import re
+
+from .stats import CircuitStats
+from .workflow import QuantumWorkflow
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
 
 class QuantumParser:
     def __init__(self, qasm_code: str):
@@ -17,11 +35,13 @@ class QuantumParser:
         self.qasm_code = qasm_code
         self.circuit = None
         self.metadata = {}
+        self._parsed = False
 
-    def parse(self) -> QuantumCircuit:
+    def parse(self) -> "QuantumCircuit":
         """
         Parse the QASM code into a QuantumCircuit.
         """
+        from qiskit import QuantumCircuit
         try:
             self.circuit = QuantumCircuit.from_qasm_str(self.qasm_code)
         except Exception as e:
@@ -39,13 +59,313 @@ class QuantumParser:
             "depth": self.circuit.depth(),
             "width": self.circuit.width()
         }
+        self._parsed = True
 
         return self.circuit
 
+    def to_workflow(self) -> QuantumWorkflow:
+        """
+        Read the QASM string into a QuantumWorkflow with QasmStreamReader
+        (no Qiskit circuit is built); metadata is filled from the same pass.
+        """
+        reader = QasmStreamReader(io.StringIO(self.qasm_code))
+        wf = reader.read()
+        self.metadata = reader.metadata
+        self._parsed = True
+        return wf
+
     def get_metadata(self) -> dict:
         """
-        Return metadata of the parsed circuit.
+        Return metadata of the parsed circuit (filled by parse() or to_workflow()).
         """
-        if self.circuit is None:
-            raise RuntimeError("Circuit not parsed yet. Call parse() first.")
+        if not self._parsed:
+            raise RuntimeError("Circuit not parsed yet. Call parse() or to_workflow() first.")
         return self.metadata
+
+
+
+class QasmSyntaxError(ValueError):
+    """Invalid or unsupported OpenQASM 2 input; `line` is 1-based (None if unknown)."""
+
+    def __init__(self, message: str, line: Optional[int] = None):
+        self.line = line
+        super().__init__(f"line {line}: {message}" if line is not None else message)
+
+
+# qasm gate -> (workflow gate, number of params, number of qubits)
+QASM_GATES: Dict[str, Tuple[str, int, int]] = {
+    "h": ("H", 0, 1), "x": ("X", 0, 1), "y": ("Y", 0, 1), "z": ("Z", 0, 1),
+    "s": ("S", 0, 1), "t": ("T", 0, 1),
+    "rx": ("RX", 1, 1), "ry": ("RY", 1, 1), "rz": ("RZ", 1, 1),
+    "cx": ("CX", 0, 2), "CX": ("CX", 0, 2), "ccx": ("CCX", 0, 3),
+}
+
+_BINARY_OPS = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+               ast.Div: operator.truediv, ast.Pow: operator.pow}
+_UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+_FUNCTIONS = {"sin": math.sin, "cos": math.cos, "tan": math.tan, "exp": math.exp,
+              "ln": math.log, "sqrt": math.sqrt}
+
+_HEADER = re.compile(r"OPENQASM\s+(\d+)(?:\.\d+)?$")
+_INCLUDE = re.compile(r'include\s+"[^"]*"$')
+_REGISTER = re.compile(r"(qreg|creg)\s+([A-Za-z_]\w*)\s*\[\s*(\d+)\s*\]$")
+_MEASURE = re.compile(r"measure\s+(.+?)\s*->\s*(.+)$")
+_GATE = re.compile(r"([A-Za-z_]\w*)\s*(?:\((.*)\))?\s*(.*)$")
+_ARGUMENT = re.compile(r"([A-Za-z_]\w*)\s*(?:\[\s*(\d+)\s*\])?$")
+
+_UNSUPPORTED = {
+    "gate": "custom gate definitions are not supported",
+    "opaque": "opaque gates are not supported",
+    "if": "classically conditioned operations are not supported",
+    "reset": "reset is not supported",
+}
+
+
+def _eval_param(expr: str, line: int) -> float:
+    """Evaluate a QASM parameter expression (numbers, pi, + - * / ^, sin/cos/...)."""
+    def visit(node):
+        if isinstance(node, ast.Expression):
+            return visit(node.body)
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            return float(node.value)
+        if isinstance(node, ast.Name) and node.id == "pi":
+            return math.pi
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+            return _BINARY_OPS[type(node.op)](visit(node.left), visit(node.right))
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+            return _UNARY_OPS[type(node.op)](visit(node.operand))
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                and node.func.id in _FUNCTIONS and len(node.args) == 1 and not node.keywords):
+            return _FUNCTIONS[node.func.id](visit(node.args[0]))
+        raise QasmSyntaxError(f"invalid parameter expression '{expr}'", line)
+
+    try:
+        # QASM uses ^ for powers
+        return visit(ast.parse(expr.replace("^", "**"), mode="eval"))
+    except QasmSyntaxError:
+        raise
+    except (SyntaxError, ValueError, ZeroDivisionError, OverflowError):
+        raise QasmSyntaxError(f"invalid parameter expression '{expr}'", line) from None
+
+
+class QasmStreamReader:
+    def __init__(self, source, batch_size: int = 4096, max_statement_chars: int = 1 << 20):
+        """
+        source: path to a .qasm file, or an iterable of lines (open file, StringIO, list).
+        batch_size: gates buffered before they are appended to the workflow.
+        max_statement_chars: longest statement accepted (guards against a missing ';').
+        """
+        self.source = source
+        self.batch_size = batch_size
+        self.max_statement_chars = max_statement_chars
+        self._qregs: Dict[str, Tuple[int, int]] = {}  # name -> (offset, size)
+        self._cregs: Dict[str, Tuple[int, int]] = {}
+        self.num_qubits = 0
+        self.num_clbits = 0
+        # running depth and counts, updated per statement
+        self.stats = CircuitStats()
+        # argument text -> global bit indices (reset when registers change)
+        self._resolved: Dict[Tuple[str, str], List[int]] = {}
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Same shape as QuantumParser.metadata (gate_count ordered by frequency)."""
+        return {
+            "num_qubits": self.num_qubits,
+            "num_clbits": self.num_clbits,
+            "gate_count": self.stats.gate_count(),
+            "depth": self.stats.depth,
+            "width": self.num_qubits + self.num_clbits,
+        }
+
+    def _lines(self) -> Iterator[str]:
+        if isinstance(self.source, (str, os.PathLike)):
+            with open(self.source) as fh:
+                yield from fh
+        else:
+            yield from self.source
+
+    def _statements(self) -> Iterator[Tuple[int, str]]:
+        """(line number where the statement starts, statement without ';')."""
+        pending: List[str] = []
+        size = 0
+        start = None
+        for lineno, line in enumerate(self._lines(), 1):
+            line = line.split("//", 1)[0]
+            while line:
+                head, sep, line = line.partition(";")
+                if head.strip():
+                    if start is None:
+                        start = lineno
+                    pending.append(head)
+                    size += len(head)
+                    if size > self.max_statement_chars:
+                        raise QasmSyntaxError("statement too long (missing ';'?)", start)
+                if sep:
+                    if pending:
+                        yield start, " ".join(pending).strip()
+                    pending, size, start = [], 0, None
+        if pending:
+            raise QasmSyntaxError("unexpected end of input (missing ';')", start)
+
+    def _declare(self, kind: str, name: str, size: int, line: int):
+        if name in self._qregs or name in self._cregs:
+            raise QasmSyntaxError(f"register '{name}' already declared", line)
+        if size < 1:
+            raise QasmSyntaxError(f"register '{name}' must have at least one bit", line)
+        self._resolved.clear()
+        if kind == "qreg":
+            self._qregs[name] = (self.num_qubits, size)
+            self.num_qubits += size
+            self.stats.add_qubits(size)
+        else:
+            self._cregs[name] = (self.num_clbits, size)
+            self.num_clbits += size
+            self.stats.add_clbits(size)
+
+    def _resolve(self, arg: str, registers: Dict[str, Tuple[int, int]], kind: str, line: int) -> List[int]:
+        """Global bit indices of `q` (whole register) or `q[i]`."""
+        key = (kind, arg)
+        cached = self._resolved.get(key)
+        if cached is not None:
+            return cached
+        bits = self._resolve_uncached(arg, registers, kind, line)
+        # bounded by the number of distinct bits and registers
+        self._resolved[key] = bits
+        return bits
+
+    def _resolve_uncached(self, arg: str, registers: Dict[str, Tuple[int, int]], kind: str,
+                          line: int) -> List[int]:
+        m = _ARGUMENT.match(arg.strip())
+        if not m:
+            raise QasmSyntaxError(f"invalid argument '{arg.strip()}'", line)
+        name, index = m.groups()
+        if name not in registers:
+            raise QasmSyntaxError(f"undeclared {kind} '{name}'", line)
+        offset, size = registers[name]
+        if index is None:
+            return list(range(offset, offset + size))
+        if int(index) >= size:
+            raise QasmSyntaxError(f"index {index} out of range for {kind} '{name}[{size}]'", line)
+        return [offset + int(index)]
+
+    @staticmethod
+    def _broadcast(args: List[List[int]], line: int) -> List[Tuple[int, ...]]:
+        """QASM broadcasting: whole-register arguments must have equal sizes."""
+        if all(len(a) == 1 for a in args):
+            return [tuple(a[0] for a in args)]
+        sizes = {len(a) for a in args if len(a) > 1}
+        if len(sizes) > 1:
+            raise QasmSyntaxError("register arguments have different sizes", line)
+        n = sizes.pop() if sizes else 1
+        return [tuple(a[i] if len(a) > 1 else a[0] for a in args) for i in range(n)]
+
+    def _statement_gates(self, line: int, stmt: str) -> List[Dict[str, Any]]:
+        """Workflow gates for one statement (empty for declarations/barriers)."""
+        m = _GATE.match(stmt)
+        if not m:
+            raise QasmSyntaxError(f"invalid statement '{stmt}'", line)
+        name, params_text, args_text = m.groups()
+        if name in QASM_GATES:
+            return self._gate(line, stmt, name, params_text, args_text)
+
+        keyword = name
+        if keyword in _UNSUPPORTED:
+            raise QasmSyntaxError(_UNSUPPORTED[keyword], line)
+        if keyword == "OPENQASM":
+            m = _HEADER.match(stmt)
+            if not m or m.group(1) != "2":
+                raise QasmSyntaxError(f"unsupported header '{stmt}' (OpenQASM 2 only)", line)
+            return []
+        if keyword == "include":
+            if not _INCLUDE.match(stmt):
+                raise QasmSyntaxError(f"invalid include '{stmt}'", line)
+            return []
+        if keyword in ("qreg", "creg"):
+            m = _REGISTER.match(stmt)
+            if not m:
+                raise QasmSyntaxError(f"invalid register declaration '{stmt}'", line)
+            self._declare(m.group(1), m.group(2), int(m.group(3)), line)
+            return []
+        if keyword == "measure":
+            m = _MEASURE.match(stmt)
+            if not m:
+                raise QasmSyntaxError(f"invalid measure '{stmt}' (expected 'measure q -> c')", line)
+            pairs = self._broadcast([self._resolve(m.group(1), self._qregs, "qreg", line),
+                                     self._resolve(m.group(2), self._cregs, "creg", line)], line)
+            gates = []
+            for q, c in pairs:
+                if c != q:
+                    # QuantumWorkflow has no clbit mapping: MEASURE on q writes clbit q
+                    raise QasmSyntaxError(f"measure of qubit {q} into clbit {c} is not supported "
+                                          f"(qubit i must be measured into clbit i)", line)
+                self.stats.record("measure", (q,), (c,))
+                gates.append({"name": "MEASURE", "targets": [q]})
+            return gates
+        if keyword == "barrier":
+            qubits = sorted({q for arg in stmt[len("barrier"):].split(",")
+                             for q in self._resolve(arg, self._qregs, "qreg", line)})
+            self.stats.directive("barrier", qubits)
+            return []
+        raise QasmSyntaxError(f"unsupported gate '{name}'", line)
+
+    def _gate(self, line: int, stmt: str, name: str, params_text: Optional[str],
+              args_text: str) -> List[Dict[str, Any]]:
+        gate, n_params, n_qubits = QASM_GATES[name]
+        params = [p for p in (params_text or "").split(",") if p.strip()]
+        if len(params) != n_params:
+            raise QasmSyntaxError(f"'{name}' takes {n_params} parameter(s), got {len(params)}", line)
+        args = [a for a in args_text.split(",") if a.strip()]
+        if len(args) != n_qubits:
+            raise QasmSyntaxError(f"'{name}' takes {n_qubits} qubit(s), got {len(args)}", line)
+        theta = _eval_param(params[0], line) if params else None
+
+        gates = []
+        for qubits in self._broadcast([self._resolve(a, self._qregs, "qreg", line) for a in args], line):
+            if len(set(qubits)) != len(qubits):
+                raise QasmSyntaxError(f"repeated qubit in '{stmt}'", line)
+            self.stats.record(name.lower(), qubits)
+            g = {"name": gate, "targets": [qubits[-1]]}
+            if len(qubits) > 1:
+                g["controls"] = list(qubits[:-1])
+            if theta is not None:
+                g["params"] = {"theta": theta}
+            gates.append(g)
+        return gates
+
+    def iter_gates(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield workflow gate dicts as statements are read (qubit indices are global:
+        registers are concatenated in declaration order). Counts, depth and
+        register sizes are updated as the stream is consumed.
+        """
+        for line, stmt in self._statements():
+            yield from self._statement_gates(line, stmt)
+
+    def read(self) -> QuantumWorkflow:
+        """Read the whole source into a QuantumWorkflow, `batch_size` gates at a time."""
+        wf = None
+        batch: List[Dict[str, Any]] = []
+        for gate in self.iter_gates():
+            batch.append(gate)
+            if len(batch) >= self.batch_size:
+                wf = self._flush(wf, batch)
+                batch = []
+        wf = self._flush(wf, batch)
+        wf.meta["qasm"] = self.metadata
+        return wf
+
+    def _flush(self, wf: Optional[QuantumWorkflow], batch: List[Dict[str, Any]]) -> QuantumWorkflow:
+        if not self.num_qubits:
+            raise QasmSyntaxError("no qreg declared")
+        if wf is None:
+            wf = QuantumWorkflow(self.num_qubits)
+        # qregs may be declared after the first gates
+        wf.num_qubits = self.num_qubits
+        wf.extend(batch)
+        return wf
+
+
+def read_qasm(source, batch_size: int = 4096) -> QuantumWorkflow:
+    """QuantumWorkflow from an OpenQASM 2 file path or iterable of lines."""
+    return QasmStreamReader(source, batch_size=batch_size).read()
@@ -0,0 +1,151 @@
+# quantum_core/sampling.py
+"""
+Shot sampling and counting
+- Shots are drawn from a probability array with one multinomial draw, which costs
+  O(2^n) regardless of the number of shots (10^7 shots cost the same as 10^3).
+- Outcomes stay integer basis indices (qubit q = bit q) while they are masked to
+  the measured qubits and merged with np.unique / np.bincount; bitstring keys are
+  only formatted for the outcomes that are returned.
+- Per-shot samplers (stabilizer, MPS) are counted in fixed-size chunks so memory
+  does not grow with the shot count.
+- max_outcomes caps the number of distinct outcomes returned (most frequent kept).
+- read_amplitudes looks up single amplitudes by bitstring for engines that can
+  read them without a dense statevector.
+"""
+
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple
+from collections import Counter
+import numpy as np
+
+# shots drawn per chunk by per-shot samplers
+SHOT_CHUNK = 1 << 16
+# widest outcome that fits in an int64 basis index
+MAX_INDEX_QUBITS = 63
+
+
+def measured_mask(measured: Optional[Sequence[int]]) -> Optional[int]:
+    """Bit mask of the measured qubits; None when every qubit is measured."""
+    if not measured:
+        return None
+    return sum(1 << int(q) for q in measured)
+
+
+def merge_outcomes(keys: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sum values over equal keys; returns sorted unique keys and their totals."""
+    unique, inverse = np.unique(keys, return_inverse=True)
+    return unique, np.bincount(inverse, weights=values, minlength=unique.size).astype(np.int64)
+
+
+def top_outcomes(keys: np.ndarray, values: np.ndarray,
+                 max_outcomes: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Keep the max_outcomes most frequent outcomes (ties: lower index), in key order."""
+    if max_outcomes is not None and max_outcomes < 1:
+        raise ValueError("max_outcomes must be >= 1")
+    if max_outcomes is None or keys.size <= max_outcomes:
+        return keys, values
+    order = np.lexsort((keys, -values))[:max_outcomes]
+    order.sort()
+    return keys[order], values[order]
+
+
+def format_counts(keys: np.ndarray, values: np.ndarray, num_qubits: int) -> Dict[str, int]:
+    """Integer outcomes -> run_qasm-style {"bitstring": count} (qubit 0 rightmost)."""
+    width = f"0{num_qubits}b"
+    return {format(int(k), width): int(v) for k, v in zip(keys.tolist(), values.tolist())}
+
+
+def sample_counts(probs: np.ndarray, shots: int, num_qubits: int,
+                  measured: Optional[Sequence[int]] = None, seed=None,
+                  max_outcomes: Optional[int] = None) -> Dict[str, int]:
+    """
+    Sample `shots` outcomes from basis-state probabilities with one multinomial draw.
+    Qubits outside `measured` read as 0 (None/empty = all measured).
+    """
+    probs = np.asarray(probs, dtype=float)
+    probs = probs / probs.sum()
+    hits = np.random.default_rng(seed).multinomial(shots, probs)
+    keys = np.flatnonzero(hits)
+    values = hits[keys]
+    mask = measured_mask(measured)
+    if mask is not None:
+        keys, values = merge_outcomes(keys & mask, values)
+    keys, values = top_outcomes(keys, values, max_outcomes)
+    return format_counts(keys, values, num_qubits)
+
+
+def bits_to_indices(bits: np.ndarray) -> np.ndarray:
+    """(shots, n) bool rows -> int64 basis indices (n <= 63)."""
+    weights = np.left_shift(np.int64(1), np.arange(bits.shape[1], dtype=np.int64))
+    return bits.astype(np.int64) @ weights
+
+
+def count_bits(sample: Callable[[int, np.random.Generator], np.ndarray], shots: int,
+               num_qubits: int, measured: Optional[Sequence[int]] = None, seed=None,
+               max_outcomes: Optional[int] = None, chunk: int = SHOT_CHUNK) -> Dict[str, int]:
+    """
+    Count outcomes of a per-shot sampler, SHOT_CHUNK shots at a time.
+    sample(k, rng) must return a (k, n) bool array of outcomes for all qubits.
+    """
+    rng = np.random.default_rng(seed)
+    keep = None
+    if measured:
+        keep = np.zeros(num_qubits, dtype=bool)
+        keep[list(measured)] = True
+
+    if num_qubits > MAX_INDEX_QUBITS:
+        # too wide for integer indices: count rows as bytes
+        tally: Counter = Counter()
+        for bits in _chunks(sample, shots, rng, chunk):
+            if keep is not None:
+                bits = bits & keep
+            rows, counts = np.unique(bits[:, ::-1].view(np.uint8), axis=0, return_counts=True)
+            tally.update({(row + ord("0")).tobytes().decode("ascii"): int(c) for row, c in zip(rows, counts)})
+        return truncate_counts(dict(sorted(tally.items())), max_outcomes)
+
+    all_keys, all_values = [], []
+    for bits in _chunks(sample, shots, rng, chunk):
+        if keep is not None:
+            bits = bits & keep
+        keys, values = np.unique(bits_to_indices(bits), return_counts=True)
+        all_keys.append(keys)
+        all_values.append(values)
+    if not all_keys:
+        return {}
+    keys, values = merge_outcomes(np.concatenate(all_keys), np.concatenate(all_values))
+    keys, values = top_outcomes(keys, values, max_outcomes)
+    return format_counts(keys, values, num_qubits)
+
+
+def _chunks(sample, shots: int, rng, chunk: int) -> Iterable[np.ndarray]:
+    done = 0
+    while done < shots:
+        k = min(chunk, shots - done)
+        yield sample(k, rng)
+        done += k
+
+
+def read_amplitudes(amplitude: Callable[[int], complex], bitstrings: Iterable[str],
+                    num_qubits: int) -> Dict[str, complex]:
+    """{bitstring: amplitude(index)} for run_qasm-style bitstrings (qubit 0 rightmost)."""
+    out = {}
+    for bits in bitstrings:
+        if len(bits) != num_qubits or set(bits) - {"0", "1"}:
+            raise ValueError(f"Invalid basis state {bits!r} for {num_qubits} qubits")
+        out[bits] = complex(amplitude(int(bits, 2)))
+    return out
+
+
+def counts_to_probabilities(counts: Dict[str, int], shots: Optional[int] = None) -> Dict[str, float]:
+    """Relative frequencies; divides by `shots` (default: the total of `counts`)."""
+    total = shots if shots is not None else sum(counts.values())
+    return {k: v / total for k, v in counts.items()}
+
+
+def truncate_counts(counts: Dict[str, int], max_outcomes: Optional[int]) -> Dict[str, int]:
+    """Keep the max_outcomes most frequent entries of an existing counts dict."""
+    if max_outcomes is not None and max_outcomes < 1:
+        raise ValueError("max_outcomes must be >= 1")
+    if max_outcomes is None or len(counts) <= max_outcomes:
+        return counts
+    kept = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))[:max_outcomes]
+    return dict(sorted(kept))
@@ -4,102 +4,234 @@ QuantumSimulator
 - Runs Qiskit circuits using Aer (or fallback) for statevector or qasm simulation.
 - Optional simple noise models (depolarizing / bitflip) using Aer noise tools if available.
 - Returns structured outputs: counts, probabilities, statevector, circuit metadata.
+- run() simulates once and derives every requested output from that single run.
+- Clifford-only workflows are sampled with a stabilizer tableau (polynomial in qubits).
+- Wide, low-entanglement workflows can use the matrix-product-state engine.
+- engine="memmap" keeps the statevector in a disk-backed np.memmap under a RAM
+  budget (see out_of_core.py), for states larger than memory.
+- Noisy runs use batched Monte Carlo trajectories (statevector-sized memory);
+  Aer's density-matrix method stays available via engine="aer".
+- Aer backends and noise models come from the process-wide registry in
+  backends.py, so they are built once and shared across requests.
+- run_sweep() evaluates symbolic RX/RY/RZ angles over a grid in one batched pass.
+- run_many() spreads many workflows across a process pool (see batch.py).
+- Qiskit / qiskit_aer are imported on first use, so the NumPy, stabilizer, MPS
+  and trajectory engines never pay their import cost.
 """
 
-from typing import Dict, Any, Optional
-from qiskit import QuantumCircuit
-from qiskit_aer import AerSimulator
-from qiskit.quantum_info import Statevector
+from typing import Dict, Any, Optional, Iterable, List
+from collections import OrderedDict
 import numpy as np
-import warnings
-
-# try to import noise tools. If not available, fallback gracefully
-try:
-    from qiskit_aer.noise import NoiseModel, depolarizing_error, pauli_error
-    AER_NOISE_AVAILABLE = True
-except Exception:
-    AER_NOISE_AVAILABLE = False
 
+from .backends import get_backend, get_noise_model
 from .workflow import QuantumWorkflow
+from .metrics import stage
+from .sampling import sample_counts, counts_to_probabilities, truncate_counts, read_amplitudes
+from .numpy_engine import NumpyStatevectorEngine
+from .out_of_core import MemmapStatevectorEngine
+from .stabilizer import StabilizerSimulator, is_clifford
+from .mps import MPSSimulator
+from .trajectories import TrajectorySimulator, NOISY_GATES
+from .sweep import ParameterSweep
+
+RUN_OUTPUTS = ("counts", "probabilities", "statevector", "resources")
+# outputs run() accepts on request only
+EXTRA_OUTPUTS = ("amplitudes",)
+RUN_ENGINES = ("numpy", "memmap", "stabilizer", "trajectory", "mps", "aer")
+# engines that only sample outcomes and never build a dense statevector
+SAMPLING_ENGINES = ("stabilizer", "trajectory", "mps")
+
+# trajectories averaged for noisy counts (counts themselves are drawn from the average)
+DEFAULT_TRAJECTORIES = 512
+
+
+def _is_noisy(noise: Optional[Dict[str, Any]]) -> bool:
+    return bool(noise) and noise.get("mode", "none") != "none"
+
 
 class QuantumSimulator:
-    def __init__(self, backend_name: str = "aer_simulator"):
+    def __init__(self, backend_name: str = "aer_simulator", checkpoint_bytes: int = 0, threads: int = 1,
+                 memmap_bytes: int = 1 << 30, memmap_dir: Optional[str] = None):
         """
         Initialize simulator backend.
         Default is AerSimulator. If not available, fallback to local AerSimulator.
+        checkpoint_bytes: memory budget for the numpy engine's prefix checkpoints
+        (0 disables them; see checkpoints.py).
+        threads: worker threads for the numpy engine's gate kernels on large states.
+        memmap_bytes / memmap_dir: RAM budget and scratch directory of the
+        out-of-core engine (engine="memmap").
         """
         self.backend_name = backend_name
-        try:
-            self.simulator = AerSimulator()
-        except Exception as e:
-            raise RuntimeError(
-                "AerSimulator not available. Install qiskit-aer."
-            ) from e
+        self.numpy_engine = NumpyStatevectorEngine(checkpoint_bytes=checkpoint_bytes, threads=threads)
+        self.memmap_engine = MemmapStatevectorEngine(memory_bytes=memmap_bytes, directory=memmap_dir,
+                                                     threads=threads)
 
-    def _apply_noise_model(self, noise_spec: Optional[Dict[str, Any]] = None):
+    @property
+    def simulator(self):
+        """The shared AerSimulator backend (see backends.py), created on first use."""
+        return get_backend()
+
+    def _apply_noise_model(self, noise_spec: Optional[Dict[str, Any]] = None, num_qubits: int = 0):
         """
-        Construct a NoiseModel if noise_spec provided and Aer noise is available.
+        Shared NoiseModel for noise_spec if provided and Aer noise is available.
         noise_spec: {"mode": "depolarizing"|"bitflip", "p": 0.01}
         """
-        if not noise_spec or noise_spec.get("mode", "none") == "none":
-            return None
-        if not AER_NOISE_AVAILABLE:
-            warnings.warn("Aer noise tools not available; ignoring noise spec.")
-            return None
-
-        mode = noise_spec.get("mode")
-        p = float(noise_spec.get("p", 0.0))
-        nm = NoiseModel()
-
-        if mode == "depolarizing":
-            err1 = depolarizing_error(p, 1)
-            err2 = depolarizing_error(p, 2)
-            nm.add_all_qubit_quantum_error(err1, ["u1", "u2", "u3", "rx", "rz", "sx", "x", "h", "s", "t"])
-            nm.add_all_qubit_quantum_error(err2, ["cx", "cz"])
-        elif mode == "bitflip":
-            err = pauli_error([("X", p), ("I", 1 - p)])
-            nm.add_all_qubit_quantum_error(err, ["u1", "u2", "u3", "rx", "rz", "h", "x"])
-        else:
-            return None
-        return nm
+        return get_noise_model(noise_spec, num_qubits)
+
+    def _stabilizer_applicable(self, wf: QuantumWorkflow, noise: Optional[Dict[str, Any]]) -> bool:
+        return not _is_noisy(noise) and is_clifford(wf) and not wf.has_mid_circuit_measurement()
+
+    def _trajectory_applicable(self, wf: QuantumWorkflow, noise: Optional[Dict[str, Any]]) -> bool:
+        return (_is_noisy(noise) and noise.get("mode") in NOISY_GATES
+                and not wf.has_mid_circuit_measurement())
+
+    def run_trajectories(self, wf: QuantumWorkflow, noise: Dict[str, Any],
+                         trajectories: int = DEFAULT_TRAJECTORIES, seed: Optional[int] = None,
+                         density_matrix: bool = False) -> Dict[str, Any]:
+        """
+        Noisy simulation by averaging pure-state Monte Carlo trajectories.
+        Returns probabilities and their 95% confidence half-widths as NumPy arrays
+        (plus the averaged density matrix for small circuits if requested).
+        """
+        return TrajectorySimulator(trajectories=trajectories).run(
+            wf, noise, seed=seed, density_matrix=density_matrix)
+
+    def run_stabilizer(self, wf: QuantumWorkflow, shots: int = 1024, seed: Optional[int] = None,
+                       max_outcomes: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Sample a Clifford-only workflow with the stabilizer tableau engine.
+        Returns the same shape as run_qasm, with meta["engine"] == "stabilizer".
+        """
+        result = StabilizerSimulator().run(wf, shots=shots, seed=seed, max_outcomes=max_outcomes)
+        result["meta"] = {"shots": shots, **self.estimate_resources(wf), "engine": "stabilizer"}
+        return result
 
-    def run_qasm(self, wf: QuantumWorkflow, shots: int = 1024, noise: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def run_mps(self, wf: QuantumWorkflow, shots: int = 1024, seed: Optional[int] = None,
+                max_bond: int = 64, cutoff: float = 1e-12,
+                max_outcomes: Optional[int] = None, amplitudes: bool = False,
+                basis_states: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Sample the workflow with the matrix-product-state engine.
+        max_bond / cutoff bound the bond dimension and per-SVD discarded weight;
+        the accumulated truncation error is reported in meta.
+        amplitudes: also return {bitstring: amplitude} for basis_states (default:
+        the sampled outcomes) without forming the dense state.
+        """
+        result = MPSSimulator(max_bond=max_bond, cutoff=cutoff).run(
+            wf, shots=shots, seed=seed, max_outcomes=max_outcomes,
+            amplitudes=amplitudes, basis_states=basis_states)
+        result["meta"] = {"shots": shots, **self.estimate_resources(wf), "engine": "mps", **result["meta"]}
+        return result
+
+    def run_qasm(self, wf: QuantumWorkflow, shots: int = 1024, noise: Optional[Dict[str, Any]] = None,
+                 engine: str = "auto", seed: Optional[int] = None,
+                 max_outcomes: Optional[int] = None) -> Dict[str, Any]:
         """
         Execute the workflow as a QASM (measurement) simulation.
+        engine: "auto" (stabilizer for Clifford-only noiseless workflows, trajectories
+        for noisy ones, else Aer), "stabilizer", "trajectory",
+        "mps" (noiseless, default bond settings) or "aer".
+        max_outcomes: return only the most frequent distinct outcomes.
         Returns dict with counts, probabilities, metadata.
         """
-        qc = wf.to_qiskit()
+        if engine == "mps":
+            if _is_noisy(noise):
+                raise ValueError("mps engine does not support noise")
+            return self.run_mps(wf, shots=shots, seed=seed, max_outcomes=max_outcomes)
+        if engine in ("auto", "trajectory") and self._trajectory_applicable(wf, noise):
+            traj = self.run_trajectories(wf, noise, trajectories=min(shots, DEFAULT_TRAJECTORIES), seed=seed)
+            sample_seed = None if seed is None else seed + 1
+            with stage("sampling"):
+                counts = sample_counts(traj["probabilities"], shots, wf.num_qubits, wf.measured_qubits(),
+                                       seed=sample_seed, max_outcomes=max_outcomes)
+            return {
+                "counts": counts,
+                "probabilities": counts_to_probabilities(counts, shots),
+                "meta": {"shots": shots, **self.estimate_resources(wf), **traj["meta"]},
+            }
+        if engine == "trajectory":
+            raise ValueError("trajectory engine needs a depolarizing/bitflip noise spec and terminal measurements")
+        if engine in ("auto", "stabilizer") and self._stabilizer_applicable(wf, noise):
+            return self.run_stabilizer(wf, shots=shots, seed=seed, max_outcomes=max_outcomes)
+        if engine == "stabilizer":
+            raise ValueError("stabilizer engine needs a noiseless Clifford-only workflow with terminal measurements")
+        if engine not in ("auto", "aer"):
+            raise ValueError(f"Unknown qasm engine: {engine}")
 
-        # If no measurement present, measure all at end
-        if not any(g["name"] == "MEASURE" for g in wf.gates):
-            qc.measure(range(wf.num_qubits), range(wf.num_qubits))
+        measure_all = not wf.measured_qubits()
+        with stage("circuit_conversion"):
+            qc = wf.to_qiskit()
 
-        noise_model = self._apply_noise_model(noise)
-        backend = self.simulator
+            # If no measurement present, measure all at end
+            if measure_all:
+                qc.measure(range(wf.num_qubits), range(wf.num_qubits))
 
-        if noise_model:
-            backend = AerSimulator(method="density_matrix")  # supports noise
+        noise_model = self._apply_noise_model(noise, wf.num_qubits)
+        # density_matrix supports noise; both backends are shared process-wide
+        backend = get_backend("density_matrix") if noise_model else self.simulator
 
-        job = backend.run(qc, shots=shots, noise_model=noise_model) if noise_model else backend.run(qc, shots=shots)
-        result = job.result()
+        run_options = {"shots": shots}
+        if noise_model:
+            run_options["noise_model"] = noise_model
+        if seed is not None:
+            run_options["seed_simulator"] = seed
+        with stage("simulate"):
+            job = backend.run(qc, **run_options)
+            result = job.result()
         counts = result.get_counts()
         total = sum(counts.values())
-        probabilities = {k: v / total for k, v in counts.items()}
+        counts = truncate_counts(counts, max_outcomes)
+        probabilities = counts_to_probabilities(counts, total)
 
         meta = {
             "shots": total,
-            "depth": qc.depth(),
-            "width": qc.width(),
-            "gate_count": qc.count_ops(),
+            **self.estimate_resources(wf, measure_all=measure_all),
+            "engine": "aer",
         }
 
         return {"counts": counts, "probabilities": probabilities, "meta": meta}
 
-    def run_statevector(self, wf: QuantumWorkflow, noise: Optional[Dict[str, Any]] = None, shots: int = 1024) -> Dict[str, Any]:
+    def run_statevector(self, wf: QuantumWorkflow, noise: Optional[Dict[str, Any]] = None, shots: int = 1024,
+                        engine: str = "aer") -> Dict[str, Any]:
         """
         Return the statevector of the circuit.
-        If noise is provided, simulate multiple trajectories to approximate noisy state.
+        If noise is provided, average `shots` Monte Carlo trajectories instead: a mixed
+        state has no statevector, so "statevector" is empty and the result carries
+        averaged probabilities, their 95% confidence half-widths and (for small
+        circuits) the averaged density matrix.
+        engine: "aer" (Qiskit Statevector), "numpy" (built-in) or "memmap" (out of
+        core; "statevector" and "probabilities" are then disk-backed np.memmap arrays).
         """
+        if _is_noisy(noise):
+            traj = self.run_trajectories(wf, noise, trajectories=shots, density_matrix=True)
+            result = {
+                "statevector": [],
+                "probabilities": traj["probabilities"].tolist(),
+                "probabilities_ci": traj["probabilities_ci"].tolist(),
+                "meta": {"dim": 2 ** wf.num_qubits, **traj["meta"]},
+            }
+            if "density_matrix" in traj:
+                result["density_matrix"] = traj["density_matrix"].tolist()
+            return result
+        if engine == "numpy":
+            state, engine_meta = self.numpy_engine.simulate(wf)
+            return {
+                "statevector": state.tolist(),
+                "probabilities": (np.abs(state) ** 2).tolist(),
+                "meta": {"dim": len(state), "engine": "numpy", **engine_meta},
+            }
+        if engine == "memmap":
+            state, engine_meta = self.memmap_engine.simulate(wf)
+            return {
+                "statevector": state.amplitudes,
+                "probabilities": state.probabilities(),
+                "meta": {"dim": state.amplitudes.size, "engine": "memmap", **engine_meta},
+            }
+        if engine != "aer":
+            raise ValueError(f"Unknown statevector engine: {engine}")
+
+        from qiskit import QuantumCircuit
+        from qiskit.quantum_info import Statevector
         sc = QuantumCircuit(wf.num_qubits)
         for g in wf.gates:
             name, targets, controls, params = g["name"], g["targets"], g["controls"], g["params"]
@@ -122,29 +254,174 @@ class QuantumSimulator:
                 if len(controls)>=2 and len(targets)>=1:
                     sc.ccx(controls[0], controls[1], targets[0])
 
-        if noise and AER_NOISE_AVAILABLE:
-            noise_model = self._apply_noise_model(noise)
-            backend = AerSimulator(method="density_matrix")
-            job = backend.run(sc, shots=shots, noise_model=noise_model)
-            result = job.result()
-            # approximate statevector by averaging
-            sv_list = []
-            for i in range(shots):
-                sv_list.append(Statevector(result.data(i)["density_matrix"]).data)
-            vec = np.mean(sv_list, axis=0).tolist()
-            probs = (np.abs(vec)**2).tolist()
-        else:
+        with stage("simulate"):
             state = Statevector.from_instruction(sc)
-            vec = state.data.tolist()
-            probs = (np.abs(state.data)**2).tolist()
-
-        return {"statevector": vec, "probabilities": probs, "meta": {"dim": len(vec)}}
-
-    def estimate_resources(self, wf: QuantumWorkflow) -> Dict[str, Any]:
-        """Estimate simple resources: gate counts, depth, width."""
-        qc = wf.to_qiskit()
-        return {
-            "depth": qc.depth(),
-            "width": qc.width(),
-            "gate_count": qc.count_ops(),
-        }
+        vec = state.data.tolist()
+        probs = (np.abs(state.data)**2).tolist()
+
+        return {"statevector": vec, "probabilities": probs, "meta": {"dim": len(vec), "engine": "aer"}}
+
+    def run_sweep(self, wf: QuantumWorkflow, param_grid: Dict[str, Any],
+                  outputs: Iterable[str] = ("probabilities",)) -> Dict[str, Any]:
+        """
+        Evaluate a workflow with symbolic rotation angles (params {"theta": "name"})
+        at every point of the Cartesian grid param_grid {"name": [values...]}.
+        outputs: "probabilities" (points x 2^n) and/or "expectations" (points x n, <Z>).
+        All points are simulated together as one batched state; returns NumPy arrays.
+        """
+        return ParameterSweep().run(wf, param_grid, outputs=outputs)
+
+    def run_many(self, workflows: Iterable[Any], shots: int = 1024,
+                 outputs: Iterable[str] = ("counts", "probabilities", "resources"),
+                 max_workers: Optional[int] = None, ordered: bool = True) -> List[Dict[str, Any]]:
+        """
+        Run many workflows (QuantumWorkflow objects or dicts) in a shared process pool
+        with one warm simulator per worker. Returns one entry per workflow, tagged
+        with id/index; failures become {"ok": False, "error": ...} entries.
+        max_workers caps how many of these workflows run at once; the pool size
+        itself is set with batch.configure_pool.
+        Use batch.iter_many to stream entries as they complete.
+        """
+        from .batch import iter_many
+        return list(iter_many(workflows, shots=shots, outputs=outputs,
+                              max_workers=max_workers, ordered=ordered))
+
+    def estimate_resources(self, wf: QuantumWorkflow, measure_all: bool = False) -> Dict[str, Any]:
+        """
+        Estimate simple resources: gate counts, depth, width (as Qiskit reports them
+        for wf.to_qiskit()), read from the workflow's running stats.
+        measure_all: include the final measure-all layer run_qasm adds to
+        workflows without measurements.
+        """
+        with stage("resources"):
+            stats = wf.stats
+            depth, gate_count = stats["depth"], stats["gate_count"]
+            if measure_all:
+                depth += 1
+                gate_count["measure"] = gate_count.get("measure", 0) + wf.num_qubits
+                gate_count = OrderedDict(sorted(gate_count.items(), key=lambda kv: kv[1], reverse=True))
+            return {"depth": depth, "width": stats["width"], "gate_count": gate_count}
+
+    def run(self, wf: QuantumWorkflow, shots: int = 1024,
+            outputs: Iterable[str] = RUN_OUTPUTS,
+            noise: Optional[Dict[str, Any]] = None,
+            engine: str = "numpy",
+            seed: Optional[int] = None,
+            max_outcomes: Optional[int] = None,
+            basis_states: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Simulate the workflow once and derive the requested outputs from that run.
+        outputs: any of "counts", "probabilities", "statevector", "resources", plus
+        "amplitudes" ({bitstring: amplitude} for basis_states, default the sampled
+        outcomes; numpy, memmap and mps engines only - mps never forms the dense state).
+        Without noise or mid-circuit measurement the statevector is computed by the
+        numpy engine and counts are sampled from it; if the statevector is not
+        requested and the workflow is Clifford-only, the stabilizer engine is used
+        instead. engine="memmap" does the same out of core, sampling counts block by
+        block (noiseless workflows with terminal measurements only). Noisy runs use
+        trajectories (statevector is None). Otherwise falls back to run_qasm /
+        run_statevector (Aer).
+        engine="stabilizer" / "trajectory" / "mps" sample with that engine (see
+        run_qasm; statevector is None) and "aer" always uses Aer. Any other name,
+        or an engine that cannot run the workflow, raises ValueError.
+        Counts are sampled with quantum_core.sampling; max_outcomes keeps only the
+        most frequent distinct outcomes.
+        Returns dict with the requested keys plus meta; "statevector" is a NumPy array.
+        """
+        outputs = set(outputs)
+        unknown = outputs.difference(RUN_OUTPUTS + EXTRA_OUTPUTS)
+        if unknown:
+            raise ValueError(f"Unknown outputs: {sorted(unknown)}")
+
+        if engine not in RUN_ENGINES:
+            raise ValueError(f"Unknown engine: {engine}")
+
+        single_pass = engine in ("numpy", "memmap") and not _is_noisy(noise) and not wf.has_mid_circuit_measurement()
+        if engine == "memmap" and not single_pass:
+            raise ValueError("memmap engine needs a noiseless workflow with terminal measurements")
+        if "amplitudes" in outputs and not (single_pass or engine == "mps"):
+            raise ValueError("amplitudes output needs a noiseless numpy, memmap or mps run")
+        result: Dict[str, Any] = {}
+
+        if engine == "mps":
+            if _is_noisy(noise):
+                raise ValueError("mps engine does not support noise")
+            sampled = self.run_mps(wf, shots=shots, seed=seed, max_outcomes=max_outcomes,
+                                   amplitudes="amplitudes" in outputs, basis_states=basis_states)
+            meta = sampled["meta"]
+            for key in ("counts", "probabilities", "amplitudes"):
+                if key in outputs:
+                    result[key] = sampled[key]
+            if "statevector" in outputs:
+                result["statevector"] = None
+        elif engine in SAMPLING_ENGINES:
+            # run_qasm raises if the engine cannot run this workflow
+            sampled = self.run_qasm(wf, shots=shots, noise=noise, engine=engine, seed=seed,
+                                    max_outcomes=max_outcomes)
+            meta = sampled["meta"]
+            for key in ("counts", "probabilities"):
+                if key in outputs:
+                    result[key] = sampled[key]
+            if "statevector" in outputs:
+                result["statevector"] = None
+        elif single_pass and not outputs & {"statevector", "amplitudes"} and self._stabilizer_applicable(wf, noise):
+            sampled = self.run_stabilizer(wf, shots=shots, seed=seed, max_outcomes=max_outcomes)
+            meta = sampled["meta"]
+            for key in ("counts", "probabilities"):
+                if key in outputs:
+                    result[key] = sampled[key]
+        elif single_pass:
+            if engine == "memmap":
+                out_of_core, engine_meta = self.memmap_engine.simulate(wf)
+                state = out_of_core.amplitudes
+            else:
+                out_of_core = None
+                state, engine_meta = self.numpy_engine.simulate(wf)
+            meta = {"shots": shots, "engine": engine, "dim": len(state), **engine_meta}
+            # amplitudes default to the sampled outcomes
+            if outputs & {"counts", "probabilities"} or ("amplitudes" in outputs and basis_states is None):
+                with stage("sampling"):
+                    if out_of_core is not None:
+                        counts = out_of_core.sample_counts(shots, wf.measured_qubits(), seed=seed,
+                                                           max_outcomes=max_outcomes)
+                    else:
+                        counts = sample_counts(np.abs(state) ** 2, shots, wf.num_qubits, wf.measured_qubits(),
+                                               seed=seed, max_outcomes=max_outcomes)
+                if "counts" in outputs:
+                    result["counts"] = counts
+                if "probabilities" in outputs:
+                    result["probabilities"] = counts_to_probabilities(counts, shots)
+            if "amplitudes" in outputs:
+                result["amplitudes"] = read_amplitudes(
+                    state.__getitem__, counts if basis_states is None else basis_states, wf.num_qubits)
+            if "statevector" in outputs:
+                result["statevector"] = state
+        elif engine == "numpy" and self._trajectory_applicable(wf, noise):
+            qasm = self.run_qasm(wf, shots=shots, noise=noise, engine="trajectory", seed=seed,
+                                 max_outcomes=max_outcomes)
+            meta = qasm["meta"]
+            for key in ("counts", "probabilities"):
+                if key in outputs:
+                    result[key] = qasm[key]
+            if "statevector" in outputs:
+                # a noisy (mixed) state has no statevector
+                result["statevector"] = None
+        else:
+            meta = {"shots": shots, "engine": "aer"}
+            if "counts" in outputs or "probabilities" in outputs:
+                qasm = self.run_qasm(wf, shots=shots, noise=noise, engine="aer", seed=seed,
+                                     max_outcomes=max_outcomes)
+                meta.update(qasm["meta"])
+                if "counts" in outputs:
+                    result["counts"] = qasm["counts"]
+                if "probabilities" in outputs:
+                    result["probabilities"] = qasm["probabilities"]
+            if "statevector" in outputs:
+                sv = self.run_statevector(wf, noise=noise, shots=shots)
+                result["statevector"] = np.asarray(sv["statevector"])
+                meta["dim"] = sv["meta"]["dim"]
+
+        if "resources" in outputs:
+            result["resources"] = self.estimate_resources(wf)
+        result["meta"] = meta
+        return result
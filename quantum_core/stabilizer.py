@@ -0,0 +1,174 @@
+# quantum_core/stabilizer.py
+"""
+StabilizerSimulator
+- CHP-style (Aaronson-Gottesman) tableau simulation for Clifford-only workflows
+  (H, X, Y, Z, S, CX + terminal MEASURE).
+- Gate updates are O(n) vectorized column operations on the stabilizer rows.
+- Measurement sampling reduces the tableau once (O(n^3) bit operations) to the
+  affine subspace of possible outcomes, then draws any number of shots by
+  sampling its free bits; memory is O(n^2 + shots * n) rather than O(2^n).
+"""
+
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+
+from .sampling import count_bits, counts_to_probabilities
+from .workflow import QuantumWorkflow
+
+CLIFFORD_GATES = {"H", "X", "Y", "Z", "S", "CX", "MEASURE"}
+
+
+def is_clifford(wf: QuantumWorkflow) -> bool:
+    """True if every op in the workflow is a supported Clifford gate."""
+    return all(name in CLIFFORD_GATES for name, _, _ in wf.ops())
+
+
+class StabilizerTableau:
+    def __init__(self, num_qubits: int):
+        """
+        Stabilizer generators of |0...0>: row i is Z on qubit i.
+        x/z are (generators x qubits) bit matrices, r holds the sign bits.
+        """
+        self.num_qubits = num_qubits
+        self.x = np.zeros((num_qubits, num_qubits), dtype=bool)
+        self.z = np.eye(num_qubits, dtype=bool)
+        self.r = np.zeros(num_qubits, dtype=bool)
+
+    def h(self, a: int):
+        xa, za = self.x[:, a], self.z[:, a]
+        self.r ^= xa & za
+        self.x[:, a], self.z[:, a] = za.copy(), xa.copy()
+
+    def s(self, a: int):
+        xa = self.x[:, a]
+        self.r ^= xa & self.z[:, a]
+        self.z[:, a] ^= xa
+
+    def x_gate(self, a: int):
+        self.r ^= self.z[:, a]
+
+    def z_gate(self, a: int):
+        self.r ^= self.x[:, a]
+
+    def y_gate(self, a: int):
+        self.r ^= self.x[:, a] ^ self.z[:, a]
+
+    def cx(self, a: int, b: int):
+        xa, xb, za, zb = self.x[:, a], self.x[:, b], self.z[:, a], self.z[:, b]
+        self.r ^= xa & zb & ~(xb ^ za)
+        self.x[:, b] ^= xa
+        self.z[:, a] ^= zb
+
+    def apply(self, name: str, qubits: Tuple[int, ...]):
+        if name == "H":
+            self.h(qubits[0])
+        elif name == "S":
+            self.s(qubits[0])
+        elif name == "X":
+            self.x_gate(qubits[0])
+        elif name == "Y":
+            self.y_gate(qubits[0])
+        elif name == "Z":
+            self.z_gate(qubits[0])
+        elif name == "CX":
+            self.cx(qubits[0], qubits[1])
+        elif name != "MEASURE":
+            raise ValueError(f"Non-Clifford gate in stabilizer simulation: {name}")
+
+    @staticmethod
+    def _rowsum(x, z, r, rows, pivot):
+        """Multiply generator `pivot` into each generator in `rows` (phase-tracked)."""
+        x1, z1 = x[pivot].astype(np.int8), z[pivot].astype(np.int8)
+        x2, z2 = x[rows].astype(np.int8), z[rows].astype(np.int8)
+        # g() from Aaronson-Gottesman: exponent of i picked up per qubit
+        g = (x1 & z1) * (z2 - x2) \
+            + (x1 & (1 - z1)) * z2 * (2 * x2 - 1) \
+            + ((1 - x1) & z1) * x2 * (1 - 2 * z2)
+        total = 2 * r[rows].astype(np.int64) + 2 * int(r[pivot]) + g.sum(axis=1, dtype=np.int64)
+        r[rows] = (total % 4) == 2
+        x[rows] ^= x[pivot]
+        z[rows] ^= z[pivot]
+
+    def outcome_space(self) -> Tuple[np.ndarray, np.ndarray, List[int], List[int]]:
+        """
+        Describe the computational-basis outcome distribution, which is uniform
+        over an affine subspace: bits[pivots] = rhs ^ (A @ bits[free]) mod 2.
+        Returns (A, rhs, pivots, free).
+        """
+        n = self.num_qubits
+        x, z, r = self.x.copy(), self.z.copy(), self.r.copy()
+
+        # 1. eliminate the X block; rows left without X are Z-type stabilizers
+        rank = 0
+        for col in range(n):
+            candidates = np.flatnonzero(x[rank:, col]) + rank
+            if candidates.size == 0:
+                continue
+            p = candidates[0]
+            if p != rank:
+                for arr in (x, z, r):
+                    arr[[rank, p]] = arr[[p, rank]]
+            others = np.flatnonzero(x[:, col])
+            others = others[others != rank]
+            if others.size:
+                self._rowsum(x, z, r, others, rank)
+            rank += 1
+            if rank == n:
+                break
+
+        # 2. Z-type stabilizers (-1)^r Z^v give parity constraints v . bits = r
+        a = z[rank:].copy()
+        rhs = r[rank:].copy()
+        pivots = []
+        row = 0
+        for col in range(n):
+            if row == a.shape[0]:
+                break
+            candidates = np.flatnonzero(a[row:, col]) + row
+            if candidates.size == 0:
+                continue
+            p = candidates[0]
+            if p != row:
+                a[[row, p]] = a[[p, row]]
+                rhs[[row, p]] = rhs[[p, row]]
+            others = np.flatnonzero(a[:, col])
+            others = others[others != row]
+            a[others] ^= a[row]
+            rhs[others] ^= rhs[row]
+            pivots.append(col)
+            row += 1
+
+        free = [q for q in range(n) if q not in set(pivots)]
+        return a[:row][:, free], rhs[:row], pivots, free
+
+    def sample(self, shots: int, seed: Optional[int] = None) -> np.ndarray:
+        """Draw `shots` measurement outcomes of all qubits as a (shots, n) bool array."""
+        a, rhs, pivots, free = self.outcome_space()
+        rng = np.random.default_rng(seed)
+        bits = np.zeros((shots, self.num_qubits), dtype=bool)
+        if free:
+            f = rng.integers(0, 2, size=(shots, len(free)), dtype=np.int64)
+            bits[:, free] = f.astype(bool)
+            parity = (f @ a.T.astype(np.int64)) & 1
+        else:
+            parity = np.zeros((shots, len(pivots)), dtype=np.int64)
+        if pivots:
+            bits[:, pivots] = parity.astype(bool) ^ rhs
+        return bits
+
+
+class StabilizerSimulator:
+    def run(self, wf: QuantumWorkflow, shots: int = 1024,
+            seed: Optional[int] = None, max_outcomes: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Simulate a Clifford-only workflow with terminal measurements.
+        Returns counts and probabilities in run_qasm format.
+        """
+        if wf.has_mid_circuit_measurement():
+            raise ValueError("Stabilizer engine requires terminal measurements only")
+        tableau = StabilizerTableau(wf.num_qubits)
+        for name, qubits, _ in wf.ops():
+            tableau.apply(name, qubits)
+        counts = count_bits(tableau.sample, shots, wf.num_qubits, wf.measured_qubits(),
+                            seed=seed, max_outcomes=max_outcomes)
+        return {"counts": counts, "probabilities": counts_to_probabilities(counts, shots)}
@@ -0,0 +1,118 @@
+# quantum_core/startup.py
+"""
+Cold start
+- Heavy dependencies (qiskit, qiskit_aer, google.generativeai) are imported on
+  first use by the modules that need them; nothing in quantum_core loads them at
+  import time.
+- warm_up() pays those costs up front for one simulator per worker: it imports
+  the Qiskit stack, creates the Aer backend and runs a tiny workflow.
+- Forking while a warm-up thread holds the import lock deadlocks the child, so
+  code that forks workers calls wait_for_warm_up() first.
+- startup_report() shows where start-up time went: per-step warm-up times, the
+  process age when the worker was marked ready, and which heavy modules are loaded.
+"""
+
+from typing import Dict, Any, Optional, Sequence
+from contextlib import contextmanager
+from importlib import import_module
+import logging
+import sys
+import threading
+import time
+
+HEAVY_MODULES = ("qiskit", "qiskit_aer", "google.generativeai")
+# what warm_up() imports by default; the AI client is left to its first use
+WARM_MODULES = ("qiskit", "qiskit_aer")
+
+_lock = threading.Lock()
+# cleared while a warm-up is running
+_idle = threading.Event()
+_idle.set()
+_report: Dict[str, Any] = {"ready_after": None, "warm_up": {}, "warm_up_total": None, "warm_up_error": None}
+
+
+def _process_age() -> Optional[float]:
+    """Seconds since the process started (None without psutil)."""
+    try:
+        import psutil
+        return time.time() - psutil.Process().create_time()
+    except Exception:
+        return None
+
+
+@contextmanager
+def _step(name: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        with _lock:
+            _report["warm_up"][name] = (time.perf_counter() - start) * 1000
+
+
+def mark_ready():
+    """Record how long after process start the worker became ready to serve."""
+    age = _process_age()
+    with _lock:
+        _report["ready_after"] = age * 1000 if age is not None else None
+
+
+def warm_up(simulator=None, modules: Sequence[str] = WARM_MODULES):
+    """
+    Import `modules`, create the Aer backend and run a 2-qubit workflow through
+    `simulator` (a new QuantumSimulator if None). Returns the warmed simulator.
+    """
+    from .simulator import QuantumSimulator
+    from .workflow import QuantumWorkflow
+
+    _idle.clear()
+    start = time.perf_counter()
+    try:
+        for name in modules:
+            with _step(f"import {name}"):
+                import_module(name)
+        with _step("simulator"):
+            simulator = simulator or QuantumSimulator()
+            simulator.simulator  # creates the Aer backend
+        with _step("first_run"):
+            wf = QuantumWorkflow(2)
+            wf.add_gate("H", targets=[0])
+            wf.add_gate("CX", targets=[1], controls=[0])
+            wf.add_gate("MEASURE", targets=[0, 1])
+            simulator.run(wf, shots=16, seed=0)
+    except Exception as e:
+        with _lock:
+            _report["warm_up_error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        with _lock:
+            _report["warm_up_total"] = (time.perf_counter() - start) * 1000
+        _idle.set()
+    return simulator
+
+
+def warm_up_in_background(simulator=None, modules: Sequence[str] = WARM_MODULES) -> threading.Thread:
+    """Run warm_up() on a daemon thread so the worker can serve while it runs."""
+    def target():
+        try:
+            warm_up(simulator, modules)
+        except Exception as e:
+            logging.getLogger(__name__).warning("Warm-up failed: %s", e)
+
+    _idle.clear()
+    thread = threading.Thread(target=target, name="qveda-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def wait_for_warm_up(timeout: Optional[float] = None) -> bool:
+    """Block until no warm-up is running; False if `timeout` expired first."""
+    return _idle.wait(timeout)
+
+
+def startup_report() -> Dict[str, Any]:
+    """Start-up timings (ms) and the heavy modules currently imported."""
+    with _lock:
+        report = {**_report, "warm_up": dict(_report["warm_up"])}
+    report["loaded_modules"] = [m for m in HEAVY_MODULES if m in sys.modules]
+    return report
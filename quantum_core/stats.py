@@ -0,0 +1,65 @@
+# quantum_core/stats.py
+"""
+CircuitStats
+- Running depth, gate counts and two-qubit-gate count for a stream of
+  operations, updated in O(qubits touched) per operation.
+- Depth follows Qiskit's QuantumCircuit.depth(): every operation starts one
+  layer after the latest operation on any of its qubits or classical bits, and
+  directives such as barriers are counted and align the wires they cover
+  without taking a layer.
+- gate_count() has count_ops() ordering (most frequent first, ties in order of
+  first appearance).
+"""
+
+from typing import Dict, List, Sequence
+from collections import OrderedDict
+
+
+class CircuitStats:
+    def __init__(self, num_qubits: int = 0, num_clbits: int = 0):
+        # per-wire layer of the last operation (the layer frontier)
+        self.qubit_depth: List[int] = [0] * num_qubits
+        self.clbit_depth: List[int] = [0] * num_clbits
+        self.depth = 0
+        self.num_ops = 0
+        self.two_qubit_gates = 0
+        self._counts: Dict[str, int] = {}
+
+    def add_qubits(self, count: int):
+        self.qubit_depth.extend([0] * count)
+
+    def add_clbits(self, count: int):
+        self.clbit_depth.extend([0] * count)
+
+    def record(self, name: str, qubits: Sequence[int], clbits: Sequence[int] = ()):
+        """Add one operation `name` (Qiskit lower-case name) on `qubits` / `clbits`."""
+        frontier = self.qubit_depth
+        if len(qubits) == 1 and not clbits:
+            level = frontier[qubits[0]] + 1
+        else:
+            level = 1 + max([frontier[q] for q in qubits] + [self.clbit_depth[c] for c in clbits])
+        for q in qubits:
+            frontier[q] = level
+        for c in clbits:
+            self.clbit_depth[c] = level
+        if level > self.depth:
+            self.depth = level
+        if len(qubits) == 2:
+            self.two_qubit_gates += 1
+        self.num_ops += 1
+        self._counts[name] = self._counts.get(name, 0) + 1
+
+    def count(self, name: str, amount: int = 1):
+        """Count a directive (e.g. barrier) without giving it a layer."""
+        self._counts[name] = self._counts.get(name, 0) + amount
+
+    def directive(self, name: str, qubits: Sequence[int]):
+        """Count a directive on `qubits` and raise their frontiers to the latest among them."""
+        if qubits:
+            level = max(self.qubit_depth[q] for q in qubits)
+            for q in qubits:
+                self.qubit_depth[q] = level
+        self.count(name)
+
+    def gate_count(self) -> "OrderedDict[str, int]":
+        return OrderedDict(sorted(self._counts.items(), key=lambda kv: kv[1], reverse=True))
@@ -0,0 +1,107 @@
+# quantum_core/sweep.py
+"""
+ParameterSweep
+- Evaluates a workflow over a grid of RX/RY/RZ angles in one vectorized pass.
+- Angles are symbolic when a gate's params hold a name instead of a number,
+  e.g. {"name": "RY", "targets": [0], "params": {"theta": "a"}}.
+- The grid points form a batch axis on the state: a (points, 2^n) array where
+  symbolic rotations apply a different 2x2 matrix per row.
+"""
+
+from typing import Dict, Any, Iterable, List, Sequence
+import itertools
+import numpy as np
+
+from .gates import gate_matrix, rotation_matrices, ROTATION_GATES
+from .numpy_engine import apply_controlled_1q_batch
+from .workflow import QuantumWorkflow
+
+SWEEP_OUTPUTS = ("probabilities", "expectations")
+
+
+def symbolic_parameters(wf: QuantumWorkflow) -> List[str]:
+    """Return the symbol names used as rotation angles, in order of first use."""
+    names = []
+    for name, _, params in wf.ops():
+        theta = params.get("theta")
+        if name in ROTATION_GATES and isinstance(theta, str) and theta not in names:
+            names.append(theta)
+    return names
+
+
+def grid_points(param_grid: Dict[str, Sequence[float]], names: Sequence[str]) -> np.ndarray:
+    """Cartesian product of the grid values, as a (points, len(names)) array."""
+    missing = [n for n in names if n not in param_grid]
+    if missing:
+        raise ValueError(f"No values given for parameters: {missing}")
+    axes = [np.asarray(param_grid[n], dtype=float).ravel() for n in names]
+    if not axes:
+        return np.zeros((1, 0))
+    return np.array(list(itertools.product(*axes)), dtype=float).reshape(-1, len(names))
+
+
+def z_expectations(probs: np.ndarray, num_qubits: int) -> np.ndarray:
+    """<Z_q> for every qubit of every row of a (points, 2^n) probability array."""
+    rows = probs.shape[0]
+    out = np.empty((rows, num_qubits))
+    for q in range(num_qubits):
+        split = probs.reshape(rows, 2 ** (num_qubits - 1 - q), 2, 2 ** q)
+        out[:, q] = split[:, :, 0, :].sum(axis=(1, 2)) - split[:, :, 1, :].sum(axis=(1, 2))
+    return out
+
+
+class ParameterSweep:
+    def __init__(self, memory_budget: int = 256 * 1024 ** 2, dtype=np.complex128):
+        """memory_budget: bytes allowed for one batch of swept states."""
+        self.memory_budget = memory_budget
+        self.dtype = dtype
+
+    def run(self, wf: QuantumWorkflow, param_grid: Dict[str, Sequence[float]],
+            outputs: Iterable[str] = ("probabilities",)) -> Dict[str, Any]:
+        """
+        Evaluate the workflow at every point of param_grid (measurements skipped).
+        Returns parameters (names), points (points x params) and the requested
+        outputs as arrays: probabilities (points x 2^n), expectations (points x n, <Z>).
+        """
+        outputs = set(outputs)
+        unknown = outputs.difference(SWEEP_OUTPUTS)
+        if unknown:
+            raise ValueError(f"Unknown sweep outputs: {sorted(unknown)}")
+
+        n = wf.num_qubits
+        dim = 2 ** n
+        names = symbolic_parameters(wf)
+        points = grid_points(param_grid, names)
+        column = {name: i for i, name in enumerate(names)}
+        ops = [op for op in wf.ops() if op[0] != "MEASURE"]
+
+        itemsize = np.dtype(self.dtype).itemsize
+        batch_size = int(max(1, self.memory_budget // (dim * itemsize)))
+        result: Dict[str, Any] = {"parameters": names, "points": points}
+        chunks = {key: [] for key in outputs}
+
+        for start in range(0, len(points), batch_size):
+            chunk = points[start:start + batch_size]
+            states = np.zeros((len(chunk), dim), dtype=self.dtype)
+            states[:, 0] = 1
+            for name, qubits, params in ops:
+                theta = params.get("theta")
+                if name in ROTATION_GATES and isinstance(theta, str):
+                    u = rotation_matrices(name, chunk[:, column[theta]]).astype(self.dtype)
+                else:
+                    u = gate_matrix(name, params).astype(self.dtype)
+                apply_controlled_1q_batch(states, u, qubits[:-1], qubits[-1], n)
+            probs = np.abs(states) ** 2
+            if "probabilities" in outputs:
+                chunks["probabilities"].append(probs)
+            if "expectations" in outputs:
+                chunks["expectations"].append(z_expectations(probs, n))
+
+        for key, parts in chunks.items():
+            result[key] = np.concatenate(parts, axis=0)
+        result["meta"] = {
+            "engine": "numpy-sweep",
+            "num_points": len(points),
+            "batch_size": batch_size,
+        }
+        return result
@@ -0,0 +1,130 @@
+# quantum_core/trajectories.py
+"""
+TrajectorySimulator
+- Monte Carlo (quantum trajectory) simulation of the depolarizing / bitflip noise
+  models built by backends.build_noise_model.
+- Trajectories are pure states evolved together as a (batch, 2^n) array; Pauli
+  errors are sampled per trajectory after each noisy gate.
+- Memory is bounded by a byte budget (batch size shrinks to 1 for wide circuits),
+  so the footprint stays statevector-sized instead of the 4^n of a density matrix.
+- Returns trajectory-averaged probabilities with 95% confidence half-widths and,
+  for small circuits, the averaged density matrix.
+"""
+
+from typing import Dict, Any, Optional
+import numpy as np
+
+from .gates import gate_matrix, FIXED_GATES
+from .numpy_engine import apply_controlled_1q_batch
+from .workflow import QuantumWorkflow
+
+# Gates that receive an error, mirroring backends.NOISE_GATES
+NOISY_GATES = {
+    "depolarizing": ({"RX", "RZ", "X", "H", "S", "T"}, {"CX"}),
+    "bitflip": ({"RX", "RZ", "H", "X"}, set()),
+}
+
+_PAULIS = np.stack([np.eye(2, dtype=complex), FIXED_GATES["X"], FIXED_GATES["Y"], FIXED_GATES["Z"]])
+
+# averaged density matrices are only built up to this many qubits (4^n entries)
+DENSITY_MATRIX_MAX_QUBITS = 10
+
+
+class TrajectorySimulator:
+    def __init__(self, trajectories: int = 512, memory_budget: int = 256 * 1024 ** 2,
+                 dtype=np.complex128):
+        """
+        trajectories: number of pure-state trajectories to average.
+        memory_budget: bytes allowed for one batch of trajectory states.
+        """
+        if trajectories < 1:
+            raise ValueError("trajectories must be >= 1")
+        self.trajectories = trajectories
+        self.memory_budget = memory_budget
+        self.dtype = dtype
+
+    @staticmethod
+    def _parse_noise(noise: Dict[str, Any]):
+        mode = noise.get("mode")
+        if mode not in NOISY_GATES:
+            raise ValueError(f"Unsupported noise mode for trajectories: {mode}")
+        return mode, float(noise.get("p", 0.0))
+
+    def _inject(self, states: np.ndarray, mode: str, p: float, qubits, n: int, rng):
+        """Apply one sampled Pauli error per trajectory on `qubits` (in place)."""
+        batch = states.shape[0]
+        hit = rng.random(batch) < p
+        if not hit.any():
+            return
+        rows = np.flatnonzero(hit)
+        sub = states[rows]
+        if mode == "bitflip":
+            apply_controlled_1q_batch(sub, FIXED_GATES["X"], (), qubits[0], n)
+        else:
+            # depolarizing_error(p, k): a uniformly random k-qubit Pauli (identity included)
+            for q in qubits:
+                choice = rng.integers(0, 4, size=rows.size)
+                if np.any(choice):
+                    apply_controlled_1q_batch(sub, _PAULIS[choice], (), q, n)
+        states[rows] = sub
+
+    def run(self, wf: QuantumWorkflow, noise: Dict[str, Any], seed: Optional[int] = None,
+            density_matrix: bool = False) -> Dict[str, Any]:
+        """
+        Average `trajectories` noisy runs of the workflow (measurements skipped).
+        Returns probabilities (np.ndarray), probabilities_ci (95% half-widths),
+        optionally density_matrix, and meta.
+        """
+        mode, p = self._parse_noise(noise)
+        noisy_1q, noisy_2q = NOISY_GATES[mode]
+        n = wf.num_qubits
+        dim = 2 ** n
+        itemsize = np.dtype(self.dtype).itemsize
+        batch_size = int(max(1, min(self.trajectories, self.memory_budget // (dim * itemsize))))
+        want_rho = density_matrix and n <= DENSITY_MATRIX_MAX_QUBITS
+
+        ops = [op for op in wf.ops() if op[0] != "MEASURE"]
+        matrices = [gate_matrix(name, params).astype(self.dtype) for name, _, params in ops]
+        rng = np.random.default_rng(seed)
+
+        sum_p = np.zeros(dim)
+        sum_p2 = np.zeros(dim)
+        rho = np.zeros((dim, dim), dtype=self.dtype) if want_rho else None
+
+        done = 0
+        while done < self.trajectories:
+            batch = min(batch_size, self.trajectories - done)
+            states = np.zeros((batch, dim), dtype=self.dtype)
+            states[:, 0] = 1
+            for (name, qubits, _), u in zip(ops, matrices):
+                apply_controlled_1q_batch(states, u, qubits[:-1], qubits[-1], n)
+                if p > 0 and (name in noisy_1q or name in noisy_2q):
+                    self._inject(states, mode, p, qubits, n, rng)
+            probs = np.abs(states) ** 2
+            sum_p += probs.sum(axis=0)
+            sum_p2 += (probs ** 2).sum(axis=0)
+            if want_rho:
+                rho += states.T @ states.conj()
+            done += batch
+
+        t = self.trajectories
+        mean = sum_p / t
+        if t > 1:
+            var = np.maximum(sum_p2 / t - mean ** 2, 0.0) * t / (t - 1)
+            ci = 1.96 * np.sqrt(var / t)
+        else:
+            ci = np.full(dim, np.nan)
+
+        result = {
+            "probabilities": mean,
+            "probabilities_ci": ci,
+            "meta": {
+                "engine": "trajectory",
+                "trajectories": t,
+                "batch_size": batch_size,
+                "noise": {"mode": mode, "p": p},
+            },
+        }
+        if want_rho:
+            result["density_matrix"] = rho / t
+        return result
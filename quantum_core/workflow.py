@@ -4,11 +4,23 @@ QuantumWorkflow
 - High-level wrapper to create quantum circuits from structured descriptions.
 - Supports constructing circuits programmatically or from JSON-like dicts.
 - Provides validation and utilities for export.
+- Gates are stored as parallel arrays (opcode, -1-padded target/control indices,
+  theta); `gates` is a read-only list-of-dicts view over them for compatibility.
+- Depth, gate counts and two-qubit-gate count are maintained as gates are added
+  (see stats.py) and exposed through `stats`, without building a Qiskit circuit.
 """
 
-from typing import List, Dict, Any, Optional
-from qiskit import QuantumCircuit
+from typing import TYPE_CHECKING, List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple
+from collections.abc import Sequence as SequenceABC
+from itertools import chain
 import json
+import numpy as np
+
+from .optimizer import peephole_optimize
+from .stats import CircuitStats
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
 
 
 SUPPORTED_GATES = {
@@ -18,15 +30,180 @@ SUPPORTED_GATES = {
     "MEASURE",
 }
 
+# opcode -> gate name, and the reverse lookup
+OPCODES: Tuple[str, ...] = tuple(sorted(SUPPORTED_GATES))
+OPCODE_INDEX: Dict[str, int] = {name: i for i, name in enumerate(OPCODES)}
+
+
+def expand_gate(gate: Dict[str, Any]) -> List[Tuple[str, Tuple[int, ...], Dict[str, Any]]]:
+    """
+    Expand one stored gate dict into primitive operations.
+    Each op is (name, qubits, params) where qubits lists the controls first and
+    the target last. Multi-target gates become one op per target, CNOT is
+    normalized to CX, and MEASURE yields one op per measured qubit.
+    Mirrors the conventions used by to_qiskit.
+    """
+    return expand(gate["name"], gate["targets"], gate["controls"], gate["params"])
+
+
+def expand(name: str, targets: Sequence[int], controls: Sequence[int],
+           params: Dict[str, Any]) -> List[Tuple[str, Tuple[int, ...], Dict[str, Any]]]:
+    """expand_gate on unpacked fields."""
+    if name in ("CX", "CNOT"):
+        if controls and targets and len(controls) == len(targets):
+            return [("CX", (ctrl, tgt), params) for ctrl, tgt in zip(controls, targets)]
+        if len(targets) == 2 and not controls:
+            return [("CX", (targets[0], targets[1]), params)]
+        raise ValueError("CNOT requires control(s) and target(s) or two-element targets")
+    if name == "CCX":
+        if len(controls) >= 2 and len(targets) >= 1:
+            return [("CCX", (controls[0], controls[1], targets[0]), params)]
+        raise ValueError("CCX requires two controls and one target")
+    if name in SUPPORTED_GATES:
+        return [(name, (t,), params) for t in targets]
+    raise ValueError(f"Unhandled gate: {name}")
+
+
+def op_to_gate(name: str, qubits: Tuple[int, ...], params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Inverse of expand_gate for a single primitive op."""
+    return {
+        "name": name,
+        "targets": [qubits[-1]],
+        "controls": list(qubits[:-1]),
+        "params": dict(params or {}),
+    }
+
+
+class GateView(SequenceABC):
+    """Read-only list-of-dicts view of a workflow's gate arrays (dicts built on access)."""
+
+    def __init__(self, wf: "QuantumWorkflow"):
+        self._wf = wf
+
+    def __len__(self):
+        return self._wf._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("gate index out of range")
+        name, targets, controls, params = self._wf._row(index)
+        return {"name": name, "targets": targets, "controls": controls, "params": params}
+
+    def __iter__(self):
+        for name, targets, controls, params in self._wf._rows():
+            yield {"name": name, "targets": targets, "controls": controls, "params": params}
+
+    def __repr__(self):
+        return repr(list(self))
+
 
 class QuantumWorkflow:
     def __init__(self, num_qubits: int, meta: Optional[Dict[str, Any]] = None):
         if num_qubits <= 0:
             raise ValueError("num_qubits must be >= 1")
         self.num_qubits = num_qubits
-        # store gates as list of dicts (preserve order)
-        self.gates: List[Dict[str, Any]] = []
+        # gates as parallel arrays (preserve order); rows [0, _size) are in use
+        self._size = 0
+        self._opcode = np.zeros(0, dtype=np.int8)
+        self._targets = np.full((0, 1), -1, dtype=np.int32)
+        self._controls = np.full((0, 2), -1, dtype=np.int32)
+        self._theta = np.zeros(0, dtype=np.float64)  # NaN: no theta param
+        # params that are not a single numeric theta (e.g. symbolic sweep angles), by row
+        self._extra_params: Dict[int, Dict[str, Any]] = {}
         self.meta = meta or {}
+        # running depth / counts; _stats_error is set once a gate cannot be expanded
+        self._stats = CircuitStats(num_qubits, num_clbits=num_qubits)
+        self._stats_error: Optional[str] = None
+
+    @property
+    def gates(self) -> GateView:
+        """Gates as {"name", "targets", "controls", "params"} dicts (read-only view)."""
+        return GateView(self)
+
+    def gate_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Views of the stored arrays: opcode (index into OPCODES), targets and
+        controls (rows padded with -1) and theta (NaN where absent or symbolic).
+        """
+        n = self._size
+        return {
+            "opcode": self._opcode[:n],
+            "targets": self._targets[:n],
+            "controls": self._controls[:n],
+            "theta": self._theta[:n],
+        }
+
+    def extra_params(self) -> Dict[int, Dict[str, Any]]:
+        """Params not stored in the theta column (symbolic or multi-key), by gate row."""
+        return {i: dict(p) for i, p in self._extra_params.items()}
+
+    def _reserve(self, count: int, target_width: int, control_width: int):
+        """Make room for `count` more rows at least the given index widths."""
+        needed = self._size + count
+        capacity = self._opcode.size
+        if needed > capacity:
+            capacity = max(needed, 2 * capacity, 16)
+        target_width = max(target_width, self._targets.shape[1])
+        control_width = max(control_width, self._controls.shape[1])
+        if capacity != self._opcode.size or target_width != self._targets.shape[1] \
+                or control_width != self._controls.shape[1]:
+            n = self._size
+            opcode = np.zeros(capacity, dtype=np.int8)
+            opcode[:n] = self._opcode[:n]
+            theta = np.zeros(capacity, dtype=np.float64)
+            theta[:n] = self._theta[:n]
+            targets = np.full((capacity, target_width), -1, dtype=np.int32)
+            targets[:n, :self._targets.shape[1]] = self._targets[:n]
+            controls = np.full((capacity, control_width), -1, dtype=np.int32)
+            controls[:n, :self._controls.shape[1]] = self._controls[:n]
+            self._opcode, self._theta, self._targets, self._controls = opcode, theta, targets, controls
+
+    @staticmethod
+    def _split_params(params: Dict[str, Any]):
+        """(theta, extra) storage for a params dict."""
+        if not params:
+            return np.nan, None
+        theta = params.get("theta")
+        if len(params) == 1 and isinstance(theta, (int, float)) and not isinstance(theta, bool):
+            return float(theta), None
+        return np.nan, dict(params)
+
+    def _row(self, i: int):
+        """(name, targets, controls, params) of stored row i."""
+        targets = self._targets[i]
+        controls = self._controls[i]
+        return (
+            OPCODES[self._opcode[i]],
+            targets[targets >= 0].tolist(),
+            controls[controls >= 0].tolist(),
+            self._params(i, self._theta[i]),
+        )
+
+    def _params(self, i: int, theta: float) -> Dict[str, Any]:
+        extra = self._extra_params.get(i)
+        if extra is not None:
+            return dict(extra)
+        return {} if theta != theta else {"theta": theta}
+
+    def _rows(self) -> Iterator[Tuple[str, List[int], List[int], Dict[str, Any]]]:
+        """Iterate (name, targets, controls, params) over all rows."""
+        n = self._size
+        codes = self._opcode[:n].tolist()
+        targets = self._targets[:n].tolist()
+        controls = self._controls[:n].tolist()
+        thetas = self._theta[:n].tolist()
+        for i in range(n):
+            t, c = targets[i], controls[i]
+            yield (
+                OPCODES[codes[i]],
+                [q for q in t if q >= 0],
+                [q for q in c if q >= 0],
+                self._params(i, thetas[i]),
+            )
 
     def add_gate(self, name: str,
                  targets: Optional[List[int]] = None,
@@ -46,15 +223,71 @@ class QuantumWorkflow:
         controls = controls or []
         params = params or {}
         # Basic validation of indices
-        for q in (targets + controls):
+        for q in (list(targets) + list(controls)):
             if q < 0 or q >= self.num_qubits:
                 raise IndexError(f"Qubit index {q} out of range for {self.num_qubits} qubits")
-        self.gates.append({
-            "name": name,
-            "targets": targets,
-            "controls": controls,
-            "params": params
-        })
+        self._reserve(1, len(targets), len(controls))
+        i = self._size
+        self._opcode[i] = OPCODE_INDEX[name]
+        self._targets[i, :len(targets)] = targets
+        self._controls[i, :len(controls)] = controls
+        self._theta[i], extra = self._split_params(params)
+        if extra is not None:
+            self._extra_params[i] = extra
+        self._size += 1
+        self._record_stats(i, i + 1)
+
+    def extend(self, gates: Iterable[Dict[str, Any]]):
+        """
+        Bulk-append gate dicts ({"name", "targets", "controls", "params"}).
+        Names and qubit indices of all gates are validated in one vectorized pass
+        before anything is stored, so a bad gate leaves the workflow unchanged.
+        """
+        gates = list(gates)
+        count = len(gates)
+        if not count:
+            return
+        names = [str(g.get("name")).upper() for g in gates]
+        try:
+            codes = np.fromiter((OPCODE_INDEX[name] for name in names), dtype=np.int8, count=count)
+        except KeyError as e:
+            raise ValueError(f"Unsupported gate: {e.args[0]}") from None
+
+        padded = []
+        for key in ("targets", "controls"):
+            lists = [g.get(key) or [] for g in gates]
+            lengths = np.fromiter(map(len, lists), dtype=np.int64, count=count)
+            flat = np.fromiter(chain.from_iterable(lists), dtype=np.int64, count=int(lengths.sum()))
+            bad = (flat < 0) | (flat >= self.num_qubits)
+            if bad.any():
+                q = flat[np.argmax(bad)]
+                raise IndexError(f"Qubit index {q} out of range for {self.num_qubits} qubits")
+            width = max(int(lengths.max()), 1)
+            out = np.full((count, width), -1, dtype=np.int32)
+            starts = np.cumsum(lengths) - lengths
+            out[np.repeat(np.arange(count), lengths),
+                np.arange(flat.size) - np.repeat(starts, lengths)] = flat
+            padded.append(out)
+        targets, controls = padded
+
+        theta = np.full(count, np.nan)
+        extras = {}
+        for i, g in enumerate(gates):
+            params = g.get("params")
+            if params:
+                theta[i], extra = self._split_params(params)
+                if extra is not None:
+                    extras[self._size + i] = extra
+
+        self._reserve(count, targets.shape[1], controls.shape[1])
+        rows = slice(self._size, self._size + count)
+        self._opcode[rows] = codes
+        self._targets[rows, :targets.shape[1]] = targets
+        self._controls[rows, :controls.shape[1]] = controls
+        self._theta[rows] = theta
+        self._extra_params.update(extras)
+        self._size += count
+        self._record_stats(self._size - count, self._size)
 
     def from_dict(self, data: Dict[str, Any]):
         """Load workflow from a JSON-like dict { 'qubits': int, 'gates': [...] }"""
@@ -63,30 +296,123 @@ class QuantumWorkflow:
             raise ValueError("Missing 'qubits' key")
         if q != self.num_qubits:
             raise ValueError("Mismatched qubit count")
-        gates = data.get("gates", [])
-        for g in gates:
-            self.add_gate(
-                name=g.get("name"),
-                targets=g.get("targets", []),
-                controls=g.get("controls", []),
-                params=g.get("params", {}),
-            )
+        self.extend(data.get("gates", []))
         # load meta if present
         self.meta.update(data.get("meta", {}))
 
-    def to_qiskit(self) -> QuantumCircuit:
+    def ops(self, start: int = 0, stop: Optional[int] = None):
+        """
+        Iterate over the workflow as primitive operations.
+        Yields (name, qubits, params) tuples; see expand_gate for the layout.
+        start / stop restrict the iteration to gate rows [start, stop).
+        """
+        stop = self._size if stop is None else min(stop, self._size)
+        return self._ops(start, max(start, stop))
+
+    def _ops(self, start: int, stop: int, with_params: bool = True):
+        """ops() over rows [start, stop); params are None unless with_params."""
+        rows = slice(start, stop)
+        codes = self._opcode[rows].tolist()
+        n_targets = (self._targets[rows] >= 0).sum(axis=1).tolist()
+        n_controls = (self._controls[rows] >= 0).sum(axis=1).tolist()
+        first_target = self._targets[rows, 0].tolist()
+        first_control = self._controls[rows, 0].tolist()
+        thetas = self._theta[rows].tolist()
+        cx = (OPCODE_INDEX["CX"], OPCODE_INDEX["CNOT"])
+        multi = (OPCODE_INDEX["CCX"],) + cx
+        for k in range(stop - start):
+            i = start + k
+            code = codes[k]
+            params = self._params(i, thetas[k]) if with_params else None
+            # fast paths for the common single-target layouts
+            if n_targets[k] == 1 and n_controls[k] == 0 and code not in multi:
+                yield OPCODES[code], (first_target[k],), params
+            elif n_targets[k] == 1 and n_controls[k] == 1 and code in cx:
+                yield "CX", (first_control[k], first_target[k]), params
+            else:
+                name, targets, controls, row_params = self._row(i)
+                yield from expand(name, targets, controls, row_params if with_params else None)
+
+    def _record_stats(self, start: int, stop: int):
+        """Feed rows [start, stop) into the running stats."""
+        if self._stats_error is not None:
+            return
+        stats = self._stats
+        missing = self.num_qubits - len(stats.qubit_depth)
+        if missing > 0:
+            # num_qubits may be raised after construction (e.g. by the QASM reader)
+            stats.add_qubits(missing)
+            stats.add_clbits(missing)
+        try:
+            # add_gate records one row: skip the column slicing of _ops
+            ops = expand(*self._row(start)) if stop - start == 1 else self._ops(start, stop, with_params=False)
+            for name, qubits, _ in ops:
+                # to_qiskit measures qubit q into clbit q
+                stats.record(name.lower(), qubits, qubits if name == "MEASURE" else ())
+        except ValueError as e:
+            # malformed gates are accepted here and rejected on use, as before
+            self._stats_error = str(e)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Resource summary maintained incrementally, matching what Qiskit reports
+        for to_qiskit(): depth, width (qubits + clbits), gate_count (count_ops
+        order), plus num_ops (primitive operations) and two_qubit_gates.
+        Raises ValueError if a stored gate cannot be expanded.
+        """
+        if self._stats_error is not None:
+            raise ValueError(self._stats_error)
+        stats = self._stats
+        return {
+            "depth": stats.depth,
+            "width": 2 * self.num_qubits,
+            "gate_count": stats.gate_count(),
+            "num_ops": stats.num_ops,
+            "two_qubit_gates": stats.two_qubit_gates,
+        }
+
+    def measured_qubits(self) -> List[int]:
+        """Return the sorted qubit indices targeted by MEASURE gates."""
+        arrays = self.gate_arrays()
+        targets = arrays["targets"][arrays["opcode"] == OPCODE_INDEX["MEASURE"]]
+        return np.unique(targets[targets >= 0]).tolist()
+
+    def has_mid_circuit_measurement(self) -> bool:
+        """
+        True if any operation touches a qubit after it has been measured.
+        Workflows without mid-circuit measurement can have their counts sampled
+        from the final statevector.
+        """
+        measured = set()
+        for name, qubits, _ in self.ops():
+            if measured.intersection(qubits):
+                return True
+            if name == "MEASURE":
+                measured.update(qubits)
+        return False
+
+    def optimize(self) -> "QuantumWorkflow":
+        """
+        Return a peephole-optimized copy of this workflow (see optimizer.py).
+        The copy has one gate per primitive op; pass statistics (including the
+        number of gates removed) are stored in meta["optimization"].
+        """
+        ops, stats = peephole_optimize(self.ops(), self.num_qubits)
+        wf = QuantumWorkflow(self.num_qubits, meta=dict(self.meta))
+        wf.extend(op_to_gate(name, qubits, params) for name, qubits, params in ops)
+        wf.meta["optimization"] = stats
+        return wf
+
+    def to_qiskit(self) -> "QuantumCircuit":
         """
         Convert stored gates to an actual Qiskit QuantumCircuit.
         If measurement not present, this function does NOT automatically add measurements
         (caller decides).
         """
+        from qiskit import QuantumCircuit
         qc = QuantumCircuit(self.num_qubits, self.num_qubits)
-        for g in self.gates:
-            name = g["name"]
-            targets = g["targets"]
-            controls = g["controls"]
-            params = g["params"]
-
+        for name, targets, controls, params in self._rows():
             if name == "H":
                 for t in targets: qc.h(t)
             elif name == "X":
@@ -133,7 +459,7 @@ class QuantumWorkflow:
     def to_dict(self) -> Dict[str, Any]:
         return {
             "qubits": self.num_qubits,
-            "gates": self.gates,
+            "gates": list(self.gates),
             "meta": self.meta,
         }
 
@@ -148,4 +474,4 @@ class QuantumWorkflow:
         return wf
 
     def __repr__(self):
-        return f"<QuantumWorkflow qubits={self.num_qubits} gates={len(self.gates)}>"
+        return f"<QuantumWorkflow qubits={self.num_qubits} gates={self._size}>"
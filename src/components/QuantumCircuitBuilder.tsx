@@ -103,6 +103,41 @@ export const QuantumCircuitBuilder: React.FC = () => {
 };
 
 
+  // Poll a deferred AI analysis and merge it into the results once ready
+  const pollAnalysis = async (analysisId: string) => {
+    const fail = (description: string) => {
+      setResults((prev: any) =>
+        prev
+          ? { ...prev, analysis: { status: "error", summary: "AI analysis failed.", details: [description] } }
+          : prev
+      );
+      toast({
+        title: "AI analysis failed",
+        description,
+        variant: "destructive"
+      });
+    };
+
+    for (let attempt = 0; attempt < 60; attempt++) {
+      await new Promise((resolve) => setTimeout(resolve, 1000));
+      try {
+        const response = await fetch(`http://localhost:8000/analysis/${analysisId}`);
+        if (response.status === 202) continue;
+        if (response.status === 404) return fail("The analysis is no longer available");
+        if (!response.ok) {
+          const data = await response.json().catch(() => null);
+          return fail(data?.analysis?.details?.[0] ?? `Server returned ${response.status}`);
+        }
+        const data = await response.json();
+        setResults((prev: any) => (prev ? { ...prev, analysis: data.analysis } : prev));
+        return;
+      } catch (error) {
+        return fail("Could not reach the server");
+      }
+    }
+    fail("Timed out waiting for the analysis");
+  };
+
   const handleRunSimulation = async () => {
     if (circuitState.qubits.length === 0) {
       toast({
@@ -130,6 +165,9 @@ export const QuantumCircuitBuilder: React.FC = () => {
 
       setResults(data);
       setShowResults(true);
+      if (data.analysis?.status === "pending") {
+        pollAnalysis(data.analysis.id);
+      }
 
       toast({
         title: "Simulation complete",
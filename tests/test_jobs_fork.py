@@ -0,0 +1,41 @@
+# tests/test_jobs_fork.py
+"""
+- A /jobs child forked after /simulate used the kernel thread pool must not
+  reuse the inherited pool (it has no threads and every map() blocks).
+"""
+
+import os
+import time
+
+os.environ.setdefault("QVEDA_SIM_THREADS", "4")
+os.environ.setdefault("QVEDA_WARMUP", "off")
+os.environ.setdefault("QVEDA_ANALYSIS_BACKEND", "stub")
+os.environ.setdefault("QVEDA_JOB_TIMEOUT", "20")
+
+import app as qveda  # noqa: E402
+
+
+def rotation_circuit(qubits, angle):
+    gates = [{"name": "RY", "targets": [q], "params": {"theta": angle * (q + 1)}} for q in range(qubits)]
+    gates += [{"name": "CNOT", "controls": [q], "targets": [q + 1]} for q in range(qubits - 1)]
+    return {"qubits": qubits, "gates": gates, "shots": 100, "seed": 1,
+            "statevector": False, "analysis": "none"}
+
+
+def test_job_after_threaded_simulate():
+    assert qveda.SIMULATOR.numpy_engine.threads > 1
+    client = qveda.app.test_client()
+    response = client.post("/simulate", json=rotation_circuit(17, 0.1))
+    assert response.status_code == 200, response.get_json()
+    assert qveda.SIMULATOR.numpy_engine._pool is not None
+
+    # a different circuit, so the job cannot be served from the cache or a checkpoint
+    job = client.post("/jobs", json=rotation_circuit(17, 0.2)).get_json()
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        status = client.get(f"/jobs/{job['id']}").get_json()
+        if status["status"] not in ("queued", "running"):
+            break
+        time.sleep(0.2)
+    assert status["status"] == "succeeded", status
+    assert sum(status["result"]["counts"].values()) == 100
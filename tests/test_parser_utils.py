@@ -0,0 +1,63 @@
+# tests/test_parser_utils.py
+"""
+- QasmStreamReader depth matches QuantumCircuit.depth() with barriers.
+- Measures into a clbit other than the qubit's index are rejected.
+- QuantumParser.get_metadata() works after to_workflow().
+"""
+
+import random
+
+import pytest
+
+from quantum_core.parser_utils import QasmStreamReader, QasmSyntaxError, QuantumParser
+
+HEADER = 'OPENQASM 2.0;\ninclude "qelib1.inc";\n'
+
+
+def random_qasm(rng, qubits=5, statements=40):
+    lines = [HEADER, f"qreg q[{qubits}];", f"creg c[{qubits}];"]
+    for _ in range(statements):
+        kind = rng.choice(["h", "rz", "cx", "ccx", "barrier", "barrier_all", "measure"])
+        if kind == "barrier_all":
+            lines.append("barrier q;")
+        elif kind == "measure":
+            q = rng.randrange(qubits)
+            lines.append(f"measure q[{q}] -> c[{q}];")
+        else:
+            width = {"h": 1, "rz": 1, "cx": 2, "ccx": 3, "barrier": rng.randint(1, qubits)}[kind]
+            args = ", ".join(f"q[{q}]" for q in rng.sample(range(qubits), width))
+            name = "rz(0.3)" if kind == "rz" else kind
+            lines.append(f"{name} {args};")
+    return "\n".join(lines)
+
+
+def test_depth_matches_qiskit_with_barriers():
+    qasm2 = pytest.importorskip("qiskit.qasm2")
+    rng = random.Random(7)
+    for _ in range(50):
+        source = random_qasm(rng)
+        reader = QasmStreamReader(source.splitlines(True))
+        reader.read()
+        circuit = qasm2.loads(source)
+        assert reader.metadata["depth"] == circuit.depth(), source
+        assert dict(reader.metadata["gate_count"]) == dict(circuit.count_ops())
+
+
+def test_measure_into_other_clbit_is_rejected():
+    source = HEADER + "qreg q[2];\ncreg c[2];\nh q[0];\nmeasure q[0] -> c[1];\n"
+    with pytest.raises(QasmSyntaxError) as err:
+        QasmStreamReader(source.splitlines(True)).read()
+    assert err.value.line == 6
+
+    # clbits are global: a second creg does not line up with the qreg
+    source = HEADER + "qreg q[2];\ncreg a[1];\ncreg b[1];\nmeasure q -> b;\n"
+    with pytest.raises(QasmSyntaxError):
+        QasmStreamReader(source.splitlines(True)).read()
+
+
+def test_get_metadata_after_to_workflow():
+    parser = QuantumParser(HEADER + "qreg q[2];\ncreg c[2];\nh q[0];\ncx q[0], q[1];\nmeasure q -> c;\n")
+    with pytest.raises(RuntimeError):
+        parser.get_metadata()
+    parser.to_workflow()
+    assert parser.get_metadata()["depth"] == 3